@@ -1,7 +1,10 @@
 # cli/cli.py
 import os
-import importlib.util
+import ast
+import importlib
+import click
 import typer
+from typer.core import TyperGroup
 from pathlib import Path
 import logging
 
@@ -9,39 +12,92 @@ import logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-# Inciando o app do Typer
-app = typer.Typer(add_completion=False, help=True)
-
 # Caminho para a pasta de comandos
 _PROJECT_DIR = Path(__file__).parent
 commands_path = os.path.join(_PROJECT_DIR, "commands")
 
-def load_commands():
-    """Carrega automaticamente todos os comandos da pasta /commands"""
-    for file in os.listdir(commands_path):
-        try:
-            if file.endswith(".py") and file != "__init__.py":
-                module_name = file[:-3]  # Remove a extensão .py
-                file_path = os.path.join(commands_path, file)
 
-                try:
-                    spec = importlib.util.spec_from_file_location(module_name, file_path)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
+def _read_command_help(file_path: str) -> str:
+    """Lê a docstring da função run() de um comando sem importar o módulo."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=file_path)
+    except (OSError, SyntaxError):
+        return ""
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "run":
+            return ast.get_docstring(node) or ""
+    return ""
+
+
+def _load_command(module_name: str):
+    """Importa o módulo do comando e converte sua função run() em um comando do Typer."""
+    try:
+        module = importlib.import_module(f"robot.commands.{module_name}")
+
+        if not hasattr(module, "run"):
+            raise AttributeError(f"O módulo {module_name} não possui a função 'run()'.")
+
+        command_app = typer.Typer(add_completion=False)
+        command_app.command(name=module_name)(module.run)
+        return typer.main.get_command(command_app)
+
+    except Exception as e:
+        logger.error(f"Erro ao carregar o comando '{module_name}': {e}")
+        return None
+
+
+class LazyCommand(click.Command):
+    """
+    Representa um comando da pasta /commands sem importá-lo. O módulo (e suas
+    dependências pesadas) só é carregado quando o comando é de fato executado.
+    """
 
-                    if hasattr(module, "run"):
-                        app.command(name=module_name)(module.run)
-                    else:
-                        raise AttributeError(f"O módulo {module_name} não possui a função 'run()'.")
+    def __init__(self, name: str, file_path: str):
+        super().__init__(name=name, help=_read_command_help(file_path))
+        self._command = None
+
+    def load(self):
+        if self._command is None:
+            self._command = _load_command(self.name)
+            if self._command is None:
+                raise click.ClickException(f"Não foi possível carregar o comando '{self.name}'.")
+        return self._command
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        # Daqui em diante o click trabalha com o comando real
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+
+class LazyCommandGroup(TyperGroup):
+    """Grupo que registra automaticamente todos os comandos da pasta /commands."""
+
+    def _command_files(self):
+        return {
+            file[:-3]: os.path.join(commands_path, file)
+            for file in os.listdir(commands_path)
+            if file.endswith(".py") and file != "__init__.py"
+        }
+
+    def list_commands(self, ctx):
+        return sorted(self._command_files())
+
+    def get_command(self, ctx, cmd_name):
+        file_path = self._command_files().get(cmd_name)
+        if file_path is None:
+            return None
+        return LazyCommand(cmd_name, file_path)
+
+
+# Inciando o app do Typer
+app = typer.Typer(cls=LazyCommandGroup, add_completion=False)
 
-                except Exception as e:
-                    logger.error(f"Erro ao carregar o comando '{module_name}': {e}")
 
-        except:
-            print()
+@app.callback()
+def main():
+    """CLI para criar, compilar e enviar projetos MicroPython para o RP2040."""
 
-# Carrega e registra os comandos
-load_commands()
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
@@ -15,6 +15,9 @@ PROJECT_CONFIG_FILE = "project.yaml"
 BUILD_DIR = Path("build")
 LIBS_DIR = Path("libs")
 MAIN_FILE = Path("main.py")
+# Arquitetura do código nativo (@micropython.native/viper) gerado pelo mpy-cross
+# armv6m = RP2040. Pode ser alterada com a chave 'march' do project.yaml
+DEFAULT_MARCH = "armv6m"
 
 # --- Configuração da Biblioteca 'robot-kit' ---
 ROBOT_KIT_GITHUB_URL = "https://github.com/JordanoPaganini/robo-rp2-framework"
@@ -60,7 +63,7 @@ def _download_github_dir(owner: str, repo: str, repo_path: str, local_path: Path
         raise typer.Exit(code=1)
 
 
-def _compile_file(source_path: Path, output_dir: Path):
+def _compile_file(source_path: Path, output_dir: Path, march: str = DEFAULT_MARCH):
     if not source_path.exists():
         typer.secho(f"AVISO: Arquivo de origem '{source_path}' não encontrado. Pulando.", fg=typer.colors.YELLOW)
         return
@@ -69,7 +72,7 @@ def _compile_file(source_path: Path, output_dir: Path):
     output_path = (output_dir / relative_path).with_suffix(".mpy") if relative_path != "main.py" else (output_dir / "code").with_suffix(".mpy")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    command = ["mpy-cross", "-o", str(output_path), str(source_path)]
+    command = ["mpy-cross", f"-march={march}", "-o", str(output_path), str(source_path)]
     run_shell_command(command, f"Compilando {source_path}")
 
 
@@ -105,6 +108,7 @@ def run(
         config = yaml.safe_load(f)
 
     requirements = config.get("requirements", {})
+    march = config.get("march", DEFAULT_MARCH)
 
     # Baixar robot-kit se necessário
     if requirements.get("robotkit"):
@@ -146,7 +150,7 @@ def run(
 
     typer.echo("\nIniciando compilação dos arquivos...")
     for file in files_to_compile:
-        _compile_file(file, BUILD_DIR)
+        _compile_file(file, BUILD_DIR, march)
 
 
     # 6. Limpeza
@@ -0,0 +1,116 @@
+# cli/robot/commands/calibration.py
+import typer
+from pathlib import Path
+from typing_extensions import Annotated
+
+from robot.core import calibration, daemon, utils
+
+ACTIONS = ("pull", "push", "show")
+
+
+def _exec_on_device(code: str, com_port: str, description: str) -> str:
+    # Mesmo caminho do 'robot run': pelo daemon se estiver rodando, senão via mpremote
+    if daemon.is_running():
+        try:
+            result = daemon.call({"cmd": "run", "port": com_port, "code": code, "timeout": 10.0})
+        except daemon.DaemonError as e:
+            typer.secho(f"ERRO: {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        return result["output"]
+
+    target_port = com_port or utils.find_rp2040_port()
+    if not target_port:
+        typer.secho("ERRO: Nenhum dispositivo RP2040 encontrado.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    return utils.run_shell_command(["mpremote", "connect", target_port, "exec", code], description)
+
+
+def _pull(com_port: str) -> bytes | None:
+    output = _exec_on_device(calibration.pull_code(), com_port, "Lendo a calibração da placa")
+    try:
+        return calibration.parse_pull(output)
+    except ValueError as e:
+        typer.secho(f"ERRO: {e}:", fg=typer.colors.RED)
+        typer.secho(output, fg=typer.colors.YELLOW)
+        raise typer.Exit(code=1)
+
+
+def _decode_or_exit(blob: bytes, origin: str) -> dict:
+    try:
+        return calibration.decode(blob)
+    except ValueError as e:
+        typer.secho(f"ERRO: {origin}: {e}.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+def _show(entries: dict):
+    typer.secho(f"{len(entries)} calibração(ões) (versão {calibration.VERSION}):", bold=True)
+    for key, data in sorted(entries.items()):
+        typer.echo(f"   - {key:<16} {len(data):>3} bytes  {calibration.describe(key, data)}")
+
+
+def run(
+    action: Annotated[str, typer.Argument(
+        help="Ação: pull (placa -> arquivo), push (arquivo -> placa) ou show."
+    )],
+    file: Annotated[Path, typer.Argument(
+        help="Arquivo local de calibração. Padrão: calibration.bin. No show, sem arquivo lê da placa.",
+        dir_okay=False,
+    )] = None,
+    com_port: Annotated[str, typer.Option(
+        "--com",
+        help="Especifica a porta COM do RP2040 (ex: COM3 ou /dev/ttyACM0).",
+    )] = "",
+):
+    """
+    Copia o arquivo de calibração dos sensores (/calibration.bin) entre a placa e o computador.
+    """
+    action = action.lower()
+    if action not in ACTIONS:
+        typer.secho(f"ERRO: Ação '{action}' inválida. Use: {', '.join(ACTIONS)}.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    if action == "show":
+        if file is not None:
+            if not file.exists():
+                typer.secho(f"ERRO: Arquivo '{file}' não encontrado.", fg=typer.colors.RED)
+                raise typer.Exit(code=1)
+            _show(_decode_or_exit(file.read_bytes(), str(file)))
+            return
+        blob = _pull(com_port)
+        if blob is None:
+            typer.secho("A placa não tem calibração salva.", fg=typer.colors.YELLOW)
+            return
+        _show(_decode_or_exit(blob, "placa"))
+        return
+
+    file = file or Path("calibration.bin")
+
+    if action == "pull":
+        blob = _pull(com_port)
+        if blob is None:
+            typer.secho("A placa não tem calibração salva.", fg=typer.colors.YELLOW)
+            raise typer.Exit(code=1)
+        entries = _decode_or_exit(blob, "placa")
+        file.write_bytes(blob)
+        _show(entries)
+        typer.secho(f"\nCalibração salva em {file}.", fg=typer.colors.GREEN)
+        return
+
+    # push: valida antes de gravar, para não trocar uma calibração boa por um arquivo corrompido
+    if not file.exists():
+        typer.secho(f"ERRO: Arquivo '{file}' não encontrado.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    blob = file.read_bytes()
+    entries = _decode_or_exit(blob, str(file))
+    output = _exec_on_device(calibration.push_code(blob), com_port, f"Gravando {file} na placa")
+    if calibration.parse_output(output) != "OK":
+        typer.secho("ERRO: A placa não confirmou a gravação:", fg=typer.colors.RED)
+        typer.secho(output, fg=typer.colors.YELLOW)
+        raise typer.Exit(code=1)
+    _show(entries)
+    typer.secho("\nCalibração gravada. Reinicie a placa (robot reset) para os drivers a carregarem.", fg=typer.colors.GREEN)
+
+
+if __name__ == "__main__":
+    typer.run(run)
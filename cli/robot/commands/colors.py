@@ -0,0 +1,52 @@
+# cli/robot/commands/colors.py
+import typer
+from pathlib import Path
+from typing_extensions import Annotated
+
+from robot.core import colors
+
+
+def run(
+    samples_file: Annotated[Path, typer.Argument(
+        help="Arquivo com as amostras, uma por linha: rotulo,v1,v2,... (ex: verde,12,180,40,230).",
+        exists=True, dir_okay=False,
+    )],
+    output: Annotated[Path, typer.Option(
+        "--output", "-o",
+        help="Arquivo JSON gerado para o ColorClassifier. Padrão: colors.json."
+    )] = Path("colors.json"),
+    chroma: Annotated[bool, typer.Option(
+        "--chroma",
+        help="Usa as proporções de R, G e B (menos sensível à distância e à iluminação)."
+    )] = False,
+    margin: Annotated[float, typer.Option(
+        "--margin",
+        help="Multiplica a maior distância vista no treino para definir o limite de cor desconhecida. 0 desativa. Padrão: 1.5."
+    )] = 1.5,
+):
+    """
+    Calcula os centróides das cores a partir de amostras gravadas, para o ColorClassifier.
+    """
+    samples, skipped = colors.read_samples(samples_file)
+    if not samples:
+        typer.secho(f"ERRO: Nenhuma amostra válida em '{samples_file}'.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    if skipped:
+        typer.secho(f"AVISO: {skipped} linha(s) ignorada(s) fora do formato rotulo,v1,v2,...", fg=typer.colors.YELLOW)
+
+    model = colors.learn(samples, use_chroma=chroma, margin=margin)
+    colors.save_model(model, output)
+
+    typer.secho(f"\n{len(model['labels'])} cores aprendidas:", bold=True)
+    for label, centroid in zip(model["labels"], model["centroids"]):
+        typer.echo(f"   - {label:<12} {centroid}  ({len(samples[label])} amostras)")
+
+    correct, total = colors.evaluate(model, samples)
+    typer.echo(f"\nAcerto nas próprias amostras: {correct}/{total} ({100 * correct / total:.1f}%)")
+    if model["max_distance"] is not None:
+        typer.echo(f"Limite de cor desconhecida (max_distance): {model['max_distance']}")
+    typer.secho(f"\nModelo salvo em {output}. Copie-o para a placa e use ColorClassifier.load('{output.name}').", fg=typer.colors.GREEN)
+
+
+if __name__ == "__main__":
+    typer.run(run)
@@ -0,0 +1,93 @@
+# cli/robot/commands/daemon.py
+import subprocess
+import sys
+import time
+import typer
+from typing_extensions import Annotated
+
+from robot.core import daemon
+
+ACTIONS = ("start", "stop", "status")
+
+
+def _start_background(baudrate: int):
+    # Reinicia a própria CLI em segundo plano, desacoplada do terminal atual
+    command = [sys.executable, "-m", "robot.cli", "daemon", "start", "--foreground", "--baudrate", str(baudrate)]
+    subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if daemon.is_running():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def run(
+    action: Annotated[str, typer.Argument(
+        help="Ação: start, stop ou status."
+    )] = "status",
+    foreground: Annotated[bool, typer.Option(
+        "--foreground", "-f",
+        help="Executa o daemon no terminal atual em vez de em segundo plano."
+    )] = False,
+    baudrate: Annotated[int, typer.Option(
+        "--baudrate",
+        help="Taxa de transmissão serial (baudrate). Padrão: 115200."
+    )] = 115200,
+):
+    """
+    Gerencia o daemon que mantém a conexão com o RP2040 aberta entre comandos.
+    """
+    action = action.lower()
+    if action not in ACTIONS:
+        typer.secho(f"ERRO: Ação '{action}' inválida. Use: {', '.join(ACTIONS)}.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    if not daemon.is_supported():
+        typer.secho("ERRO: O daemon precisa de sockets Unix, indisponíveis neste sistema.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    running = daemon.is_running()
+
+    if action == "status":
+        if not running:
+            typer.secho("Daemon parado.", fg=typer.colors.YELLOW)
+            return
+        info = daemon.call({"cmd": "ping"})
+        typer.secho(f"Daemon rodando (PID {info['pid']}) em {daemon.SOCKET_PATH}", fg=typer.colors.GREEN)
+        for port in info["devices"]:
+            typer.echo(f"   - Conectado a {port}")
+        return
+
+    if action == "stop":
+        if not running:
+            typer.secho("Daemon já está parado.", fg=typer.colors.YELLOW)
+            return
+        daemon.call({"cmd": "shutdown"})
+        typer.secho("Daemon encerrado.", fg=typer.colors.GREEN)
+        return
+
+    if running:
+        typer.secho("Daemon já está rodando.", fg=typer.colors.YELLOW)
+        return
+
+    if foreground:
+        typer.secho(f"Daemon rodando em {daemon.SOCKET_PATH}. Pressione Ctrl+C para sair.", fg=typer.colors.CYAN)
+        daemon.serve(baudrate=baudrate)
+        return
+
+    if not _start_background(baudrate):
+        typer.secho("ERRO: O daemon não respondeu. Tente 'robot daemon start --foreground' para ver o erro.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    typer.secho(f"Daemon iniciado em {daemon.SOCKET_PATH}", fg=typer.colors.GREEN)
+
+
+if __name__ == "__main__":
+    run()
@@ -8,7 +8,7 @@ import time
 import textwrap
 
 # Importa as funções da pasta 'core' e o comando 'build'
-from robot.core import utils
+from robot.core import daemon, utils
 from robot.commands import build, monitor
 
 BUILD_DIR = Path("build")
@@ -67,6 +67,29 @@ def _clear_flash(port: str, baudrate: int) -> bool:
         #print(e) # For debug
         return False
 
+def _deploy_with_daemon(port: str, clear: bool) -> str:
+    """
+    Pede ao daemon para sincronizar a pasta 'build' com o RP2040 e reiniciá-lo.
+    Retorna a porta usada.
+    """
+    typer.secho("\nDaemon detectado. Enviando o deploy pela conexão já aberta...", fg=typer.colors.BRIGHT_BLACK)
+    try:
+        result = daemon.call({
+            "cmd": "deploy",
+            "port": port,
+            "root": str(BUILD_DIR.resolve()),
+            "clear": clear,
+        })
+    except daemon.DaemonError as e:
+        typer.secho(f"ERRO: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    for path in result["copied"]:
+        typer.echo(f"   - Copiado: {path}")
+    typer.secho(f"   OK! {len(result['copied'])} arquivo(s) copiado(s), {result['unchanged']} sem alteração ({result['port']}).", fg=typer.colors.GREEN)
+    return result["port"]
+
+
 def run(
     com_port: Annotated[str, typer.Option(
         "--com", 
@@ -105,18 +128,26 @@ def run(
             typer.secho("O processo de build falhou. Deploy abortado.", fg=typer.colors.RED)
             raise typer.Exit(code=1)
 
-    # 2. Verifica se a ferramenta mpremote está instalada
-    if not shutil.which("mpremote"):
-        typer.secho("ERRO: 'mpremote' não foi encontrado no seu sistema.", fg=typer.colors.RED)
-        typer.echo("Instale com: pip install mpremote")
-        raise typer.Exit(code=1)
-
-    # 3. Verifica se a pasta 'build' existe
+    # 2. Verifica se a pasta 'build' existe
     if not BUILD_DIR.exists() or not any(BUILD_DIR.iterdir()):
         typer.secho(f"ERRO: A pasta '{BUILD_DIR}' está vazia ou não existe.", fg=typer.colors.RED)
         typer.echo("Execute o comando 'build' primeiro ou use a opção -b / --build.")
         raise typer.Exit(code=1)
 
+    # 3. Se o daemon estiver rodando, ele já tem a conexão aberta e copia só o que mudou
+    if daemon.is_running():
+        target_port = _deploy_with_daemon(com_port, clear_rp)
+        typer.secho("\nDeploy concluído com sucesso!", bold=True, fg=typer.colors.BRIGHT_GREEN)
+        if monitor_after:
+            monitor.run(target_port)
+        return
+
+    # Verifica se a ferramenta mpremote está instalada
+    if not shutil.which("mpremote"):
+        typer.secho("ERRO: 'mpremote' não foi encontrado no seu sistema.", fg=typer.colors.RED)
+        typer.echo("Instale com: pip install mpremote")
+        raise typer.Exit(code=1)
+
     # 4. Determina a porta COM
     target_port = com_port
     if not target_port:
@@ -144,7 +175,7 @@ def run(
     copy_command = ["mpremote", "connect", target_port, "cp", "-r", f"{BUILD_DIR}/.", ":"]
     utils.run_shell_command(copy_command, "Copiando arquivos")
 
-    # 6. Faz um soft-reset para que o novo código seja executado
+    # 6. Reinicia a placa (hard-reset, o mesmo do daemon) para que o novo código seja executado
     reset_command = ["mpremote", "connect", target_port, "reset"]
     utils.run_shell_command(reset_command, "Reiniciando o dispositivo")
 
@@ -1,52 +1,77 @@
+import hashlib
 import requests
-from bs4 import BeautifulSoup
 import shutil
 import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import psutil
 from tqdm import tqdm
-import platform
-
-def find_and_select_rp2040_drive():
-    """
-    Verifica as unidades de armazenamento conectadas e permite ao usuário
-    selecionar a que corresponde ao RP2040 em modo BOOTSEL.
-    Retorna o caminho de montagem da unidade selecionada ou None.
-    """
-    possible_drives = []
-    
-    # psutil.disk_partitions() lista todas as partições montadas.
-    partitions = psutil.disk_partitions()
-    for p in partitions:
-        # Tenta identificar unidades removíveis de forma genérica.
-        # A unidade RPI-RP2 geralmente é FAT/VFAT e pequena.
-        is_removable = 'removable' in p.opts or (platform.system() == 'Windows' and 'fixed' not in p.opts)
-        is_fat = 'fat' in p.fstype.lower()
-
-        if is_removable and is_fat:
-             try:
-                 usage = psutil.disk_usage(p.mountpoint)
-                 # A unidade do RP2040 tem cerca de 128MB. Filtramos por um tamanho
-                 # um pouco maior para garantir a detecção.
-                 if usage.total < 256 * 1024 * 1024:
-                    possible_drives.append(p)
-             except (PermissionError, FileNotFoundError):
-                 # Algumas unidades podem gerar erro ao acessar, então as ignoramos.
-                 continue
-
-    if not possible_drives:
+import typer
+from typing_extensions import Annotated
+
+from robot.core import firmware
+
+# Arquivo que o bootloader UF2 expõe na raiz da unidade BOOTSEL
+UF2_INFO_FILE = "INFO_UF2.TXT"
+# Board-ID informado pelo bootloader do RP2040
+RP2040_BOARD_ID = "RPI-RP2"
+# Tamanho padrão de cada bloco lido durante o download
+DEFAULT_CHUNK_SIZE = 256 * 1024  # 256 KB
+
+_session = None
+
+
+def read_uf2_info(mountpoint):
+    """
+    Lê o arquivo INFO_UF2.TXT de uma unidade e retorna seus campos como dicionário
+    (ex: {'Model': 'Raspberry Pi RP2', 'Board-ID': 'RPI-RP2'}).
+    Retorna None se a unidade não for um bootloader UF2.
+    """
+    info_path = os.path.join(mountpoint, UF2_INFO_FILE)
+    try:
+        with open(info_path, "r", encoding="utf-8", errors="ignore") as f:
+            lines = f.read().splitlines()
+    except OSError:
         return None
 
-    # Se apenas uma unidade candidata for encontrada, pede confirmação.
-    if len(possible_drives) == 1:
-        drive = possible_drives[0]
-        usage = psutil.disk_usage(drive.mountpoint)
-        size_mb = usage.total / (1024 * 1024)
-        print(f"\nDispositivo encontrado: {drive.mountpoint} ({size_mb:.0f}MB)")
+    info = {}
+    for line in lines:
+        key, sep, value = line.partition(":")
+        if sep:
+            info[key.strip()] = value.strip()
+        elif line.strip():
+            # A primeira linha (ex: "UF2 Bootloader v3.0") não tem chave
+            info.setdefault("Bootloader", line.strip())
+    return info
+
+
+def find_rp2040_drives():
+    """
+    Retorna a lista de pontos de montagem das unidades RP2040 em modo BOOTSEL.
+    A identificação é feita pelo Board-ID do arquivo INFO_UF2.TXT.
+    """
+    drives = []
+    for p in psutil.disk_partitions():
+        info = read_uf2_info(p.mountpoint)
+        if info and info.get("Board-ID", "").startswith(RP2040_BOARD_ID):
+            drives.append(p.mountpoint)
+    return sorted(drives)
+
+
+def select_rp2040_drive(drives):
+    """
+    Pede ao usuário para confirmar ou escolher uma das unidades encontradas.
+    Retorna o caminho de montagem selecionado, None para aguardar outra unidade
+    ou "exit" para cancelar.
+    """
+    # Se apenas uma unidade for encontrada, pede confirmação.
+    if len(drives) == 1:
+        print(f"\nDispositivo encontrado: {drives[0]}")
         try:
-            confirm = input("-> Este é o seu RP2040 (RPI-RP2)? (s/n): ").lower().strip()
+            confirm = input("-> Gravar o firmware neste RP2040 (RPI-RP2)? (s/n): ").lower().strip()
             if confirm == 's':
-                return drive.mountpoint
+                return drives[0]
         except KeyboardInterrupt:
             print("\nOperação cancelada.")
             return "exit"
@@ -54,19 +79,17 @@ def find_and_select_rp2040_drive():
 
     # Se múltiplas unidades forem encontradas, pede para o usuário escolher.
     print("\n[AVISO] Múltiplos dispositivos encontrados. Por favor, selecione o seu RP2040:")
-    for i, p in enumerate(possible_drives):
-        usage = psutil.disk_usage(p.mountpoint)
-        size_mb = usage.total / (1024 * 1024)
-        print(f"  [{i+1}] {p.mountpoint} ({p.device}) - Tamanho: {size_mb:.0f} MB")
+    for i, mountpoint in enumerate(drives):
+        print(f"  [{i+1}] {mountpoint}")
 
     while True:
         try:
-            choice_str = input(f"-> Digite o número (1-{len(possible_drives)}) ou 'c' para cancelar: ").strip().lower()
+            choice_str = input(f"-> Digite o número (1-{len(drives)}) ou 'c' para cancelar: ").strip().lower()
             if choice_str == 'c':
                  return "exit"
             choice = int(choice_str)
-            if 1 <= choice <= len(possible_drives):
-                return possible_drives[choice - 1].mountpoint
+            if 1 <= choice <= len(drives):
+                return drives[choice - 1]
             else:
                 print("   Seleção inválida. Tente novamente.")
         except ValueError:
@@ -76,78 +99,280 @@ def find_and_select_rp2040_drive():
             return "exit"
 
 
-def download_file_with_progress(url, filename):
+class BootselWatcher(threading.Thread):
+    """
+    Observa as unidades BOOTSEL em uma única thread e acorda quem estiver
+    aguardando (novos dispositivos ou ejeção) assim que o conjunto de unidades muda.
+
+    As unidades são consultadas periodicamente: o psutil não avisa quando uma unidade
+    é montada, e os avisos do sistema (udev, WM_DEVICECHANGE, DiskArbitration) exigiriam
+    uma dependência e um código diferente por sistema. Enquanto nada muda, o intervalo
+    cresce de 'interval' até 'max_interval'; uma mudança ou uma nova espera volta ao mínimo.
+    """
+
+    def __init__(self, interval: float = 0.2, max_interval: float = 1.0):
+        super().__init__(daemon=True)
+        self._min_interval = interval
+        self._max_interval = max_interval
+        self._interval = interval
+        self._changed = threading.Condition()
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()
+        self._drives = frozenset(find_rp2040_drives())
+
+    @property
+    def drives(self):
+        with self._changed:
+            return sorted(self._drives)
+
+    def run(self):
+        while True:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            if self._stop_event.is_set():
+                return
+            drives = frozenset(find_rp2040_drives())
+            with self._changed:
+                if drives != self._drives:
+                    self._drives = drives
+                    self._interval = self._min_interval
+                    self._changed.notify_all()
+                else:
+                    self._interval = min(self._interval * 1.5, self._max_interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake.set()
+
+    def _wait_for(self, predicate, timeout):
+        # Espera em fatias curtas para que o Ctrl+C continue funcionando no Windows
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            if not predicate():
+                # Alguém começou a esperar: consulta já e volta ao intervalo mínimo
+                self._interval = self._min_interval
+                self._wake.set()
+            while not predicate():
+                remaining = 0.5 if deadline is None else min(0.5, deadline - time.monotonic())
+                if remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+            return True
+
+    def wait_for_drives(self, settle: float = 1.0, timeout: float = None):
+        """
+        Aguarda até existir ao menos uma unidade BOOTSEL e retorna todas as que
+        aparecerem dentro da janela 'settle' (placas conectadas ao mesmo tempo).
+        """
+        if not self._wait_for(lambda: self._drives, timeout):
+            return []
+        time.sleep(settle)
+        return self.drives
+
+    def wait_for_change(self, drives, timeout: float = None) -> bool:
+        """Aguarda o conjunto de unidades ficar diferente de 'drives'."""
+        drives = frozenset(drives)
+        return self._wait_for(lambda: self._drives != drives, timeout)
+
+    def wait_for_eject(self, mountpoint, timeout: float = None) -> bool:
+        """Aguarda a unidade sumir (reinício após a gravação). Retorna False em caso de timeout."""
+        return self._wait_for(lambda: mountpoint not in self._drives, timeout)
+
+
+def flash_drive(firmware_filename, mountpoint, watcher: BootselWatcher, eject_timeout: float = 30.0) -> bool:
+    """
+    Copia o firmware para uma unidade BOOTSEL e aguarda o dispositivo reiniciar.
+    """
+    try:
+        destination_file = os.path.join(mountpoint, os.path.basename(firmware_filename))
+        shutil.copy(firmware_filename, destination_file)
+    except Exception as e:
+        # A unidade pode ejetar antes do fim da cópia, o que não é um erro
+        if not watcher.wait_for_eject(mountpoint, timeout=2):
+            print(f"\n[ERRO] Falha ao copiar o arquivo para '{mountpoint}': {e}")
+            return False
+        return True
+
+    # A cópia faz o dispositivo ejetar e reiniciar automaticamente.
+    if not watcher.wait_for_eject(mountpoint, timeout=eject_timeout):
+        print(f"\n[ERRO] O dispositivo em '{mountpoint}' não reiniciou após a cópia.")
+        return False
+    return True
+
+
+def get_session():
+    """
+    Retorna a sessão HTTP compartilhada pelo comando, reaproveitando as conexões
+    (página de downloads e firmware vêm do mesmo servidor).
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=3)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+def _content_range_total(response):
+    # Extrai o tamanho total de "Content-Range: bytes 0-99/1234" (ou "bytes */1234")
+    content_range = response.headers.get('content-range', '')
+    total = content_range.rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+
+def _resume_validator(response):
+    """
+    Identificador da versão do arquivo no servidor, usado no If-Range: o ETag forte ou,
+    na falta dele, o Last-Modified. Retorna None se o servidor não informar nenhum.
+    """
+    etag = response.headers.get('etag', '')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('last-modified')
+
+
+def _discard_partial(part_filename):
+    for path in (part_filename, part_filename + ".meta"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def download_file_with_progress(url, filename, chunk_size=DEFAULT_CHUNK_SIZE, expected_size=None, expected_sha256=None):
     """
     Faz o download de um arquivo a partir de uma URL, exibindo uma barra de progresso.
+    O conteúdo é gravado em '<filename>.part' e, se o download for interrompido, a próxima
+    chamada retoma de onde parou (HTTP Range), desde que o arquivo no servidor ainda seja
+    o mesmo (ETag/Last-Modified guardado em '<filename>.part.meta'). O arquivo só é
+    renomeado para 'filename' depois de conferir o tamanho, o formato UF2 (para .uf2)
+    e, se informado, o SHA-256.
     """
+    part_filename = filename + ".part"
+    meta_filename = part_filename + ".meta"
+    offset = os.path.getsize(part_filename) if os.path.exists(part_filename) else 0
+    validator = None
+    if offset:
+        try:
+            with open(meta_filename, "r", encoding="utf-8") as f:
+                validator = f.read().strip() or None
+        except OSError:
+            pass
+        if validator is None:
+            # Parcial sem a versão de origem: não há como saber se ainda vale
+            _discard_partial(part_filename)
+            offset = 0
+    # Com If-Range, o servidor só manda o restante se o arquivo não mudou; senão manda tudo (200)
+    headers = {'Range': f"bytes={offset}-", 'If-Range': validator} if offset else {}
+
     try:
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 1024  # 1 KB
-
-        with tqdm(total=total_size, unit='iB', unit_scale=True, desc=f"Baixando {os.path.basename(filename)}") as progress_bar:
-            with open(filename, 'wb') as file:
-                for data in response.iter_content(block_size):
-                    progress_bar.update(len(data))
-                    file.write(data)
-
-        if total_size != 0 and progress_bar.n != total_size:
-            print("\n[ERRO] O download pode ter sido interrompido.")
+        with get_session().get(url, stream=True, timeout=30, headers=headers) as response:
+            current = _resume_validator(response)
+            if offset and response.status_code in (206, 416) and current is not None and current != validator:
+                # O servidor ignorou o If-Range, mas o arquivo mudou desde o download parcial
+                print("O arquivo mudou no servidor. Recomeçando o download.")
+                _discard_partial(part_filename)
+                return download_file_with_progress(url, filename, chunk_size, expected_size, expected_sha256)
+
+            if response.status_code == 416:
+                # O servidor não tem mais bytes a partir de 'offset'
+                if _content_range_total(response) != offset:
+                    _discard_partial(part_filename)
+                    return download_file_with_progress(url, filename, chunk_size, expected_size, expected_sha256)
+                total_size = offset
+            else:
+                response.raise_for_status()
+                if response.status_code == 206:
+                    total_size = _content_range_total(response) or offset + int(response.headers.get('content-length', 0))
+                    print(f"Retomando download a partir de {offset / 1024:.0f} KB.")
+                else:
+                    # O servidor ignorou o Range (ou o arquivo mudou): recomeça do zero
+                    offset = 0
+                    total_size = int(response.headers.get('content-length', 0))
+                    if current is None:
+                        if os.path.exists(meta_filename):
+                            os.remove(meta_filename)
+                    else:
+                        with open(meta_filename, "w", encoding="utf-8") as f:
+                            f.write(current)
+
+                with tqdm(total=total_size or None, initial=offset, unit='iB', unit_scale=True, mininterval=0.5,
+                          desc=f"Baixando {os.path.basename(filename)}") as progress_bar:
+                    with open(part_filename, 'ab' if offset else 'wb') as file:
+                        for data in response.iter_content(chunk_size):
+                            file.write(data)
+                            progress_bar.update(len(data))
+
+        # Confere a integridade do arquivo
+        downloaded = os.path.getsize(part_filename)
+        if total_size and downloaded != total_size:
+            print("\n[ERRO] O download foi interrompido. Execute o comando novamente para retomar.")
+            return False
+        if expected_size is not None and downloaded != expected_size:
+            print(f"\n[ERRO] Tamanho inesperado: {downloaded} bytes (esperado {expected_size}).")
+            _discard_partial(part_filename)
             return False
-        
+        if filename.lower().endswith(".uf2"):
+            problem = firmware.check_uf2(part_filename)
+            if problem:
+                print(f"\n[ERRO] O arquivo baixado não é um firmware UF2 válido para o RP2040: {problem}.")
+                _discard_partial(part_filename)
+                return False
+        if expected_sha256 is not None:
+            sha256 = hashlib.sha256()
+            with open(part_filename, 'rb') as file:
+                for data in iter(lambda: file.read(chunk_size), b''):
+                    sha256.update(data)
+            if sha256.hexdigest().lower() != expected_sha256.lower():
+                print("\n[ERRO] O SHA-256 do arquivo baixado não confere.")
+                _discard_partial(part_filename)
+                return False
+
+        os.replace(part_filename, filename)
+        if os.path.exists(meta_filename):
+            os.remove(meta_filename)
         print("Download concluído com sucesso.")
         return True
     except requests.exceptions.RequestException as e:
         print(f"\n[ERRO] Falha no download: {e}")
+        print("Execute o comando novamente para retomar o download.")
         return False
     except Exception as e:
         print(f"\n[ERRO] Ocorreu um erro ao salvar o arquivo: {e}")
         return False
 
-def run():
+def run(
+    yes: Annotated[bool, typer.Option(
+        "--yes", "-y",
+        help="Não pede confirmação: grava o firmware no RP2040 identificado automaticamente."
+    )] = False,
+    flash_all: Annotated[bool, typer.Option(
+        "--all", "-a",
+        help="Grava em paralelo todos os RP2040 em modo BOOTSEL conectados ao mesmo tempo (implica --yes)."
+    )] = False,
+    chunk_size: Annotated[int, typer.Option(
+        "--chunk-size",
+        help="Tamanho do bloco de download em KB. Padrão: 256."
+    )] = DEFAULT_CHUNK_SIZE // 1024,
+    list_versions: Annotated[bool, typer.Option(
+        "--list", "-l",
+        help="Lista as versões de firmware disponíveis e sai."
+    )] = False,
+    version: Annotated[str, typer.Option(
+        "--version",
+        help="Instala uma versão específica (ex: v1.25.0). Padrão: a estável mais recente."
+    )] = None,
+    refresh: Annotated[bool, typer.Option(
+        "--refresh",
+        help="Ignora a lista de versões em cache e consulta o site novamente."
+    )] = False,
+):
     """
     Executa o processo completo de instalação do MicroPython no RP2040.
     """
-    BASE_URL = "https://micropython.org"
-    DOWNLOAD_PAGE_URL = f"{BASE_URL}/download/RPI_PICO/"
-    firmware_url = None
-    firmware_filename = None
-    link_tag = None
-
-    # 1. Encontrar a URL do firmware mais recente
+    # 1. Encontrar o firmware (índice de versões em cache, atualizado periodicamente)
     try:
-        print("🔎 Procurando a última versão estável do MicroPython...")
-        page = requests.get(DOWNLOAD_PAGE_URL, timeout=10)
-        page.raise_for_status()
-        soup = BeautifulSoup(page.content, "html.parser")
-
-        # --- LÓGICA DE BUSCA ATUALIZADA ---
-        # A nova página usa uma tag <span> com classes específicas para marcar a versão estável.
-        stable_tag = soup.find('span', class_='is-success', string='stable')
-
-        if stable_tag:
-            # Navega da tag 'stable' até o link de download correspondente.
-            firmware_div = stable_tag.find_parent('div', class_='firmware')
-            if firmware_div:
-                link_tag = firmware_div.find('a', href=lambda href: href and href.endswith('.uf2'))
-        
-        if not link_tag:
-            # Fallback: se a lógica acima falhar, tenta pegar o primeiro link que não seja "preview".
-            all_links = soup.find_all('a', href=lambda href: href and href.endswith('.uf2'))
-            for link in all_links:
-                if 'preview' not in link['href'].lower():
-                    link_tag = link
-                    break # Pega o primeiro que encontrar
-        
-        if not link_tag:
-            print("[ERRO] Não foi possível encontrar o link de download do firmware na página.")
-            return
-
-        firmware_url = BASE_URL + link_tag['href']
-        firmware_filename = os.path.basename(link_tag['href'])
-        print(f"✔️ Versão encontrada: {firmware_filename}")
-
+        print("🔎 Procurando as versões do MicroPython...")
+        releases, offline = firmware.load_index(get_session(), refresh=refresh)
     except requests.exceptions.RequestException as e:
         print(f"[ERRO] Falha ao acessar a página de downloads: {e}")
         return
@@ -155,10 +380,38 @@ def run():
         print(f"[ERRO] Ocorreu um erro inesperado ao analisar a página: {e}")
         return
 
+    if offline:
+        print("[AVISO] Sem acesso à página de downloads. Usando a última lista de versões salva.")
+
+    if not releases:
+        print("[ERRO] Não foi possível encontrar o link de download do firmware na página.")
+        return
+
+    if list_versions:
+        print(f"\nVersões disponíveis ({len(releases)}):")
+        latest = firmware.find_release(releases)
+        for release in releases:
+            tag = " (preview)" if release["preview"] else ""
+            if release is latest:
+                tag = " (estável mais recente)"
+            print(f"  {release['version']:<32} {release['date']}{tag}")
+        return
+
+    release = firmware.find_release(releases, version)
+    if not release:
+        if version:
+            print(f"[ERRO] Versão '{version}' não encontrada. Use --list para ver as versões disponíveis.")
+        else:
+            print("[ERRO] Nenhuma versão estável encontrada. Use --version para escolher uma versão.")
+        return
+
+    firmware_url = release["url"]
+    firmware_filename = release["filename"]
+    print(f"✔️ Versão encontrada: {firmware_filename}")
+
     # 2. Baixar o arquivo de firmware
-    if not download_file_with_progress(firmware_url, firmware_filename):
-        if os.path.exists(firmware_filename):
-            os.remove(firmware_filename) # Limpa arquivo incompleto
+    # (o arquivo parcial é mantido para que a próxima execução retome o download)
+    if not download_file_with_progress(firmware_url, firmware_filename, chunk_size=chunk_size * 1024):
         return
 
     # 3. Instruir o usuário e aguardar o dispositivo
@@ -170,41 +423,54 @@ def run():
     print("O dispositivo deve aparecer como um pen drive chamado 'RPI-RP2'.")
     print("\n⏳ Aguardando o dispositivo em modo BOOTSEL...")
 
-    target_path = None
-    while not target_path:
-        target_path = find_and_select_rp2040_drive()
-        if target_path == "exit":
-            if os.path.exists(firmware_filename):
-                os.remove(firmware_filename)
-            return
-        if not target_path:
-            time.sleep(1)
-            print(".", end="", flush=True)
-
-    print(f"\n✔️ Dispositivo selecionado: {target_path}")
+    interactive = not (yes or flash_all)
+    watcher = BootselWatcher()
+    watcher.start()
 
-    # 4. Copiar o firmware para o dispositivo
     try:
-        print(f"⚙️ Copiando '{firmware_filename}' para o dispositivo...")
-        destination_file = os.path.join(target_path, firmware_filename)
-        shutil.copy(firmware_filename, destination_file)
-        print("✨ Firmware copiado com sucesso!")
-        print("Aguardando o dispositivo reiniciar...")
-        
-        # A cópia faz o dispositivo ejetar e reiniciar automaticamente.
-        # Esperamos a unidade desaparecer para confirmar.
-        time.sleep(2) # Dá um tempo para o processo de ejeção iniciar
-        while os.path.exists(target_path):
-            time.sleep(0.5)
+        target_paths = []
+        while not target_paths:
+            drives = watcher.wait_for_drives()
+            if not interactive:
+                if len(drives) > 1 and not flash_all:
+                    print(f"\n[ERRO] {len(drives)} dispositivos encontrados. Use --all para gravar todos.")
+                    return
+                target_paths = drives
+                continue
 
-    except Exception as e:
-        print(f"\n[ERRO] Falha ao copiar o arquivo para o dispositivo: {e}")
-        print("Por favor, verifique se o dispositivo está conectado corretamente e tente novamente.")
+            selected = select_rp2040_drive(drives)
+            if selected == "exit":
+                return
+            if selected:
+                target_paths = [selected]
+            else:
+                # Só pergunta de novo quando as unidades conectadas mudarem
+                print("\n⏳ Aguardando outro dispositivo em modo BOOTSEL...")
+                watcher.wait_for_change(drives)
+
+        print(f"\n✔️ Dispositivo(s) selecionado(s): {', '.join(target_paths)}")
+
+        # 4. Copiar o firmware para os dispositivos (em paralelo se houver mais de um)
+        print(f"⚙️ Copiando '{firmware_filename}' para {len(target_paths)} dispositivo(s)...")
+        with ThreadPoolExecutor(max_workers=len(target_paths)) as pool:
+            results = list(pool.map(lambda path: flash_drive(firmware_filename, path, watcher), target_paths))
+
+        failed = [path for path, ok in zip(target_paths, results) if not ok]
+        if failed:
+            print(f"\n[ERRO] Falha ao gravar em: {', '.join(failed)}")
+            print("Por favor, verifique se o dispositivo está conectado corretamente e tente novamente.")
+            return
+        print("✨ Firmware gravado com sucesso!")
+
+    except KeyboardInterrupt:
+        print("\nOperação cancelada.")
+        return
     finally:
+        watcher.stop()
         # 5. Limpar o arquivo baixado
         if os.path.exists(firmware_filename):
             os.remove(firmware_filename)
-    
+
     print("\n🎉 Instalação concluída! Seu RP2040 está pronto com o MicroPython.")
 
 
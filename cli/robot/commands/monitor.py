@@ -5,12 +5,44 @@ from typing_extensions import Annotated
 import os
 
 # # Importa as funções da pasta 'core'
-from robot.core import utils
+from robot.core import daemon, utils
 
 def _showInfo(target_port: str):
     typer.secho(f"Monitor serial - RP2040 ({target_port})...", fg=typer.colors.CYAN)
     typer.secho(f"Pressione Ctrl+C para sair.\n", fg=typer.colors.BRIGHT_BLUE)
 
+def _handle_line(decoded: str, target_port: str) -> bool:
+    """Mostra uma linha recebida. Retorna True se a linha indicar que o dispositivo foi resetado."""
+    if decoded.startswith("#") and ":" in decoded:
+        _, code = decoded.split(":")
+        if code.strip() == "100":
+            # Dispositivo resetado pelo botão: reconecta silenciosamente
+            os.system('cls')
+            _showInfo(target_port)
+            return True
+    else:
+        print(decoded)
+    return False
+
+def _monitor_with_daemon(com_port: str):
+    try:
+        messages = daemon.stream({"cmd": "monitor", "port": com_port or ""})
+        target_port = next(messages)["port"]
+        _showInfo(target_port)
+
+        pending = ""
+        for message in messages:
+            pending += message["data"]
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                _handle_line(line.strip(), target_port)
+
+    except daemon.DaemonError as e:
+        typer.secho(f"ERRO: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        typer.secho("\nMonitor serial encerrado pelo usuário.", fg=typer.colors.YELLOW)
+
 def run(
     com_port: Annotated[str, typer.Option(
         "--com",
@@ -26,6 +58,12 @@ def run(
     """
     os.system('cls')
 
+    # Com o daemon rodando a porta já está aberta por ele: a saída é lida através dele
+    # (vários monitores podem acompanhar o mesmo dispositivo ao mesmo tempo)
+    if daemon.is_running():
+        _monitor_with_daemon(com_port)
+        return
+
     # Detecta automaticamente a porta COM, se necessário
     target_port = com_port or utils.find_rp2040_port()
     if not target_port:
@@ -43,16 +81,9 @@ def run(
                         if not line:
                             continue
                         decoded = line.decode(errors="ignore").strip()
-                        
-                        if decoded.startswith("#") and ":" in decoded:
-                            _, code = decoded.split(":")
-                            if code.strip() == "100":
-                                # Dispositivo resetado pelo botão: reconecta silenciosamente
-                                os.system('cls')
-                                _showInfo(target_port)
-                                break
-                        else:
-                            print(decoded)
+
+                        if _handle_line(decoded, target_port):
+                            break
 
             except serial.SerialException:
                 # Aguarda o dispositivo reconectar (por exemplo, após reset)
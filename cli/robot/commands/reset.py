@@ -0,0 +1,35 @@
+# cli/robot/commands/reset.py
+import typer
+from typing_extensions import Annotated
+
+from robot.core import daemon, utils
+
+
+def run(
+    com_port: Annotated[str, typer.Option(
+        "--com",
+        help="Especifica a porta COM do RP2040 (ex: COM3 ou /dev/ttyACM0).",
+    )] = "",
+):
+    """
+    Reinicia o RP2040, executando novamente o main.py.
+    """
+    if daemon.is_running():
+        try:
+            result = daemon.call({"cmd": "reset", "port": com_port})
+        except daemon.DaemonError as e:
+            typer.secho(f"ERRO: {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        typer.secho(f"Dispositivo em {result['port']} reiniciado.", fg=typer.colors.GREEN)
+        return
+
+    target_port = com_port or utils.find_rp2040_port()
+    if not target_port:
+        typer.secho("ERRO: Nenhum dispositivo RP2040 encontrado.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    utils.run_shell_command(["mpremote", "connect", target_port, "reset"], "Reiniciando o dispositivo")
+
+
+if __name__ == "__main__":
+    run()
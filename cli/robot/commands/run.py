@@ -0,0 +1,45 @@
+# cli/robot/commands/run.py
+import typer
+from pathlib import Path
+from typing_extensions import Annotated
+
+from robot.core import daemon, utils
+
+
+def run(
+    script: Annotated[Path, typer.Argument(
+        help="Script .py a ser executado no RP2040.",
+        exists=True, dir_okay=False,
+    )],
+    com_port: Annotated[str, typer.Option(
+        "--com",
+        help="Especifica a porta COM do RP2040 (ex: COM3 ou /dev/ttyACM0).",
+    )] = "",
+    timeout: Annotated[float, typer.Option(
+        "--timeout",
+        help="Tempo máximo de execução em segundos (apenas com o daemon). Padrão: 10."
+    )] = 10.0,
+):
+    """
+    Executa um script no RP2040 sem gravá-lo na memória.
+    """
+    if daemon.is_running():
+        try:
+            result = daemon.call({"cmd": "run", "port": com_port, "code": script.read_text(encoding="utf-8"), "timeout": timeout})
+        except daemon.DaemonError as e:
+            typer.secho(f"ERRO: {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        typer.echo(result["output"], nl=False)
+        return
+
+    target_port = com_port or utils.find_rp2040_port()
+    if not target_port:
+        typer.secho("ERRO: Nenhum dispositivo RP2040 encontrado.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    output = utils.run_shell_command(["mpremote", "connect", target_port, "run", str(script)], f"Executando {script}")
+    typer.echo(output, nl=False)
+
+
+if __name__ == "__main__":
+    typer.run(run)
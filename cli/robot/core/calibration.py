@@ -0,0 +1,88 @@
+# cli/robot/core/calibration.py
+import binascii
+import struct
+import zlib
+
+# Mesmo formato do robotkit Calibration/calibration.py
+DEVICE_FILE = "/calibration.bin"
+MAGIC = b"RKCL"
+VERSION = 1
+
+# Prefixo das linhas trocadas com a placa, para separá-las de outras mensagens
+_MARKER = "RKCL:"
+
+
+def decode(blob: bytes) -> dict:
+    """Converte o conteúdo do arquivo em {chave: bytes}. Levanta ValueError se for inválido."""
+    if len(blob) < 10 or blob[:4] != MAGIC:
+        raise ValueError("arquivo de calibração inválido")
+    if blob[4] != VERSION:
+        raise ValueError(f"versão de calibração não suportada: {blob[4]}")
+    if zlib.crc32(blob[:-4]) != struct.unpack("<I", blob[-4:])[0]:
+        raise ValueError("CRC da calibração não confere")
+
+    entries = {}
+    pos = 6
+    for _ in range(blob[5]):
+        key_len = blob[pos]
+        key = blob[pos + 1:pos + 1 + key_len].decode("utf-8")
+        pos += 1 + key_len
+        data_len = struct.unpack("<H", blob[pos:pos + 2])[0]
+        entries[key] = blob[pos + 2:pos + 2 + data_len]
+        pos += 2 + data_len
+    if pos != len(blob) - 4:
+        raise ValueError("arquivo de calibração inválido")
+    return entries
+
+
+def describe(key: str, data: bytes) -> str:
+    """Resumo legível dos formatos conhecidos (GY33 e VL53L0X); senão, os bytes em hexa."""
+    if len(data) == 16:
+        values = struct.unpack("<8H", data)
+        pairs = ", ".join(f"{name}={values[2 * i]}..{values[2 * i + 1]}" for i, name in enumerate("RGBC"))
+        return f"GY33 preto..branco: {pairs}"
+    if len(data) == 9 and data[0] == 1:
+        return f"VL53L0X mapa SPAD={data[1:7].hex()} VHV={data[7]} fase={data[8]}"
+    return data.hex()
+
+
+def pull_code() -> str:
+    """Código executado na placa para imprimir o arquivo de calibração em hexa."""
+    return (
+        "import binascii\n"
+        "try:\n"
+        f"    f = open({DEVICE_FILE!r}, 'rb')\n"
+        f"    print({_MARKER!r} + binascii.hexlify(f.read()).decode())\n"
+        "    f.close()\n"
+        "except OSError:\n"
+        f"    print({_MARKER!r})\n"
+    )
+
+
+def push_code(blob: bytes) -> str:
+    """Código executado na placa para gravar 'blob' (via arquivo temporário, como a robotkit)."""
+    return (
+        "import binascii, os\n"
+        f"f = open({DEVICE_FILE + '.tmp'!r}, 'wb')\n"
+        f"f.write(binascii.unhexlify({blob.hex()!r}))\n"
+        "f.close()\n"
+        f"os.rename({DEVICE_FILE + '.tmp'!r}, {DEVICE_FILE!r})\n"
+        f"print({_MARKER!r} + 'OK')\n"
+    )
+
+
+def parse_output(output: str) -> str | None:
+    """Conteúdo depois do marcador na saída da placa, ou None se não houver."""
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith(_MARKER):
+            return line[len(_MARKER):]
+    return None
+
+
+def parse_pull(output: str) -> bytes | None:
+    """Bytes do arquivo lido da placa, ou None se a placa não tiver calibração."""
+    payload = parse_output(output)
+    if payload is None:
+        raise ValueError("resposta inesperada da placa")
+    return binascii.unhexlify(payload) if payload else None
@@ -0,0 +1,86 @@
+# cli/robot/core/colors.py
+import csv
+import json
+from pathlib import Path
+
+
+def chroma(values: list[int]) -> list[int]:
+    """Mesma conversão do chroma_into() da robotkit: R, G e B em proporções de 0 a 255."""
+    total = max(1, sum(values[:3]))
+    return [value * 255 // total for value in values[:3]] + list(values[3:])
+
+
+def distance(a: list[int], b: list[int]) -> int:
+    return sum(abs(x - y) for x, y in zip(a, b))
+
+
+def read_samples(path: Path) -> tuple[dict, int]:
+    """
+    Lê amostras no formato 'rotulo,v1,v2,...' (uma por linha). Linhas vazias, comentários
+    e linhas que não seguem o formato (ex.: outras mensagens do monitor) são ignoradas.
+    Retorna ({rotulo: [valores, ...]}, quantidade_de_linhas_ignoradas).
+    """
+    samples = {}
+    skipped = 0
+    channels = None
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0].strip().startswith("#"):
+                continue
+            try:
+                label = row[0].strip()
+                values = [int(float(value)) for value in row[1:]]
+            except ValueError:
+                skipped += 1
+                continue
+            if not label or not values or (channels is not None and len(values) != channels):
+                skipped += 1
+                continue
+            channels = len(values)
+            samples.setdefault(label, []).append(values)
+    return samples, skipped
+
+
+def learn(samples: dict, use_chroma: bool = False, margin: float = 1.5) -> dict:
+    """
+    Calcula o centróide (média inteira) de cada rótulo. O max_distance é a maior distância
+    de uma amostra ao próprio centróide, multiplicada por 'margin' (0 desativa o limite).
+    """
+    labels = sorted(samples)
+    features = {
+        label: [chroma(values) if use_chroma else values for values in samples[label]]
+        for label in labels
+    }
+    centroids = []
+    for label in labels:
+        points = features[label]
+        centroids.append([round(sum(column) / len(points)) for column in zip(*points)])
+
+    spread = max(
+        distance(point, centroid)
+        for label, centroid in zip(labels, centroids)
+        for point in features[label]
+    )
+    return {
+        "labels": labels,
+        "centroids": centroids,
+        "chroma": use_chroma,
+        "max_distance": int(spread * margin) if margin > 0 else None,
+    }
+
+
+def evaluate(model: dict, samples: dict) -> tuple[int, int]:
+    """Retorna (acertos, total) classificando as próprias amostras com o modelo."""
+    correct = total = 0
+    for label, points in samples.items():
+        for values in points:
+            point = chroma(values) if model["chroma"] else values
+            best = min(range(len(model["labels"])), key=lambda i: distance(point, model["centroids"][i]))
+            correct += model["labels"][best] == label
+            total += 1
+    return correct, total
+
+
+def save_model(model: dict, path: Path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(model, f, indent=2)
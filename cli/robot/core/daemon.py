@@ -0,0 +1,191 @@
+# cli/robot/core/daemon.py
+import json
+import os
+import queue
+import select
+import socket
+import socketserver
+import threading
+import logging
+
+from robot.core import utils
+from robot.core.device import Device, DeviceError
+
+logger = logging.getLogger(__name__)
+
+# Socket local em que o daemon atende os comandos da CLI
+SOCKET_PATH = utils.CACHE_DIR / "robotd.sock"
+
+
+class DaemonError(Exception):
+    """Erro retornado pelo daemon (ou falha ao falar com ele)."""
+
+
+def is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX") and hasattr(socketserver, "UnixStreamServer")
+
+
+# --- Cliente ---
+
+def _connect(socket_path=SOCKET_PATH, timeout: float = None) -> socket.socket:
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(str(socket_path))
+    except OSError:
+        client.close()
+        raise
+    return client
+
+
+def is_running(socket_path=SOCKET_PATH) -> bool:
+    """Retorna True se houver um daemon atendendo no socket."""
+    if not is_supported() or not os.path.exists(socket_path):
+        return False
+    try:
+        _connect(socket_path, timeout=0.5).close()
+        return True
+    except OSError:
+        return False
+
+
+def stream(payload: dict, socket_path=SOCKET_PATH):
+    """Envia um pedido ao daemon e gera cada mensagem da resposta."""
+    try:
+        client = _connect(socket_path)
+    except OSError as e:
+        raise DaemonError(f"Não foi possível conectar ao daemon: {e}")
+
+    with client, client.makefile("rb") as reader:
+        client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        for line in reader:
+            message = json.loads(line)
+            if "error" in message:
+                raise DaemonError(message["error"])
+            yield message
+
+
+def call(payload: dict, socket_path=SOCKET_PATH) -> dict:
+    """Envia um pedido ao daemon e retorna a resposta."""
+    for message in stream(payload, socket_path):
+        return message
+    raise DaemonError("O daemon encerrou a conexão sem responder.")
+
+
+# --- Servidor ---
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Atende um pedido (uma linha JSON) e responde com uma ou mais linhas JSON."""
+
+    def _send(self, **message):
+        self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def _client_closed(self) -> bool:
+        readable, _, _ = select.select([self.request], [], [], 0)
+        return bool(readable) and not self.request.recv(1, socket.MSG_PEEK)
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # Conexão aberta apenas para verificar se o daemon está rodando
+            return
+        try:
+            request = json.loads(line)
+            handler = getattr(self, "do_" + request.get("cmd", ""), None)
+            if handler is None:
+                raise DaemonError(f"Pedido desconhecido: {request.get('cmd')!r}")
+            handler(request)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except (DaemonError, DeviceError, KeyError, ValueError, OSError) as e:
+            self._send(error=str(e))
+
+    def do_ping(self, request):
+        self._send(ok=True, pid=os.getpid(), devices=sorted(self.server.devices))
+
+    def do_deploy(self, request):
+        device = self.server.get_device(request.get("port"))
+        if request.get("clear"):
+            device.clear()
+        copied, unchanged = device.sync_dir(request["root"])
+        if request.get("reset", True):
+            device.reset()
+        self._send(ok=True, port=device.port, copied=copied, unchanged=unchanged)
+
+    def do_run(self, request):
+        device = self.server.get_device(request.get("port"))
+        output = device.exec(request["code"], timeout=request.get("timeout", 10))
+        self._send(ok=True, port=device.port, output=output)
+
+    def do_reset(self, request):
+        device = self.server.get_device(request.get("port"))
+        device.reset()
+        self._send(ok=True, port=device.port)
+
+    def do_monitor(self, request):
+        device = self.server.get_device(request.get("port"))
+        subscriber = device.subscribe()
+        try:
+            self._send(ok=True, port=device.port)
+            while not self._client_closed():
+                try:
+                    data = subscriber.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                self._send(data=data.decode("utf-8", errors="ignore"))
+        finally:
+            device.unsubscribe(subscriber)
+
+    def do_shutdown(self, request):
+        self._send(ok=True)
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+if is_supported():
+    class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Servidor que mantém as conexões com os RP2040 abertas entre chamadas da CLI."""
+
+        daemon_threads = True
+
+        def __init__(self, socket_path=SOCKET_PATH, baudrate: int = 115200):
+            self.socket_path = socket_path
+            self.baudrate = baudrate
+            self.devices = {}
+            self._devices_lock = threading.Lock()
+
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            if os.path.exists(socket_path):
+                # Socket que sobrou de um daemon que não foi encerrado corretamente
+                os.remove(socket_path)
+            super().__init__(str(socket_path), _RequestHandler)
+
+        def get_device(self, port: str = None) -> Device:
+            port = port or utils.find_rp2040_port()
+            if not port:
+                raise DaemonError("Nenhum dispositivo RP2040 encontrado.")
+            with self._devices_lock:
+                if port not in self.devices:
+                    try:
+                        self.devices[port] = Device(port, self.baudrate)
+                    except Exception as e:
+                        raise DaemonError(f"Não foi possível abrir a porta {port}: {e}")
+                    logger.info(f"Conectado ao RP2040 em {port}")
+                return self.devices[port]
+
+        def server_close(self):
+            super().server_close()
+            for device in self.devices.values():
+                device.close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+
+def serve(socket_path=SOCKET_PATH, baudrate: int = 115200):
+    """Executa o daemon em primeiro plano até receber um pedido de 'shutdown'."""
+    with DaemonServer(socket_path, baudrate) as server:
+        logger.info(f"Daemon aguardando comandos em {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
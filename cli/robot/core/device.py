@@ -0,0 +1,270 @@
+# cli/robot/core/device.py
+import ast
+import binascii
+import hashlib
+import queue
+import textwrap
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+import serial
+
+# Tamanho dos blocos enviados ao REPL (o RP2040 perde bytes se receber rápido demais)
+_WRITE_CHUNK = 256
+# Bytes de arquivo enviados por execução no raw REPL: cada bloco é compilado na placa
+# separadamente, então o tamanho do arquivo não pesa na memória do RP2040
+_FILE_CHUNK = 1024
+
+_HASH_SCRIPT = textwrap.dedent("""
+    import hashlib, binascii
+    def _hash(path):
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            return None
+        h = hashlib.sha256()
+        while True:
+            data = f.read(512)
+            if not data:
+                break
+            h.update(data)
+        f.close()
+        return binascii.hexlify(h.digest()).decode()
+    print(repr({p: _hash(p) for p in %r}))
+""")
+
+_CLEAR_SCRIPT = textwrap.dedent("""
+    import os
+    def _delete_all(path):
+        for name in os.listdir(path):
+            full_path = path.rstrip('/') + '/' + name
+            if os.stat(full_path)[0] & 0x4000:
+                _delete_all(full_path)
+                os.rmdir(full_path)
+            else:
+                os.remove(full_path)
+    _delete_all('/')
+""")
+
+
+class DeviceError(Exception):
+    """Erro ao se comunicar com o RP2040."""
+
+
+class Device:
+    """
+    Mantém uma conexão serial aberta com um RP2040. Uma thread lê continuamente a
+    saída da placa e a repassa aos inscritos (monitores); comandos no raw REPL
+    (exec, deploy, reset) capturam a saída enquanto estão em andamento.
+    """
+
+    def __init__(self, port: str, baudrate: int = 115200):
+        self.port = port
+        self.baudrate = baudrate
+
+        # Reentrante: sync_dir() segura a placa durante toda a cópia e chama exec()
+        self._lock = threading.RLock()
+        self._data = threading.Condition()
+        self._buffer = bytearray()
+        self._capturing = False
+        self._subscribers = set()
+        self._closed = False
+
+        self._serial = serial.Serial(port, baudrate=baudrate, timeout=0.1)
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    # --- Leitura contínua e monitores ---
+
+    def _read_loop(self):
+        while not self._closed:
+            try:
+                data = self._serial.read(self._serial.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError):
+                self._reconnect()
+                continue
+            if not data:
+                continue
+
+            with self._data:
+                if self._capturing:
+                    self._buffer += data
+                    self._data.notify_all()
+                    continue
+            for subscriber in list(self._subscribers):
+                subscriber.put(data)
+
+    def _reconnect(self):
+        # A placa foi resetada ou desconectada: tenta reabrir a porta
+        try:
+            self._serial.close()
+        except Exception:
+            pass
+        while not self._closed:
+            time.sleep(0.5)
+            try:
+                self._serial = serial.Serial(self.port, baudrate=self.baudrate, timeout=0.1)
+                return
+            except serial.SerialException:
+                continue
+
+    def subscribe(self) -> queue.Queue:
+        """Retorna uma fila que recebe (em bytes) toda a saída da placa."""
+        subscriber = queue.Queue()
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        self._subscribers.discard(subscriber)
+
+    def close(self):
+        self._closed = True
+        self._serial.close()
+
+    # --- Raw REPL ---
+
+    def _write(self, data: bytes):
+        for i in range(0, len(data), _WRITE_CHUNK):
+            self._serial.write(data[i:i + _WRITE_CHUNK])
+            time.sleep(0.01)
+
+    def _read_until(self, ending: bytes, timeout: float) -> bytes:
+        deadline = time.monotonic() + timeout
+        with self._data:
+            while True:
+                index = self._buffer.find(ending)
+                if index >= 0:
+                    data = bytes(self._buffer[:index])
+                    del self._buffer[:index + len(ending)]
+                    return data
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeviceError(f"Tempo esgotado aguardando resposta do RP2040 em {self.port}.")
+                self._data.wait(remaining)
+
+    def _set_capturing(self, value: bool):
+        with self._data:
+            self._capturing = value
+            self._buffer.clear()
+
+    @contextmanager
+    def _raw_repl(self, timeout: float):
+        """Interrompe o programa atual e mantém a placa no raw REPL durante o bloco."""
+        with self._lock:
+            self._set_capturing(True)
+            try:
+                self._serial.write(b"\r\x03\x03")  # CTRL-C para interromper execução atual
+                time.sleep(0.1)
+                self._set_capturing(True)
+                self._serial.write(b"\r\x01")      # CTRL-A para entrar no raw REPL
+                self._read_until(b"raw REPL; CTRL-B to exit\r\n>", timeout)
+                try:
+                    yield
+                finally:
+                    self._serial.write(b"\x02")    # CTRL-B volta ao REPL normal
+            except serial.SerialException as e:
+                raise DeviceError(f"Falha na comunicação com {self.port}: {e}")
+            finally:
+                self._set_capturing(False)
+
+    def _exec_raw(self, code: str, timeout: float) -> str:
+        # Executa 'code' com a placa já no raw REPL (as variáveis globais continuam lá)
+        self._write(code.encode("utf-8"))
+        self._serial.write(b"\x04")        # CTRL-D executa o código
+        self._read_until(b"OK", timeout)
+        output = self._read_until(b"\x04", timeout)
+        error = self._read_until(b"\x04", timeout)
+        self._read_until(b">", timeout)
+        if error:
+            raise DeviceError(error.decode("utf-8", errors="ignore").strip())
+        return output.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+
+    def exec(self, code: str, timeout: float = 10.0) -> str:
+        """
+        Interrompe o programa atual, executa 'code' no raw REPL e retorna a saída.
+        Um erro no código é lançado como DeviceError com o traceback da placa.
+        """
+        with self._raw_repl(timeout):
+            return self._exec_raw(code, timeout)
+
+    def reset(self):
+        """
+        Faz um hard-reset (machine.reset()), como o 'mpremote reset': a placa reinicia
+        do zero e executa o boot.py e o main.py. A porta cai e a thread de leitura reconecta.
+        """
+        with self._lock:
+            try:
+                self._serial.write(b"\r\x03\x03")  # Sai de qualquer programa em execução
+                time.sleep(0.1)
+                self._serial.write(b"import machine; machine.reset()\r")
+            except serial.SerialException as e:
+                raise DeviceError(f"Falha na comunicação com {self.port}: {e}")
+
+    # --- Arquivos ---
+
+    def _remote_hashes(self, paths: list) -> dict:
+        output = self.exec(_HASH_SCRIPT % (paths,), timeout=30)
+        return ast.literal_eval(output.strip())
+
+    def clear(self):
+        """Apaga todos os arquivos e pastas da placa."""
+        self.exec(_CLEAR_SCRIPT, timeout=30)
+
+    def put_file(self, remote_path: str, data: bytes):
+        # O arquivo fica aberto em uma global do raw REPL e cada bloco é uma execução
+        # própria: a placa nunca precisa compilar o arquivo inteiro de uma vez
+        with self._raw_repl(timeout=30):
+            self._exec_raw(f"import binascii\nf = open({remote_path!r}, 'wb')\nw = f.write\nd = binascii.a2b_base64", 30)
+            try:
+                for i in range(0, len(data), _FILE_CHUNK):
+                    chunk = binascii.b2a_base64(data[i:i + _FILE_CHUNK], newline=False)
+                    self._exec_raw(f"w(d({chunk!r}))", 30)
+            finally:
+                self._exec_raw("f.close()", 30)
+
+    def sync_dir(self, local_dir: Path):
+        """
+        Copia o conteúdo de 'local_dir' para a raiz da placa, pulando os arquivos
+        cujo hash na placa é igual ao local. Retorna (copiados, quantidade_sem_alteracao).
+        """
+        local_dir = Path(local_dir)
+        # Segura a placa do início ao fim: outro deploy não pode intercalar entre a
+        # leitura dos hashes e a cópia
+        with self._lock:
+            return self._sync_dir(local_dir)
+
+    def _sync_dir(self, local_dir: Path):
+        files = {
+            "/" + path.relative_to(local_dir).as_posix(): path.read_bytes()
+            for path in sorted(local_dir.rglob("*")) if path.is_file()
+        }
+
+        # Os hashes são sempre calculados na placa: o programa, o 'robot calibration push'
+        # ou o mpremote podem ter mudado arquivos desde o último deploy
+        remote = self._remote_hashes(list(files)) if files else {}
+        changed = [
+            path for path, data in files.items()
+            if remote.get(path) != hashlib.sha256(data).hexdigest()
+        ]
+
+        folders = sorted({str(Path(path).parent.as_posix()) for path in changed} - {"/"})
+        if folders:
+            self.exec("\n".join(
+                f"try:\n    __import__('os').mkdir({folder!r})\nexcept OSError:\n    pass"
+                for folder in _with_parents(folders)
+            ))
+
+        for path in changed:
+            self.put_file(path, files[path])
+        return changed, len(files) - len(changed)
+
+
+def _with_parents(folders: list) -> list:
+    # '/a/b' precisa que '/a' seja criada antes
+    result = set()
+    for folder in folders:
+        parts = folder.strip("/").split("/")
+        for i in range(1, len(parts) + 1):
+            result.add("/" + "/".join(parts[:i]))
+    return sorted(result, key=lambda folder: folder.count("/"))
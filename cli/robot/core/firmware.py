@@ -0,0 +1,139 @@
+# cli/robot/core/firmware.py
+import json
+import os
+import re
+import struct
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+import requests
+from bs4 import BeautifulSoup
+
+from robot.core.utils import CACHE_DIR
+
+BASE_URL = "https://micropython.org"
+DOWNLOAD_PAGE_URL = f"{BASE_URL}/download/RPI_PICO/"
+
+# Índice de versões salvo em disco para evitar baixar e analisar a página a cada install
+INDEX_CACHE_FILE = CACHE_DIR / "firmware_index.json"
+INDEX_TTL = 6 * 60 * 60  # 6 horas
+
+# Ex: RPI_PICO-20250415-v1.25.0.uf2 ou RPI_PICO-20250809-v1.26.0-preview.20.g1a2b3c.uf2
+_FIRMWARE_NAME_RE = re.compile(r"-(\d{4})(\d{2})(\d{2})-(v\d+(?:\.\d+)*(?:-[\w.]+)?)\.uf2$")
+
+# Formato UF2: blocos de 512 bytes com números mágicos no início e no fim
+UF2_BLOCK_SIZE = 512
+_UF2_MAGIC_START0 = 0x0A324655
+_UF2_MAGIC_START1 = 0x9E5D5157
+_UF2_MAGIC_END = 0x0AB16F30
+_UF2_FLAG_FAMILY_ID = 0x00002000
+RP2040_FAMILY_ID = 0xE48BFF56
+
+
+def parse_index(html: str, base_url: str = BASE_URL) -> list[dict]:
+    """
+    Extrai da página de downloads a lista de firmwares .uf2, da mais recente para a mais antiga.
+    Cada item contém 'version', 'filename', 'url', 'date' (AAAA-MM-DD) e 'preview'.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    releases = {}
+    for link in soup.find_all('a', href=lambda href: href and href.endswith('.uf2')):
+        url = urljoin(base_url, link['href'])
+        filename = os.path.basename(link['href'])
+        match = _FIRMWARE_NAME_RE.search(filename)
+        if not match or url in releases:
+            continue
+        year, month, day, version = match.groups()
+        releases[url] = {
+            "version": version,
+            "filename": filename,
+            "url": url,
+            "date": f"{year}-{month}-{day}",
+            "preview": "preview" in version.lower(),
+        }
+    return sorted(releases.values(), key=lambda r: (r["date"], r["version"]), reverse=True)
+
+
+def fetch_index(session, url: str = DOWNLOAD_PAGE_URL) -> list[dict]:
+    """Baixa a página de downloads e retorna o índice de firmwares."""
+    page = session.get(url, timeout=10)
+    page.raise_for_status()
+    return parse_index(page.text, url)
+
+
+def _read_cache(cache_file: Path):
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_file: Path, releases: list[dict]):
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"fetched_at": time.time(), "releases": releases}, f, indent=2)
+    os.replace(tmp_file, cache_file)
+
+
+def load_index(session, ttl: float = INDEX_TTL, refresh: bool = False, cache_file: Path = INDEX_CACHE_FILE):
+    """
+    Retorna (releases, offline). Usa o índice em cache enquanto ele tiver menos de 'ttl'
+    segundos; caso contrário, baixa a página de novo. Se o site não puder ser acessado,
+    retorna o último índice salvo com offline=True. Sem cache, o erro de rede é propagado.
+    """
+    cached = _read_cache(cache_file)
+    if cached and not refresh and time.time() - cached.get("fetched_at", 0) < ttl:
+        return cached["releases"], False
+
+    try:
+        releases = fetch_index(session)
+    except requests.exceptions.RequestException:
+        if cached:
+            return cached["releases"], True
+        raise
+
+    if releases:
+        try:
+            _write_cache(cache_file, releases)
+        except OSError:
+            pass  # Sem permissão para salvar o cache: segue sem ele
+    return releases, False
+
+
+def find_release(releases: list[dict], version: str = None):
+    """
+    Retorna o firmware da versão pedida (com ou sem o 'v' inicial) ou, se nenhuma
+    for informada, a versão estável mais recente. Retorna None se não encontrar.
+    """
+    if version is None:
+        return next((r for r in releases if not r["preview"]), None)
+
+    version = version if version.startswith("v") else f"v{version}"
+    return next((r for r in releases if r["version"] == version), None)
+
+
+def check_uf2(path: str, family_id: int = RP2040_FAMILY_ID) -> str | None:
+    """
+    Confere se o arquivo é um UF2 completo para a família pedida (RP2040 por padrão):
+    todos os blocos com os números mágicos, o family ID e a numeração 0..N-1.
+    Retorna a descrição do problema, ou None se o arquivo estiver íntegro.
+    """
+    size = os.path.getsize(path)
+    if size == 0 or size % UF2_BLOCK_SIZE:
+        return f"tamanho de {size} bytes não é múltiplo de {UF2_BLOCK_SIZE}"
+
+    total = size // UF2_BLOCK_SIZE
+    with open(path, "rb") as f:
+        for index in range(total):
+            block = f.read(UF2_BLOCK_SIZE)
+            start0, start1, flags, _, _, block_no, num_blocks, family = struct.unpack_from("<8I", block)
+            end = struct.unpack_from("<I", block, UF2_BLOCK_SIZE - 4)[0]
+            if (start0, start1, end) != (_UF2_MAGIC_START0, _UF2_MAGIC_START1, _UF2_MAGIC_END):
+                return f"bloco {index} não é um bloco UF2"
+            if not flags & _UF2_FLAG_FAMILY_ID or family != family_id:
+                return f"bloco {index} é de outra família (0x{family:08x})"
+            if block_no != index or num_blocks != total:
+                return f"bloco {index} fora de ordem ({block_no} de {num_blocks})"
+    return None
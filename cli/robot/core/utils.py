@@ -2,10 +2,14 @@
 import serial.tools.list_ports
 import subprocess
 import typer
+from pathlib import Path
 
 RP2040_VID = 0x2E8A
 RP2040_PID = 0x0005
 
+# Pasta onde a CLI guarda dados entre execuções (índice de firmwares, socket do daemon...)
+CACHE_DIR = Path.home() / ".cache" / "robot"
+
 def find_rp2040_port():
     """
     Varre as portas seriais disponíveis e retorna a porta correspondente a um RP2040.
@@ -0,0 +1,41 @@
+# cli/scripts/check_startup.py
+# Confere que 'robot --help' continua rápido: listar os comandos não pode importar os
+# módulos dos comandos nem as dependências pesadas deles.
+# Execute a partir da pasta cli/: python scripts/check_startup.py
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Dependências que só os comandos usam (nome do módulo importado)
+HEAVY_MODULES = ("requests", "bs4", "serial", "psutil", "tqdm", "yaml", "mpremote")
+
+
+def main():
+    start = time.perf_counter()
+    import typer
+    from robot import cli
+
+    group = typer.main.get_command(cli.app)
+    help_text = io.StringIO()
+    with contextlib.redirect_stdout(help_text):
+        group.main(["--help"], prog_name="robot", standalone_mode=False)
+    elapsed = time.perf_counter() - start
+
+    missing = [name for name in group.list_commands(None) if name not in help_text.getvalue()]
+    assert not missing, f"Comandos ausentes da ajuda: {', '.join(missing)}"
+
+    loaded = sorted(
+        {name for name in sys.modules if name.startswith("robot.commands.")}
+        | {name.split(".")[0] for name in sys.modules if name.split(".")[0] in HEAVY_MODULES}
+    )
+    assert not loaded, f"Módulos importados só para listar os comandos: {', '.join(loaded)}"
+
+    print(f"OK: {len(group.list_commands(None))} comandos listados em {elapsed * 1000:.0f} ms sem importar nenhum deles.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# examples/benchmark_encoder.py
+# Mede o custo de cada leitura do encoder (tempo e memória alocada) no RP2040.
+# Copie para a placa junto com a robotkit e execute com: robot run examples/benchmark_encoder.py
+import gc
+import time
+from robotkit.Motor.motor import _Encoder
+
+ENC_A_PIN = 2
+ENC_B_PIN = 3
+READS = 1000
+
+
+def legacy_read(encoder):
+    # Leitura antiga: 5 sm.get() bloqueantes e correção de sinal com inteiros grandes
+    counts = encoder.sm.get()
+    counts = encoder.sm.get()
+    counts = encoder.sm.get()
+    counts = encoder.sm.get()
+    counts = encoder.sm.get()
+    if(counts > 2**31):
+        counts -= 2**32
+    return counts
+
+
+def measure(name, read, encoder):
+    gc.collect()
+    alloc_before = gc.mem_alloc()
+    start = time.ticks_us()
+    for _ in range(READS):
+        read(encoder)
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    allocated = gc.mem_alloc() - alloc_before
+    print("{}: {} us/leitura, {} bytes alocados/leitura".format(name, elapsed / READS, allocated / READS))
+
+
+encoder = _Encoder(0, ENC_A_PIN, ENC_B_PIN)
+measure("sm.get() x5", legacy_read, encoder)
+measure("get_position_counts", _Encoder.get_position_counts, encoder)
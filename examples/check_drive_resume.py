@@ -0,0 +1,60 @@
+# examples/check_drive_resume.py
+# Confere que as rodas do DifferentialDrive voltam a ser controladas depois de pararem
+# (stop() ou velocidade 0). Use com o robô suspenso: os motores giram por alguns instantes.
+# Copie para a placa junto com a robotkit e execute com: robot run examples/check_drive_resume.py
+import time
+from robotkit.Motor.motor import Motor, EncodedMotor, DifferentialDrive, ControlScheduler
+
+LEFT_PWM_PINS = (6, 7)
+RIGHT_PWM_PINS = (8, 9)
+LEFT_ENC_PINS = (2, 3)
+RIGHT_ENC_PINS = (4, 5)
+TICKS = 5
+
+# Escalonador próprio e parado: os ticks são chamados aqui, um a um
+scheduler = ControlScheduler()
+left = EncodedMotor(Motor(*LEFT_PWM_PINS), None, *LEFT_ENC_PINS, scheduler=scheduler)
+right = EncodedMotor(Motor(*RIGHT_PWM_PINS, flip_dir=True), None, *RIGHT_ENC_PINS, scheduler=scheduler)
+drive = DifferentialDrive(left, right, wheel_diameter=0.065, track_width=0.15, scheduler=scheduler)
+scheduler.stop()
+
+
+def run_ticks():
+    for _ in range(TICKS):
+        time.sleep_ms(1000 // scheduler.rate_hz)   # Período real: o PID divide pelo tempo
+        scheduler._tick(None)
+
+
+def check_driven(step):
+    for name, wheel in (("esquerda", left), ("direita", right)):
+        assert wheel.target_speed is not None, "{}: roda {} sem velocidade alvo".format(step, name)
+        assert any(task[0] is wheel._update_callback for task in scheduler._tasks), \
+            "{}: roda {} fora do escalonador".format(step, name)
+        motor = wheel._motor
+        assert (motor._duty_fwd, motor._duty_rev) not in ((0, 0), (motor._MAX_PWM, motor._MAX_PWM)), \
+            "{}: roda {} não está sendo acionada".format(step, name)
+
+
+try:
+    drive.set_velocity(0.2, 0)
+    run_ticks()
+    check_driven("primeiro set_velocity")
+
+    drive.stop()
+    run_ticks()
+    for wheel in (left, right):
+        assert wheel.target_speed is None
+
+    drive.set_velocity(0.2, 0)
+    run_ticks()
+    check_driven("set_velocity depois do stop")
+
+    # Parada com set_velocity(0, 0) e volta a andar para frente
+    drive.set_velocity(0, 0)
+    run_ticks()
+    drive.set_velocity(0.2, 0)
+    run_ticks()
+    check_driven("set_velocity depois de set_velocity(0, 0)")
+    print("OK: as duas rodas voltam a ser acionadas depois de parar.")
+finally:
+    drive.stop()
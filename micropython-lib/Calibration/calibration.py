@@ -0,0 +1,94 @@
+import binascii
+import os
+import struct
+
+# Arquivo único com as calibrações de todos os sensores da placa.
+# Formato (little-endian):
+#   b"RKCL" | versão (u8) | quantidade de itens (u8)
+#   por item: tamanho da chave (u8) | chave | tamanho dos dados (u16) | dados
+#   CRC32 (u32) de tudo o que vem antes
+CALIBRATION_FILE = "/calibration.bin"
+MAGIC = b"RKCL"
+VERSION = 1
+
+
+def decode(blob) -> dict:
+    """Converte o conteúdo do arquivo em {chave: bytes}. Levanta ValueError se for inválido."""
+    if len(blob) < 10 or blob[:4] != MAGIC:
+        raise ValueError("arquivo de calibração inválido")
+    if blob[4] != VERSION:
+        raise ValueError("versão de calibração não suportada: %d" % blob[4])
+    if binascii.crc32(memoryview(blob)[:-4]) != struct.unpack("<I", blob[-4:])[0]:
+        raise ValueError("CRC da calibração não confere")
+
+    entries = {}
+    pos = 6
+    for _ in range(blob[5]):
+        key_len = blob[pos]
+        key = str(blob[pos + 1:pos + 1 + key_len], "utf-8")
+        pos += 1 + key_len
+        data_len = struct.unpack("<H", blob[pos:pos + 2])[0]
+        entries[key] = bytes(blob[pos + 2:pos + 2 + data_len])
+        pos += 2 + data_len
+    if pos != len(blob) - 4:
+        raise ValueError("arquivo de calibração inválido")
+    return entries
+
+
+def encode(entries: dict) -> bytes:
+    """Converte {chave: bytes} no conteúdo do arquivo."""
+    if len(entries) > 255:
+        raise ValueError("calibrações demais")
+    parts = [MAGIC, bytes((VERSION, len(entries)))]
+    for key in sorted(entries):
+        raw_key = key.encode("utf-8")
+        data = entries[key]
+        if len(raw_key) > 255 or len(data) > 0xFFFF:
+            raise ValueError("calibração grande demais: %s" % key)
+        parts.append(bytes((len(raw_key),)) + raw_key + struct.pack("<H", len(data)))
+        parts.append(bytes(data))
+    blob = b"".join(parts)
+    return blob + struct.pack("<I", binascii.crc32(blob))
+
+
+def read_all(path: str = CALIBRATION_FILE) -> dict:
+    """Todas as calibrações salvas. Arquivo ausente ou corrompido conta como vazio."""
+    try:
+        with open(path, "rb") as f:
+            return decode(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_all(entries: dict, path: str = CALIBRATION_FILE):
+    # Grava em um arquivo temporário e renomeia: um reset no meio da escrita
+    # não deixa o arquivo antigo pela metade
+    temp = path + ".tmp"
+    with open(temp, "wb") as f:
+        f.write(encode(entries))
+    os.rename(temp, path)
+
+
+def load(key: str, path: str = CALIBRATION_FILE):
+    """Dados salvos para 'key', ou None se não houver."""
+    return read_all(path).get(key)
+
+
+def save(key: str, data, path: str = CALIBRATION_FILE):
+    """Salva (ou substitui) os dados de 'key', mantendo os outros itens do arquivo."""
+    entries = read_all(path)
+    data = bytes(data)
+    if entries.get(key) == data:
+        return  # Nada mudou: evita gastar a flash
+    entries[key] = data
+    write_all(entries, path)
+
+
+def remove(key: str, path: str = CALIBRATION_FILE):
+    entries = read_all(path)
+    if entries.pop(key, None) is not None:
+        write_all(entries, path)
+
+
+def keys(path: str = CALIBRATION_FILE):
+    return sorted(read_all(path))
@@ -1,4 +1,10 @@
-from machine import Pin, PWM, Timer
+from machine import Pin, PWM, Timer, freq, mem32
+from micropython import const
+from array import array
+import micropython
+import uctypes
+import _thread
+import math
 import rp2
 import time
 
@@ -102,36 +108,470 @@ class PID():
         self.prev_time = None
         self.times = 0
 
+class PIDBank:
+    """
+    N controladores PID com a mesma lógica de PID.update, mas com ganhos e estado
+    guardados em arrays pré-alocados. Um único update() atualiza todos os canais
+    a partir de um array de erros e escreve as saídas em um array de saídas.
+    """
+    def __init__(self,
+                 n: int,
+                 kp = 1.0,
+                 ki = 0.0,
+                 kd = 0.0,
+                 min_output = 0.0,
+                 max_output = 1.0,
+                 max_derivative = None,
+                 max_integral = None,
+                 tolerance = 0.1,
+                 tolerance_count = 1
+                 ):
+
+        self.n = n
+
+        self.kp = array('f', [0.0] * n)
+        self.ki = array('f', [0.0] * n)
+        self.kd = array('f', [0.0] * n)
+        self.min_output = array('f', [0.0] * n)
+        self.max_output = array('f', [0.0] * n)
+        self.max_derivative = array('f', [0.0] * n)
+        self.max_integral = array('f', [0.0] * n)
+        self.tolerance = array('f', [0.0] * n)
+        self.tolerance_count = tolerance_count
+
+        self.prev_error = array('f', [0.0] * n)
+        self.prev_integral = array('f', [0.0] * n)
+        self.prev_output = array('f', [0.0] * n)
+
+        # number of actual times in tolerance, per controller
+        self.times = array('H', [0] * n)
+
+        self.prev_time = None
+
+        for i in range(n):
+            self.configure(i, kp, ki, kd, min_output, max_output, max_derivative, max_integral, tolerance)
+
+    def configure(self, i: int,
+                  kp = 1.0,
+                  ki = 0.0,
+                  kd = 0.0,
+                  min_output = 0.0,
+                  max_output = 1.0,
+                  max_derivative = None,
+                  max_integral = None,
+                  tolerance = 0.1):
+        # Limites desativados (None) viram infinito, assim o update não precisa de ifs
+        inf = float('inf')
+        self.kp[i] = kp
+        self.ki[i] = ki
+        self.kd[i] = kd
+        self.min_output[i] = min_output
+        self.max_output[i] = max_output
+        self.max_derivative[i] = inf if max_derivative is None else max_derivative
+        self.max_integral[i] = inf if max_integral is None else max_integral
+        self.tolerance[i] = tolerance
+
+    def update(self, errors, outputs, timestep: float = None):
+        # Um único tempo para todos os canais: todos usam o mesmo timestep
+        if timestep is None:
+            current_time = time.ticks_ms()
+            if self.prev_time is None:
+                # First update after instantiation
+                timestep = 0.01
+            else:
+                timestep = time.ticks_diff(current_time, self.prev_time) / 1000
+            self.prev_time = current_time
+        if timestep <= 0:
+            timestep = 0.001
+
+        kp = self.kp
+        ki = self.ki
+        kd = self.kd
+        min_output = self.min_output
+        max_output = self.max_output
+        max_derivative = self.max_derivative
+        max_integral = self.max_integral
+        tolerance = self.tolerance
+        prev_error = self.prev_error
+        prev_integral = self.prev_integral
+        prev_output = self.prev_output
+        times = self.times
+
+        for i in range(self.n):
+            error = errors[i]
+
+            if abs(error) < tolerance[i]:
+                if times[i] < 65535:
+                    times[i] += 1
+            else:
+                times[i] = 0
+
+            integral = prev_integral[i] + error * timestep
+            limit = max_integral[i]
+            if integral > limit:
+                integral = limit
+            elif integral < -limit:
+                integral = -limit
+
+            output = kp[i] * error + ki[i] * integral + kd[i] * (error - prev_error[i]) / timestep
+            prev_error[i] = error
+            prev_integral[i] = integral
+
+            # Bound output by minimum
+            limit = min_output[i]
+            if output > 0:
+                if output < limit:
+                    output = limit
+            elif output > -limit:
+                output = -limit
+
+            # Bound output by maximum
+            limit = max_output[i]
+            if output > limit:
+                output = limit
+            elif output < -limit:
+                output = -limit
+
+            # Bound output by maximum acceleration
+            limit = max_derivative[i] * timestep
+            if output > prev_output[i] + limit:
+                output = prev_output[i] + limit
+            elif output < prev_output[i] - limit:
+                output = prev_output[i] - limit
+
+            prev_output[i] = output
+            outputs[i] = output
+
+        return outputs
+
+    def is_done(self, i: int) -> bool:
+        return self.times[i] >= self.tolerance_count
+
+    def clear_history(self, i: int = None):
+        channels = range(self.n) if i is None else (i,)
+        for c in channels:
+            self.prev_error[c] = 0
+            self.prev_integral[c] = 0
+            self.prev_output[c] = 0
+            self.times[c] = 0
+        if i is None:
+            self.prev_time = None
+
+# Posições do estado de PIDFixed no array('i')
+_Q_KP = const(0)           # kp, Q16
+_Q_KI_DT = const(1)        # ki * timestep, Q24
+_Q_KD_DT = const(2)        # kd / timestep, Q16
+_Q_MIN_OUTPUT = const(3)   # Q16
+_Q_MAX_OUTPUT = const(4)   # Q16
+_Q_MAX_DELTA = const(5)    # max_derivative * timestep, Q16 (-1 = desativado)
+_Q_SUM_LIMIT = const(6)    # limite da soma dos erros (max_integral / timestep)
+_Q_P_LIMIT = const(7)      # limite do erro no termo P (evita overflow)
+_Q_D_LIMIT = const(8)      # limite da variação do erro no termo D (evita overflow)
+_Q_TOLERANCE = const(9)
+_Q_PREV_ERROR = const(10)
+_Q_SUM = const(11)
+_Q_PREV_OUTPUT = const(12)
+_Q_TIMES = const(13)
+_Q_STATE_SIZE = const(14)
+
+# Cada produto fica abaixo de 2**28, então a soma dos três termos cabe em um small int
+# de 31 bits (e em um int de 32 bits no viper) sem alocar memória
+_Q_TERM_LIMIT = const(1 << 28)
+
+
+@micropython.viper
+def _pid_fixed_update(state: ptr32, error: int) -> int:
+    if error < state[_Q_TOLERANCE] and error > 0 - state[_Q_TOLERANCE]:
+        state[_Q_TIMES] = state[_Q_TIMES] + 1
+    else:
+        state[_Q_TIMES] = 0
+
+    # Proporcional
+    limit = state[_Q_P_LIMIT]
+    e = error
+    if e > limit:
+        e = limit
+    elif e < 0 - limit:
+        e = 0 - limit
+    output = state[_Q_KP] * e
+
+    # Integral (soma dos erros, limitada por max_integral)
+    total = state[_Q_SUM] + error
+    limit = state[_Q_SUM_LIMIT]
+    if total > limit:
+        total = limit
+    elif total < 0 - limit:
+        total = 0 - limit
+    state[_Q_SUM] = total
+    output += (state[_Q_KI_DT] * total) >> 8
+
+    # Derivativo
+    delta = error - state[_Q_PREV_ERROR]
+    limit = state[_Q_D_LIMIT]
+    if delta > limit:
+        delta = limit
+    elif delta < 0 - limit:
+        delta = 0 - limit
+    output += state[_Q_KD_DT] * delta
+    state[_Q_PREV_ERROR] = error
+
+    # Bound output by minimum
+    limit = state[_Q_MIN_OUTPUT]
+    if output > 0:
+        if output < limit:
+            output = limit
+    elif output > 0 - limit:
+        output = 0 - limit
+
+    # Bound output by maximum
+    limit = state[_Q_MAX_OUTPUT]
+    if output > limit:
+        output = limit
+    elif output < 0 - limit:
+        output = 0 - limit
+
+    # Bound output by maximum acceleration
+    limit = state[_Q_MAX_DELTA]
+    if limit >= 0:
+        prev = state[_Q_PREV_OUTPUT]
+        if output > prev + limit:
+            output = prev + limit
+        elif output < prev - limit:
+            output = prev - limit
+
+    state[_Q_PREV_OUTPUT] = output
+    return output
+
+
+class PIDFixed:
+    """
+    PID em ponto fixo com a mesma lógica de limites do PID (max_integral, min/max_output
+    e max_derivative), para timestep fixo. O update() usa só inteiros e não aloca
+    memória, então pode ser chamado de um Timer com hard=True em 1 kHz ou mais.
+
+    O erro é um inteiro (ex: counts por tick) e a saída é Q16: ONE (65536) = 1.0,
+    que pode ser usada direto como duty_u16 (limitando em 65535).
+    """
+    ONE = 1 << 16
+
+    def __init__(self,
+                 timestep: float,
+                 kp = 1.0,
+                 ki = 0.0,
+                 kd = 0.0,
+                 min_output = 0.0,
+                 max_output = 1.0,
+                 max_derivative = None,
+                 max_integral = None,
+                 tolerance = 1,
+                 tolerance_count = 1
+                 ):
+
+        self.timestep = timestep
+        self.tolerance_count = tolerance_count
+        self._state = array('i', [0] * _Q_STATE_SIZE)
+        self.configure(kp, ki, kd, min_output, max_output, max_derivative, max_integral, tolerance)
+
+    def configure(self,
+                  kp = 1.0,
+                  ki = 0.0,
+                  kd = 0.0,
+                  min_output = 0.0,
+                  max_output = 1.0,
+                  max_derivative = None,
+                  max_integral = None,
+                  tolerance = 1):
+        # Toda a conversão para ponto fixo (e as divisões) acontece aqui, fora do update()
+        state = self._state
+        dt = self.timestep
+        state[_Q_KP] = round(kp * (1 << 16))
+        state[_Q_KI_DT] = round(ki * dt * (1 << 24))
+        state[_Q_KD_DT] = round(kd / dt * (1 << 16))
+        state[_Q_MIN_OUTPUT] = round(min_output * (1 << 16))
+        state[_Q_MAX_OUTPUT] = round(max_output * (1 << 16))
+        state[_Q_MAX_DELTA] = -1 if max_derivative is None else round(max_derivative * dt * (1 << 16))
+        state[_Q_TOLERANCE] = int(tolerance)
+
+        sum_limit = _Q_TERM_LIMIT
+        if state[_Q_KI_DT]:
+            sum_limit = min(sum_limit, _Q_TERM_LIMIT // abs(state[_Q_KI_DT]))
+        if max_integral is not None:
+            sum_limit = min(sum_limit, int(max_integral / dt))
+        state[_Q_SUM_LIMIT] = sum_limit
+        state[_Q_P_LIMIT] = _Q_TERM_LIMIT // max(1, abs(state[_Q_KP]))
+        state[_Q_D_LIMIT] = _Q_TERM_LIMIT // max(1, abs(state[_Q_KD_DT]))
+
+    def update(self, error: int) -> int:
+        return _pid_fixed_update(self._state, error)
+
+    def is_done(self) -> bool:
+        return self._state[_Q_TIMES] >= self.tolerance_count
+
+    def clear_history(self):
+        state = self._state
+        state[_Q_PREV_ERROR] = 0
+        state[_Q_SUM] = 0
+        state[_Q_PREV_OUTPUT] = 0
+        state[_Q_TIMES] = 0
+
+# Registradores usados pelo EncoderSnapshot (RP2040)
+_DMA_BASE = const(0x50000000)
+_DMA_TIMER0 = const(0x420)
+_DREQ_DMA_TIMER0 = const(0x3b)
+_DREQ_PIO_RX0 = const(4)
+_PIO_BASES = (0x50200000, 0x50300000)
+_PIO_RXF0 = const(0x20)
+
+# Tentativas de ler um valor novo da FIFO do encoder depois de descartar os antigos.
+# O programa publica a cada poucos ciclos do PIO, então a primeira quase sempre basta.
+_FRESH_POLLS = const(8)
+
+
 class _Encoder:
     _gear_ratio = 45 # (30/14) * (28/16) * (36/9) * (26/8) # 48.75
     _counts_per_motor_shaft_revolution = 53 #12
     resolution = _counts_per_motor_shaft_revolution * _gear_ratio
+    # State machines já em uso (0-3 -> PIO0, 4-7 -> PIO1): contagem e medição de período
+    _claimed = set()
+    _speed_claimed = set()
     
-    def __init__(self, index, encAPin: int|str, encBPin: int|str):
+    def __init__(self, index, encAPin: int|str, encBPin: int|str, speed_index = None):
         
         basePin = Pin(min(encAPin, encBPin), Pin.IN)
         nextPin = Pin(max(encAPin, encBPin), Pin.IN)
+        if index is None:
+            # Fora do bloco da medição de velocidade, que não cabe junto com o _encoder
+            index = _Encoder.free_index(None if speed_index is None else speed_index // 4)
+        self.index = index
         self.sm = rp2.StateMachine(index, self._encoder, in_base=basePin)
+        _Encoder._claimed.add(index)
+        # Buffer da leitura: o sm.get() escreve o contador como int32 com sinal
+        self._counts = array('i', [0])
+        self._last_counts = 0
+        self._direction = 0
+        # EncoderSnapshot que lê a FIFO por DMA (quando em uso) e a posição deste eixo nele
+        self.snapshot = None
+        self._axis = 0
         self.reset_encoder_position()
         self.sm.active(1)
+
+        # Medição de velocidade por hardware (opcional): outra state machine mede o
+        # período do canal A. Como o _encoder ocupa toda a memória de instruções do
+        # seu bloco PIO, speed_index deve ser de outro bloco (0-3 -> PIO0, 4-7 -> PIO1).
+        self.speed_sm = None
+        self.speed_index = speed_index
+        if speed_index is not None:
+            pinA = Pin(encAPin, Pin.IN)
+            self.speed_sm = rp2.StateMachine(speed_index, self._edge_period, in_base=pinA, jmp_pin=pinA)
+            _Encoder._speed_claimed.add(speed_index)
+            self._period = array('I', [0])
+            # Cada unidade do período são 2 ciclos do PIO e cada período do canal A tem
+            # 4 counts: counts/s = 4 * (freq / 2) / período
+            self._speed_scale = 2 * freq()
+            self._speed = 0
+            self._last_edge_us = None
+            self.speed_sm.active(1)
     
+    @staticmethod
+    def free_index(skip_block: int = None) -> int:
+        """
+        Retorna a primeira state machine (0-7) livre em um bloco PIO que tenha (ou
+        consiga carregar) o programa _encoder, que ocupa toda a memória de instruções
+        do bloco. O programa fica carregado no bloco escolhido.
+        """
+        for index in range(8):
+            if index in _Encoder._claimed or index // 4 == skip_block:
+                continue
+            if _Encoder._load_program(index // 4):
+                return index
+        raise RuntimeError("Não há state machines livres para mais um encoder")
+
+    @staticmethod
+    def _load_program(block: int) -> bool:
+        if any(index // 4 == block for index in _Encoder._claimed):
+            return True   # Outro encoder já carregou o programa neste bloco
+        if any(index // 4 == block for index in _Encoder._speed_claimed):
+            return False  # _edge_period já ocupa parte da memória
+        try:
+            rp2.PIO(block).add_program(_Encoder._encoder)
+        except OSError:
+            return False  # Memória ocupada por outro programa
+        return True
+
+    def deinit(self):
+        """
+        Para as state machines e as libera para outros encoders. Sem nenhum encoder
+        no bloco, o programa é descarregado. Pare antes o EncoderSnapshot que as lê.
+        """
+        self.sm.active(0)
+        _Encoder._claimed.discard(self.index)
+        block = self.index // 4
+        if not any(index // 4 == block for index in _Encoder._claimed):
+            rp2.PIO(block).remove_program(_Encoder._encoder)
+
+        if self.speed_sm is not None:
+            self.speed_sm.active(0)
+            _Encoder._speed_claimed.discard(self.speed_index)
+            block = self.speed_index // 4
+            if not any(index // 4 == block for index in _Encoder._speed_claimed):
+                rp2.PIO(block).remove_program(_Encoder._edge_period)
+            self.speed_sm = None
+
     def reset_encoder_position(self):
         self.sm.exec("set(x, 0)")
     
     def get_position_counts(self):
-        # Read 5 times for it to get past the buffer
-        counts = self.sm.get()
-        counts = self.sm.get()
-        counts = self.sm.get()
-        counts = self.sm.get()
-        counts = self.sm.get()
-        if(counts > 2**31):
-            counts -= 2**32
+        if self.snapshot is not None:
+            # Modo DMA: só o DMA lê a FIFO, a posição vem do último snapshot
+            counts = self.snapshot.get_latest(self._axis)
+        else:
+            # O programa usa push(noblock): com a FIFO cheia os valores novos são descartados,
+            # então o que está nela é antigo. Descarta só o que rx_fifo() informa e espera o
+            # próximo valor, que o programa publica a cada poucos ciclos do PIO, sem bloquear:
+            # se a state machine estiver parada, fica o último valor lido.
+            # Ler para o array('i') converte para 32 bits com sinal sem criar inteiros grandes.
+            sm = self.sm
+            buffer = self._counts
+            for _ in range(sm.rx_fifo()):
+                sm.get(buffer)
+            for _ in range(_FRESH_POLLS):
+                if sm.rx_fifo():
+                    sm.get(buffer)
+                    break
+            counts = buffer[0]
+
+        # Guarda o sentido do último movimento para dar sinal à velocidade medida no PIO
+        if counts != self._last_counts:
+            self._direction = 1 if counts > self._last_counts else -1
+            self._last_counts = counts
         return counts
     
     def get_position(self):
         return self.get_position_counts() / self.resolution
 
+    def get_speed_counts(self) -> int:
+        """
+        Velocidade em counts por segundo medida pelo PIO (requer speed_index).
+        O sentido vem da última leitura de posição.
+        """
+        sm = self.speed_sm
+        now = time.ticks_us()
+        pending = sm.rx_fifo()
+        if pending:
+            for _ in range(pending):
+                sm.get(self._period)
+            self._speed = self._speed_scale // max(1, self._period[0])
+            self._last_edge_us = now
+        elif self._last_edge_us is None:
+            return 0
+        else:
+            # Nenhuma borda desde a última leitura: a velocidade não pode ser maior que
+            # a de um período que durasse todo o tempo desde a última borda
+            elapsed = time.ticks_diff(now, self._last_edge_us)
+            if elapsed > 0:
+                self._speed = min(self._speed, 4000000 // elapsed)
+        return self._speed * self._direction
+
     @rp2.asm_pio(in_shiftdir=rp2.PIO.SHIFT_LEFT, out_shiftdir=rp2.PIO.SHIFT_RIGHT)
     def _encoder():
         # Register descriptions:
@@ -184,23 +624,433 @@ class _Encoder:
         
         # Fill remaining instruction memory with jumps to ensure nothing bad happens
         # For some reason, weird behavior happens if the instruction memory isn't full
+        # (programs are loaded at the top of the memory, and mov(pc, isr) needs the jump
+        # table at address 0). The 4 state machines of a PIO block share this program.
         jmp("read")
         jmp("read")
         jmp("read")
         jmp("read")
-        
+
+    @rp2.asm_pio()
+    def _edge_period():
+        # Mede o período do canal A (de uma borda de subida até a próxima).
+        # X conta para baixo a cada 2 ciclos, tanto com o pino alto quanto baixo,
+        # e o número de decrementos é publicado na FIFO a cada borda de subida.
+        wrap_target()
+        mov(x, invert(null))    # X = 0xFFFFFFFF
+
+        label("high")
+        jmp(pin, "high_dec")    # Pino ainda alto, continua contando
+        jmp("low")
+        label("high_dec")
+        jmp(x_dec, "high")
+
+        label("low")
+        jmp(pin, "done")        # Pino voltou a subir: período completo
+        jmp(x_dec, "low")
+
+        label("done")
+        mov(isr, invert(x))     # Decrementos = ~X
+        push(noblock)
+        wrap()
+
+
+class EncoderGroup:
+    """
+    Cria e lê vários encoders de uma vez (até 8). O programa _encoder é carregado
+    uma única vez em cada bloco PIO e compartilhado pelas suas 4 state machines,
+    que são escolhidas automaticamente entre as livres.
+
+    Exemplo:
+        encoders = EncoderGroup(((6, 7), (8, 9), (10, 11)))
+        counts = array('i', [0] * len(encoders))
+        encoders.read_counts(counts)
+    """
+    def __init__(self, pins):
+        self.encoders = []
+        for encAPin, encBPin in pins:
+            # free_index() carrega o programa uma única vez por bloco (o MicroPython o
+            # reutiliza nas outras state machines do bloco)
+            self.encoders.append(_Encoder(_Encoder.free_index(), encAPin, encBPin))
+
+        self._counts = array('i', [0] * len(self.encoders))
+        # Uma fatia de 1 elemento por encoder: sm.get() escreve direto no array, sem alocar
+        counts = memoryview(self._counts)
+        self._slots = [(encoder.sm, counts[i:i + 1]) for i, encoder in enumerate(self.encoders)]
+
+    def __len__(self):
+        return len(self.encoders)
+
+    def __getitem__(self, i):
+        return self.encoders[i]
+
+    def read_counts(self, out=None):
+        """
+        Lê a contagem de todos os encoders e a escreve em 'out' (ou no buffer interno,
+        que é retornado). Não aloca memória. Com um EncoderSnapshot ativo, use o
+        read_latest() dele: só o DMA deve ler as FIFOs.
+        """
+        # Mesma leitura do get_position_counts(): descarta o que está na FIFO e espera um
+        # valor novo por poucas tentativas, sem bloquear
+        for sm, slot in self._slots:
+            for _ in range(sm.rx_fifo()):
+                sm.get(slot)
+            for _ in range(_FRESH_POLLS):
+                if sm.rx_fifo():
+                    sm.get(slot)
+                    break
+        if out is None:
+            return self._counts
+        for i in range(len(self._counts)):
+            out[i] = self._counts[i]
+        return out
+
+    def reset_encoder_positions(self):
+        for encoder in self.encoders:
+            encoder.reset_encoder_position()
+
+    def deinit(self):
+        for encoder in self.encoders:
+            encoder.deinit()
+        self.encoders = []
+        self._slots = []
+
+
+class EncoderSnapshot:
+    """
+    Copia por DMA, a uma taxa fixa, a contagem de vários _Encoder para buffers
+    circulares em RAM (um por eixo, todos avançando juntos). Depois de criado, só o
+    DMA lê as FIFOs: get_position_counts() dos encoders passa a usar o último
+    snapshot, e o histórico pode ser lido sem tocar nas FIFOs.
+
+    A cada período do timer de DMA, uma cadeia de canais percorre os eixos: um canal
+    descarta as 4 leituras antigas da FIFO e outro grava a próxima no buffer do eixo.
+    Usa 1 + 2 * len(encoders) canais de DMA e um dos 4 timers de DMA.
+    """
+    def __init__(self, encoders, rate_hz: int = 1000, depth: int = 64, timer: int = 0):
+        if depth & (depth - 1) or not 2 <= depth <= 8192:
+            raise ValueError("depth deve ser uma potência de 2 entre 2 e 8192")
+        if not 0 < rate_hz <= freq():
+            raise ValueError("rate_hz deve estar entre 0 e a frequência da CPU (%d Hz)" % freq())
+
+        self.encoders = encoders
+        self.depth = depth
+        ring_bytes = depth * 4
+
+        # O DMA só dá a volta em buffers alinhados ao próprio tamanho: aloca um anel a
+        # mais e começa no primeiro endereço alinhado
+        self._buffer = array('i', [0] * ((len(encoders) + 1) * depth))
+        self._start = ((-uctypes.addressof(self._buffer)) % ring_bytes) // 4
+        self._ring_addr = uctypes.addressof(self._buffer) + self._start * 4
+        self._scratch = array('i', [0])
+        scratch_addr = uctypes.addressof(self._scratch)
+
+        # Timer de DMA: taxa = freq * X / Y, com Y de 16 bits. Para taxas menores que
+        # freq / 65535, o canal de ritmo espera 'ticks' pulsos antes de cada snapshot
+        divisor = freq() // rate_hz
+        ticks = (divisor + 65534) // 65535
+        period = divisor // ticks
+        mem32[_DMA_BASE + _DMA_TIMER0 + 4 * timer] = (1 << 16) | period
+        self.rate_hz = freq() / (period * ticks)
+
+        self._pace = rp2.DMA()
+        self._drain = [rp2.DMA() for _ in encoders]
+        self._rings = [rp2.DMA() for _ in encoders]
+        self._channels = [self._pace] + self._drain + self._rings
+
+        self._pace.config(
+            read=scratch_addr, write=scratch_addr, count=ticks,
+            ctrl=self._pace.pack_ctrl(size=2, inc_read=False, inc_write=False,
+                                      treq_sel=_DREQ_DMA_TIMER0 + timer,
+                                      chain_to=self._drain[0].channel, irq_quiet=True))
+
+        for axis, encoder in enumerate(encoders):
+            pio, sm = divmod(encoder.index, 4)
+            fifo_addr = _PIO_BASES[pio] + _PIO_RXF0 + 4 * sm
+            dreq = _DREQ_PIO_RX0 + 8 * pio + sm
+            next_channel = self._drain[axis + 1] if axis + 1 < len(encoders) else self._pace
+
+            drain, ring = self._drain[axis], self._rings[axis]
+            drain.config(
+                read=fifo_addr, write=scratch_addr, count=4,
+                ctrl=drain.pack_ctrl(size=2, inc_read=False, inc_write=False, treq_sel=dreq,
+                                     chain_to=ring.channel, irq_quiet=True))
+            ring.config(
+                read=fifo_addr, write=self._ring_addr + axis * ring_bytes, count=1,
+                ctrl=ring.pack_ctrl(size=2, inc_read=False, inc_write=True,
+                                    ring_size=ring_bytes.bit_length() - 1, ring_sel=True,
+                                    treq_sel=dreq, chain_to=next_channel.channel, irq_quiet=True))
+
+            encoder.snapshot = self
+            encoder._axis = axis
+
+        self._pace.active(1)
+
+    def latest_index(self) -> int:
+        # O último eixo é gravado por último: o que ele já gravou está completo em todos
+        written = (self._rings[-1].write - self._ring_addr) // 4 - (len(self.encoders) - 1) * self.depth
+        return (written - 1) % self.depth
+
+    def get_latest(self, axis: int) -> int:
+        return self._buffer[self._start + axis * self.depth + self.latest_index()]
+
+    def read_latest(self, out):
+        """Preenche 'out' com a contagem de todos os eixos no mesmo snapshot."""
+        index = self._start + self.latest_index()
+        for axis in range(len(self.encoders)):
+            out[axis] = self._buffer[index + axis * self.depth]
+        return out
+
+    def read_history(self, axis: int, out):
+        """Preenche 'out' com os últimos len(out) snapshots de um eixo, do mais antigo ao mais recente."""
+        base = self._start + axis * self.depth
+        index = self.latest_index() - len(out) + 1
+        for i in range(len(out)):
+            out[i] = self._buffer[base + (index + i) % self.depth]
+        return out
+
+    def stop(self):
+        for channel in self._channels:
+            channel.active(0)
+            channel.close()
+        for encoder in self.encoders:
+            encoder.snapshot = None
+
+
+class SharedBuffer:
+    """
+    Valores pré-alocados trocados entre os núcleos sem lock (seqlock). Um único
+    escritor atualiza tudo entre begin_write() e end_write(); read_into() repete a
+    leitura se ela coincidir com uma escrita, então sempre devolve um conjunto coerente.
+    """
+    def __init__(self, size: int, typecode: str = 'f'):
+        self.data = array(typecode, [0] * size)
+        self._seq = array('I', [0])
+
+    def begin_write(self):
+        # Ímpar: escrita em andamento (a máscara evita inteiros grandes)
+        self._seq[0] = (self._seq[0] + 1) & 0x3FFFFFFF
+
+    def end_write(self):
+        self._seq[0] = (self._seq[0] + 1) & 0x3FFFFFFF
+
+    def __getitem__(self, i):
+        return self.data[i]
+
+    def read_into(self, out):
+        data, seq = self.data, self._seq
+        while True:
+            start = seq[0]
+            if start & 1:
+                continue
+            for i in range(len(out)):
+                out[i] = data[i]
+            if seq[0] == start:
+                return out
+
+
+class ControlScheduler:
+    """
+    Executa todas as tarefas de controle (ex.: o _update dos EncodedMotor) a partir de
+    um único timer, na mesma base de tempo. Cada tarefa roda a cada 'divider' ticks.
+    Mede o tempo de execução de cada tick e conta os que passaram do período.
+    """
+    _default = None
+
+    def __init__(self, rate_hz: int = 50):
+        self.rate_hz = rate_hz
+        self.period_us = 1000000 // rate_hz
+        self._tasks = []
+        self._timer = None
+        self._core = None            # Núcleo em que o tick roda (None: parado)
+        self._core1_done = True
+        self._tick_callback = self._tick   # Método ligado criado uma única vez
+        self.reset_stats()
+
+    @classmethod
+    def default(cls):
+        """Escalonador compartilhado (50 Hz) usado pelos EncodedMotor sem escalonador próprio."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def add(self, callback, divider: int = 1):
+        """Registra 'callback' para rodar a cada 'divider' ticks. Inicia o timer se preciso."""
+        self.remove(callback)
+        self._tasks = self._tasks + [(callback, max(1, divider))]
+        if self._core is None:
+            self.start()
+
+    def remove(self, callback):
+        # Troca a lista em vez de alterá-la: um tick em andamento continua com a antiga
+        self._tasks = [task for task in self._tasks if task[0] is not callback]
+
+    def start(self, core: int = 0):
+        """
+        Inicia o tick. Com core=1 o laço de controle roda no segundo núcleo (via _thread),
+        deixando o núcleo 0 inteiro para o programa principal. Nesse modo, troque dados
+        com as tarefas por SharedBuffer em vez de atributos alterados a cada ciclo.
+        """
+        if self._core is not None:
+            return
+        self._core = core
+        self._last_start = time.ticks_us()
+        if core == 1:
+            self._core1_done = False
+            _thread.start_new_thread(self._core1_loop, ())
+        else:
+            self._timer = Timer(-1)
+            self._timer.init(freq=self.rate_hz, callback=self._tick_callback)
+
+    def stop(self):
+        core, self._core = self._core, None
+        if core == 1:
+            # O laço do núcleo 1 vê _core = None e termina no próximo tick
+            while not self._core1_done:
+                time.sleep_ms(1)
+        elif self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+
+    def _core1_loop(self):
+        try:
+            next_tick = time.ticks_add(time.ticks_us(), self.period_us)
+            while self._core == 1:
+                while time.ticks_diff(next_tick, time.ticks_us()) > 0:
+                    pass
+                self._tick(None)
+                next_tick = time.ticks_add(next_tick, self.period_us)
+                if time.ticks_diff(time.ticks_us(), next_tick) > 0:
+                    # Atrasou mais de um período: recomeça a contagem em vez de acumular ticks
+                    next_tick = time.ticks_add(time.ticks_us(), self.period_us)
+        finally:
+            self._core1_done = True
+
+    def reset_stats(self):
+        self.ticks = 0
+        self.overruns = 0
+        self.last_us = 0
+        self.max_us = 0
+        self.max_jitter_us = 0
+        self._last_start = time.ticks_us()
+
+    def _tick(self, timer):
+        start = time.ticks_us()
+        jitter = abs(time.ticks_diff(start, self._last_start) - self.period_us)
+        if self.ticks and jitter > self.max_jitter_us:
+            self.max_jitter_us = jitter
+        self._last_start = start
+        self.ticks += 1
+
+        ticks = self.ticks
+        for callback, divider in self._tasks:
+            if ticks % divider == 0:
+                callback()
+
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        self.last_us = elapsed
+        if elapsed > self.max_us:
+            self.max_us = elapsed
+        if elapsed > self.period_us:
+            self.overruns += 1
+
+    def stats(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "last_us": self.last_us,
+            "max_us": self.max_us,
+            "max_jitter_us": self.max_jitter_us,
+        }
+
+
+def motion_profile(distance: float, max_speed: float, max_accel: float,
+                   s_curve: bool = False, max_length: int = 4096):
+    """
+    Pré-calcula as posições (uma por tick, a partir de 0) de um movimento até
+    'distance' com velocidade e aceleração limitadas (unidades por tick e por tick²).
+    O perfil é trapezoidal; com s_curve=True as rampas são suavizadas por uma média
+    móvel da velocidade, limitando também o jerk. Retorna um array('f').
+    """
+    sign = 1 if distance >= 0 else -1
+    distance = abs(distance)
+    if distance == 0 or max_speed <= 0 or max_accel <= 0:
+        return array('f', [0.0])
+
+    peak = min(max_speed, math.sqrt(distance * max_accel))
+    ramp = max(1, math.ceil(peak / max_accel))
+    # As duas rampas percorrem peak * (ramp + 1); arredonda o cruzeiro para cima e
+    # depois reduz a escala, para nunca passar da velocidade máxima
+    cruise = max(0, math.ceil(distance / peak - (ramp + 1)))
+    window = max(1, ramp // 2) if s_curve else 1
+    length = 2 * ramp + cruise + window - 1
+    if length > max_length:
+        raise ValueError("Movimento longo demais para a tabela: aumente a velocidade ou max_length")
+
+    speeds = array('f', [0.0] * length)
+    for k in range(ramp):
+        speeds[k] = speeds[2 * ramp + cruise - 1 - k] = peak * (k + 1) / ramp
+    for k in range(ramp, ramp + cruise):
+        speeds[k] = peak
+
+    # Média móvel de 'window' ticks (soma corrida sobre uma cópia das velocidades)
+    if window > 1:
+        total = 0.0
+        previous = array('f', speeds)
+        for k in range(length):
+            total += previous[k]
+            if k >= window:
+                total -= previous[k - window]
+            speeds[k] = total / window
+
+    scale = sign * distance / sum(speeds)
+    position = 0.0
+    for k in range(length):
+        position += speeds[k] * scale
+        speeds[k] = position
+    speeds[-1] = sign * distance
+    return speeds
+
+
+# Registradores de PWM usados pelo MotorGroup (RP2040)
+_PWM_BASE = const(0x40050000)
+_PWM_SLICE_SIZE = const(0x14)
+_PWM_CTR = const(0x08)
+_PWM_CC = const(0x0c)
+_PWM_TOP = const(0x10)
+_PWM_EN = const(0xa0)
+
 
 class Motor:
     def __init__(self, in1_pwm_forward: int|str, in2_pwm_backward: int|str, flip_dir:bool=False, PWM_frequency: int = 50):
         self.flip_dir = flip_dir
         self._MAX_PWM = 65535
+        self.pins = (in1_pwm_forward, in2_pwm_backward)
         self._pwm_fwd = PWM(Pin(in1_pwm_forward, Pin.OUT))
         self._pwm_rev = PWM(Pin(in2_pwm_backward, Pin.OUT))
         self._pwm_fwd.freq(PWM_frequency)
         self._pwm_rev.freq(PWM_frequency)
+        # Último duty escrito em cada pino (-1: desconhecido), para não repetir escritas
+        self._duty_fwd = -1
+        self._duty_rev = -1
+        # Cache de escrita ('_written') dos slices deste motor em cada MotorGroup
+        self._group_written = []
 
-    def set_effort(self, effort: float): #sentido da direção da roda
-        
+    def _write(self, duty_fwd: int, duty_rev: int):
+        if duty_fwd == self._duty_fwd and duty_rev == self._duty_rev:
+            return
+        if duty_fwd != self._duty_fwd:
+            self._pwm_fwd.duty_u16(duty_fwd)
+            self._duty_fwd = duty_fwd
+        if duty_rev != self._duty_rev:
+            self._pwm_rev.duty_u16(duty_rev)
+            self._duty_rev = duty_rev
+        # Os registradores foram escritos por fora do grupo: invalida o cache dele
+        for written in self._group_written:
+            written[0] = written[1] = -1
+
+    def _duties(self, effort: float):
+        # (duty do pino de ida, duty do pino de volta) para um esforço de -1 a 1
         effort = max(min(effort, 1.0), -1.0)  # Limita de -1 a 1
 
         # Inverte direção, se necessário
@@ -210,26 +1060,150 @@ class Motor:
         pwm_value = int(abs(effort) * self._MAX_PWM)
 
         if effort > 0:
-            self._pwm_fwd.duty_u16(pwm_value)
-            self._pwm_rev.duty_u16(0)
+            return pwm_value, 0
         elif effort < 0:
-            self._pwm_fwd.duty_u16(0)
-            self._pwm_rev.duty_u16(pwm_value)
-        else:
-            self.coast()
+            return 0, pwm_value
+        return 0, 0
+
+    def set_effort(self, effort: float): #sentido da direção da roda
+        duty_fwd, duty_rev = self._duties(effort)
+        self._write(duty_fwd, duty_rev)
 
     def brake(self): #aplica tensão por completo no motor
-        self._pwm_fwd.duty_u16(int(self._MAX_PWM))
-        self._pwm_rev.duty_u16(int(self._MAX_PWM))
+        self._write(self._MAX_PWM, self._MAX_PWM)
 
     def coast(self): #desativa por completo a tensão no motor
-        self._pwm_fwd.duty_u16(int(0))
-        self._pwm_rev.duty_u16(int(0))
+        self._write(0, 0)
+
+
+@micropython.viper
+def _pwm_write_cc(cc: ptr32, a: int, b: int):
+    # Escreve os dois canais do slice em uma única escrita de 32 bits
+    cc[0] = a | (b << 16)
+
+
+@micropython.viper
+def _pwm_read_cc(cc: ptr32, channel: int) -> int:
+    return (cc[0] >> (channel << 4)) & 0xffff
+
+
+def _gpio_number(pin) -> int:
+    # Aceita 15, "15" ou "GP15"
+    if isinstance(pin, int):
+        return pin
+    return int("".join(c for c in pin if c.isdigit()))
+
+
+class MotorGroup:
+    """
+    Aplica os esforços de vários Motor de uma vez, escrevendo direto nos registradores
+    de comparação (CC) dos slices de PWM. Só escreve os slices cujo duty mudou, e os
+    contadores dos slices do grupo são reiniciados juntos: como o CC só é aplicado no
+    fim do período, todos os motores mudam de esforço no mesmo instante.
+    Todos os motores devem usar a mesma frequência de PWM, configurada antes do grupo.
+    """
+    def __init__(self, motors):
+        self.motors = motors
+        slices = []
+        for motor in motors:
+            for pin in motor.pins:
+                slice_ = (_gpio_number(pin) >> 1) & 7
+                if slice_ not in slices:
+                    slices.append(slice_)
+        self._slices = slices
+        self._cc_addr = [_PWM_BASE + _PWM_SLICE_SIZE * slice_ + _PWM_CC for slice_ in slices]
+        self._top = [mem32[_PWM_BASE + _PWM_SLICE_SIZE * slice_ + _PWM_TOP] for slice_ in slices]
+
+        # Para cada motor: (slice, canal) do pino de ida e do pino de volta
+        self._outputs = []
+        owned = [[False, False] for _ in slices]
+        for motor in motors:
+            outputs = []
+            for pin in motor.pins:
+                gpio = _gpio_number(pin)
+                index = slices.index((gpio >> 1) & 7)
+                owned[index][gpio & 1] = True
+                outputs.append((index, gpio & 1))
+            self._outputs.append(tuple(outputs))
+        # Canais dos slices que não são de nenhum motor do grupo são preservados
+        self._owned = owned
+
+        # Valor de CC pedido e último escrito, por slice e canal
+        self._cc = [array('I', [_pwm_read_cc(addr, 0), _pwm_read_cc(addr, 1)]) for addr in self._cc_addr]
+        self._written = [array('i', [-1, -1]) for _ in slices]
+        for motor, outputs in zip(motors, self._outputs):
+            for index in {output[0] for output in outputs}:
+                motor._group_written.append(self._written[index])
+
+        # Reinicia os contadores do grupo juntos para os períodos ficarem em fase
+        mask = 0
+        for slice_ in slices:
+            mask |= 1 << slice_
+        enabled = mem32[_PWM_BASE + _PWM_EN]
+        mem32[_PWM_BASE + _PWM_EN] = enabled & ~mask
+        for slice_ in slices:
+            mem32[_PWM_BASE + _PWM_SLICE_SIZE * slice_ + _PWM_CTR] = 0
+        mem32[_PWM_BASE + _PWM_EN] = enabled | mask
+
+    def set_efforts(self, efforts):
+        """Aplica um esforço (-1 a 1) por motor, na mesma ordem de 'motors'."""
+        for i, effort in enumerate(efforts):
+            duty_fwd, duty_rev = self.motors[i]._duties(effort)
+            self._set_motor(i, duty_fwd, duty_rev)
+        self._flush()
+
+    def brake(self):
+        for i, motor in enumerate(self.motors):
+            self._set_motor(i, motor._MAX_PWM, motor._MAX_PWM)
+        self._flush()
+
+    def coast(self):
+        for i in range(len(self.motors)):
+            self._set_motor(i, 0, 0)
+        self._flush()
+
+    def _set_motor(self, i: int, duty_fwd: int, duty_rev: int):
+        fwd, rev = self._outputs[i]
+        self._set_duty(fwd, duty_fwd)
+        self._set_duty(rev, duty_rev)
+        # Os registradores são escritos por fora do Motor: invalida o cache dele
+        motor = self.motors[i]
+        motor._duty_fwd = motor._duty_rev = -1
+
+    def _set_duty(self, output, duty: int):
+        index, channel = output
+        # cc = duty * (TOP + 1) / 65536, com 65535 -> TOP + 1 (sempre ligado) e limitado aos
+        # 16 bits do registrador. Feito em duas partes de 8 bits para os produtos
+        # continuarem inteiros pequenos
+        duty += duty >> 15
+        period = self._top[index] + 1
+        cc = ((duty >> 8) * period + (((duty & 0xff) * period) >> 8)) >> 8
+        self._cc[index][channel] = cc if cc < 0xffff else 0xffff
+
+    def _flush(self):
+        for index in range(len(self._slices)):
+            cc, written, owned = self._cc[index], self._written[index], self._owned[index]
+            if cc[0] == written[0] and cc[1] == written[1]:
+                continue
+            addr = self._cc_addr[index]
+            a = cc[0] if owned[0] else _pwm_read_cc(addr, 0)
+            b = cc[1] if owned[1] else _pwm_read_cc(addr, 1)
+            _pwm_write_cc(addr, a, b)
+            written[0] = cc[0]
+            written[1] = cc[1]
+
 
 class EncodedMotor:
-    def __init__(self, motor: Motor, index, encAPin: int|str, encBPin: int|str):
+    def __init__(self, motor: Motor, index, encAPin: int|str, encBPin: int|str, speed_index = None,
+                 scheduler: ControlScheduler = None):
+        # O controle roda a 50 Hz (velocidade em counts por 20 ms) no escalonador
+        # compartilhado entre todos os motores, então a taxa dele tem que ser múltipla de 50
+        scheduler = scheduler or ControlScheduler.default()
+        if scheduler.rate_hz % 50:
+            raise ValueError("a taxa do escalonador (%d Hz) deve ser múltipla de 50 Hz" % scheduler.rate_hz)
+
         self._motor = motor
-        self._encoder = _Encoder(index, encAPin, encBPin)
+        self._encoder = _Encoder(index, encAPin, encBPin, speed_index)
         self.brake_at_zero = True
 
         self.speedController = PID(
@@ -239,13 +1213,27 @@ class EncodedMotor:
             max_integral=50
         )
 
+        # Comando (velocidade alvo, NaN = sem alvo) e estado (posição, velocidade) em
+        # buffers pré-alocados, para o controle poder rodar no outro núcleo
+        self._command = array('f', [0.0])
+        self.state = SharedBuffer(2)
         self.target_speed = None
         self.prev_position = 0
         self.speed = 0
 
+        # Movimento em andamento (move_to): tabela de posições relativas a _profile_start
+        self._profile = None
+        self._profile_start = 0
+        self._profile_index = 0
+        # Correção de posição (counts por tick a cada count de erro) e erro aceito no fim
+        self.position_kp = 0.2
+        self.position_tolerance = 5
 
-        self.updateTimer = Timer(-1)
-        self.updateTimer.init(period=20, callback=lambda t: self._update())
+
+        self._scheduler = scheduler
+        self._update_callback = self._update
+        self._divider = scheduler.rate_hz // 50
+        self._scheduler.add(self._update_callback, self._divider)
 
         print("EncodedMotor inicializado com controle PID.")
 
@@ -259,12 +1247,24 @@ class EncodedMotor:
         self.brake_at_zero = brake_at_zero_effort
 
     def brake(self):
+        # A tarefa continua registrada (publicando 'state'); sem alvo (NaN) o controle
+        # não mexe no motor até o próximo set_speed() ou move_to()
+        self._release_control()
         self._motor.brake()
-        self.updateTimer.deinit()
 
     def coast(self):
+        self._release_control()
         self._motor.coast()
-        self.updateTimer.deinit()
+
+    def _release_control(self):
+        self._profile = None
+        self._command[0] = float('nan')
+
+    def _resume_control(self):
+        # Voltando de um motor parado: descarta o histórico do PID, senão o primeiro
+        # passo integra o erro sobre todo o tempo parado
+        if self._command[0] != self._command[0]:
+            self.speedController.clear_history()
 
     def get_position(self) -> float:
         invert = -1 if self._motor.flip_dir else 1
@@ -279,14 +1279,77 @@ class EncodedMotor:
     
     @property
     def get_speed(self) -> float:
+        if self._encoder.speed_sm is not None:
+            # Medida pelo PIO, em counts por segundo
+            return self.get_speed_counts() * 60 / self._encoder.resolution
         # Convert from counts per 20ms to RPM (60 sec/min, 50 Hz update rate)
         return self.speed * (60 * 50) / self._encoder.resolution
 
+    def get_speed_counts(self) -> int:
+        invert = -1 if self._motor.flip_dir else 1
+        return self._encoder.get_speed_counts() * invert
+
+    @property
+    def target_speed(self):
+        target = self._command[0]
+        return None if target != target else target
+
+    @target_speed.setter
+    def target_speed(self, value):
+        self._command[0] = float('nan') if value is None else value
+
+    def read_state(self, out):
+        """Preenche 'out' com (posição em counts, velocidade em counts/20ms) do último ciclo de controle."""
+        return self.state.read_into(out)
+
+    def move_to(self, position: float, max_speed_rpm: float = 60, max_accel_rpm_s: float = 120,
+                s_curve: bool = True):
+        """
+        Move até 'position' (em rotações, como get_position()) seguindo um perfil de
+        velocidade pré-calculado. O ciclo de controle só consulta a tabela.
+        """
+        resolution = self._encoder.resolution
+        start = self.get_position_counts()
+        # Unidades do ciclo de 50 Hz: counts por tick e counts por tick²
+        table = motion_profile(position * resolution - start,
+                               max_speed_rpm * resolution / (60 * 50),
+                               max_accel_rpm_s * resolution / (60 * 50 * 50),
+                               s_curve)
+        self._resume_control()
+        self._profile_start = start
+        self._profile_index = 0
+        self._profile = table
+
+    def is_moving(self) -> bool:
+        return self._profile is not None
+
+    def _follow_profile(self, position: int):
+        table = self._profile
+        i = self._profile_index
+        if i < len(table):
+            setpoint = self._profile_start + table[i]
+            feedforward = table[i] - table[i - 1] if i else table[0]
+            self._profile_index = i + 1
+        else:
+            setpoint = self._profile_start + table[-1]
+            feedforward = 0.0
+            if abs(setpoint - position) <= self.position_tolerance:
+                self._profile = None
+                self._command[0] = float('nan')
+                if self.brake_at_zero:
+                    self._motor.brake()
+                else:
+                    self._motor.coast()
+                return
+        self._command[0] = feedforward + self.position_kp * (setpoint - position)
+
     def set_speed(self, speed_rpm: float = None):
+        self._profile = None
         if speed_rpm is None or speed_rpm == 0:
             self.target_speed = None
             self.set_effort(0)
         else:
+            self._resume_control()
             # Convert from RPM to counts por 20ms (50Hz loop)
             self.target_speed = speed_rpm * self._encoder.resolution / (60 * 50)
 
@@ -307,11 +1370,25 @@ class EncodedMotor:
     def _update(self):
         try:
             current_position = self.get_position_counts()
-            self.speed = current_position - self.prev_position
+            if self._encoder.speed_sm is not None:
+                # Velocidade do PIO convertida para counts por 20ms (unidade do PID)
+                self.speed = self.get_speed_counts() / 50
+            else:
+                self.speed = current_position - self.prev_position
             self.prev_position = current_position
 
-            if self.target_speed is not None:
-                error = self.target_speed - self.speed
+            state = self.state
+            state.begin_write()
+            state.data[0] = current_position
+            state.data[1] = self.speed
+            state.end_write()
+
+            if self._profile is not None:
+                self._follow_profile(current_position)
+
+            target = self._command[0]
+            if target == target:   # NaN: sem velocidade alvo
+                error = target - self.speed
                 effort = self.speedController.update(error)
                 self._motor.set_effort(effort)
 
@@ -322,3 +1399,112 @@ class EncodedMotor:
         self.set_speed(0)
         self.brake()
 
+    def deinit(self):
+        """Tira o motor do escalonador, desliga-o e libera as state machines do encoder."""
+        self._scheduler.remove(self._update_callback)
+        self._release_control()
+        self._motor.coast()
+        self._encoder.deinit()
+
+
+class DifferentialDrive:
+    """
+    Tração diferencial com dois EncodedMotor. A odometria (x, y em metros e direção em
+    radianos) é integrada dentro do tick do ControlScheduler, sem trigonometria: a
+    direção é mantida como um vetor unitário (cos, sen) girado a cada passo.
+
+    Exemplo:
+        drive = DifferentialDrive(left, right, wheel_diameter=0.065, track_width=0.15)
+        drive.set_velocity(0.2, 0.5)     # 0.2 m/s para frente girando a 0.5 rad/s
+        pose = array('f', [0, 0, 0])
+        drive.read_pose(pose)            # x, y, direção
+    """
+    def __init__(self, left: EncodedMotor, right: EncodedMotor,
+                 wheel_diameter: float, track_width: float,
+                 scheduler: ControlScheduler = None, divider: int = 1):
+        self.left = left
+        self.right = right
+        self.track_width = track_width
+        self._wheel_circumference = math.pi * wheel_diameter
+        self._meters_per_count = self._wheel_circumference / _Encoder.resolution
+
+        # Pose publicada para o programa principal; o tick é o único escritor
+        self.pose = SharedBuffer(3)
+        # cos e sen da direção atual
+        self._heading = array('f', [1.0, 0.0])
+        self._last_counts = array('i', [left.get_position_counts(), right.get_position_counts()])
+        # Pose pedida por reset_pose(), aplicada no próximo tick: x, y, direção, pendente
+        self._reset = array('f', [0.0, 0.0, 0.0, 0.0])
+
+        # Registrada depois dos motores: integra no mesmo tick em que eles são atualizados
+        self._scheduler = scheduler or left._scheduler
+        self._update_callback = self._update_odometry
+        self._scheduler.add(self._update_callback, divider)
+
+    def set_velocity(self, linear: float, angular: float):
+        """Velocidade no referencial do robô: linear em m/s e angular em rad/s (anti-horário)."""
+        half_track = angular * self.track_width / 2
+        to_rpm = 60 / self._wheel_circumference
+        self.left.set_speed((linear - half_track) * to_rpm)
+        self.right.set_speed((linear + half_track) * to_rpm)
+
+    def stop(self):
+        self.left.stop()
+        self.right.stop()
+
+    def read_pose(self, out):
+        """Preenche 'out' (3 floats) com x, y e direção. Não aloca memória."""
+        return self.pose.read_into(out)
+
+    def reset_pose(self, x: float = 0.0, y: float = 0.0, heading: float = 0.0):
+        reset = self._reset
+        reset[0] = x
+        reset[1] = y
+        reset[2] = heading
+        reset[3] = 1.0
+
+    def _update_odometry(self):
+        left = self.left.get_position_counts()
+        right = self.right.get_position_counts()
+        last = self._last_counts
+        d_left = (left - last[0]) * self._meters_per_count
+        d_right = (right - last[1]) * self._meters_per_count
+        last[0] = left
+        last[1] = right
+
+        pose = self.pose
+        data = pose.data
+        heading = self._heading
+        reset = self._reset
+        if reset[3]:
+            pose.begin_write()
+            data[0], data[1], data[2] = reset[0], reset[1], reset[2]
+            pose.end_write()
+            heading[0] = math.cos(reset[2])
+            heading[1] = math.sin(reset[2])
+            reset[3] = 0.0
+            return
+
+        distance = (d_left + d_right) * 0.5
+        turn = (d_right - d_left) / self.track_width
+        cos, sin = heading[0], heading[1]
+
+        # Desloca usando a direção no meio do passo (integração de 2ª ordem)
+        half = turn * 0.5
+        pose.begin_write()
+        data[0] += distance * (cos - sin * half)
+        data[1] += distance * (sin + cos * half)
+        angle = data[2] + turn
+        if angle > math.pi:
+            angle -= 2 * math.pi
+        elif angle < -math.pi:
+            angle += 2 * math.pi
+        data[2] = angle
+        pose.end_write()
+
+        # Gira o vetor de direção (série de 2ª ordem) e corrige a norma, que deriva aos poucos
+        keep = 1 - turn * turn * 0.5
+        cos, sin = cos * keep - sin * turn, sin * keep + cos * turn
+        norm = (3 - (cos * cos + sin * sin)) * 0.5
+        heading[0] = cos * norm
+        heading[1] = sin * norm
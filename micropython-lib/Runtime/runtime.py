@@ -0,0 +1,222 @@
+from machine import Pin
+from micropython import const
+from array import array
+import asyncio
+import time
+
+from robotkit.Sensores.hcsr04 import HCSR04
+from robotkit.Sensores.tcs34725 import TCS34725
+from robotkit.Sensores.vl53l0x import VL53L0X
+from robotkit.Sensores.gy33 import GY33
+from robotkit.componentes.componentes import DigitalIn
+
+# Constantes com '_' dos drivers não ficam visíveis para import depois de compiladas
+_TCS_DATA_REGISTERS = (0x16, 0x18, 0x1a, 0x14)   # R, G, B e Clear
+_VL_SYSRANGE_START = const(0x00)
+_VL_SYSTEM_INTERRUPT_CLEAR = const(0x0B)
+_VL_RESULT_INTERRUPT_STATUS = const(0x13)
+_VL_RESULT_RANGE_STATUS = const(0x14)
+
+
+# --- Sensores assíncronos ---
+# Mesmos drivers, mas as esperas (conversões, eco, integração) liberam o asyncio
+# para as outras tarefas em vez de travar o núcleo.
+
+class AsyncHCSR04(HCSR04):
+    """HCSR04 que mede o eco por interrupção: 'await sensor.distance_mm()'."""
+    def __init__(self, trigger_pin, echo_pin, echo_timeout_us=500*2*30):
+        super().__init__(trigger_pin, echo_pin, echo_timeout_us)
+        # Instantes da subida e da descida do eco, gravados pela interrupção
+        self._edges = array('i', [0, 0])
+        self._done = asyncio.ThreadSafeFlag()
+        self.echo.irq(trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING, handler=self._on_echo, hard=True)
+
+    def _on_echo(self, pin):
+        if pin.value():
+            self._edges[0] = time.ticks_us()
+        else:
+            self._edges[1] = time.ticks_us()
+            self._done.set()
+
+    async def _send_pulse_and_wait(self):
+        self._done.clear()
+        self.trigger.value(0) # Stabilize the sensor
+        time.sleep_us(5)
+        self.trigger.value(1)
+        # Send a 10us pulse.
+        time.sleep_us(10)
+        self.trigger.value(0)
+        try:
+            await asyncio.wait_for_ms(self._done.wait(), self.echo_timeout_us // 1000 + 1)
+        except asyncio.TimeoutError:
+            return int(500 * 29.1) # Fora do alcance, como no driver síncrono
+        return time.ticks_diff(self._edges[1], self._edges[0])
+
+    async def distance_mm(self):
+        pulse_time = await self._send_pulse_and_wait()
+        return pulse_time * 100 // 582
+
+    async def distance_cm(self):
+        pulse_time = await self._send_pulse_and_wait()
+        return (pulse_time / 2) / 29.1
+
+    async def read(self):
+        return await self.distance_mm()
+
+
+class AsyncTCS34725(TCS34725):
+    """TCS34725 que espera a integração com asyncio: 'await sensor.read()'."""
+    async def read(self, raw=False):
+        was_active = self.active()
+        self.active(True)
+        while not self._valid():
+            await asyncio.sleep_ms(int(self._integration_time + 0.9))
+        data = tuple(self._register16(register) for register in _TCS_DATA_REGISTERS)
+        self.active(was_active)
+        if raw:
+            return data
+        return self._temperature_and_lux(data)
+
+
+class AsyncVL53L0X(VL53L0X):
+    """VL53L0X que consulta o status entre outras tarefas: 'await sensor.read()'."""
+    async def _wait_status(self, register, mask, ready):
+        start = time.ticks_ms()
+        while ((self._read_u8(register) & mask) != 0) != ready:
+            if (
+                self.io_timeout_ms > 0
+                and time.ticks_diff(time.ticks_ms(), start) >= self.io_timeout_ms
+            ):
+                raise RuntimeError("Timeout waiting for VL53L0X!")
+            await asyncio.sleep_ms(1)
+
+    async def read_range_continuous_millimeters(self):
+        await self._wait_status(_VL_RESULT_INTERRUPT_STATUS, 0x07, True)
+        range_mm = self._read_u16(_VL_RESULT_RANGE_STATUS + 10)
+        self._write_u8(_VL_SYSTEM_INTERRUPT_CLEAR, 0x01)
+        return range_mm
+
+    async def read_range_single_millimeters(self):
+        for pair in (
+            (0x80, 0x01),
+            (0xFF, 0x01),
+            (0x00, 0x00),
+            (0x91, self._stop_variable),
+            (0x00, 0x01),
+            (0xFF, 0x00),
+            (0x80, 0x00),
+            (_VL_SYSRANGE_START, 0x01),
+        ):
+            self._write_u8(pair[0], pair[1])
+        await self._wait_status(_VL_SYSRANGE_START, 0x01, False)
+        return await self.read_range_continuous_millimeters()
+
+    async def read(self):
+        if self._continuous_mode:
+            return await self.read_range_continuous_millimeters()
+        return await self.read_range_single_millimeters()
+
+
+class AsyncGY33(GY33):
+    """GY33 com a mesma interface assíncrona dos outros sensores: 'await sensor.read()'."""
+    async def read(self):
+        # O GY33 converte continuamente: a leitura é só a transação I2C
+        await asyncio.sleep_ms(0)
+        return self.read_calibrated()
+
+
+class AsyncDigitalIn(DigitalIn):
+    """DigitalIn com eventos por interrupção: 'await button.wait_for(1)'."""
+    def __init__(self, pin: int, Pull_type: bool|str = 0, debounce_ms: int = 20):
+        super().__init__(pin, Pull_type)
+        self.enable_events(debounce_ms=debounce_ms)
+        self._out = array('i', [0, 0])
+
+    async def wait_for(self, level: int):
+        """Espera um evento com o nível pedido e retorna o instante dele (ticks_us)."""
+        out = self._out
+        while True:
+            await self.wait_event(out)
+            if out[1] == level:
+                return out[0]
+
+    async def read(self):
+        return self.value
+
+
+# --- Runtime ---
+
+class Robot:
+    """
+    Runtime assíncrono do robô: registra tarefas periódicas e contínuas e as executa
+    juntas em um único núcleo com asyncio.
+
+    Exemplo:
+        robot = Robot()
+
+        @robot.every(20)
+        def control():
+            ...
+
+        @robot.task
+        async def sensors():
+            while True:
+                distance = await ultrasonic.read()
+
+        robot.run()
+    """
+    def __init__(self):
+        self._periodic = []
+        self._tasks = []
+        self._running = False
+        # Quantas vezes cada tarefa periódica perdeu o próprio período
+        self.overruns = {}
+
+    def every(self, period_ms: int):
+        """Decorador: executa a função (normal ou async) a cada 'period_ms'."""
+        def register(func):
+            self._periodic.append((period_ms, func))
+            return func
+        return register
+
+    def task(self, func):
+        """Decorador: executa a função async como tarefa contínua."""
+        self._tasks.append(func)
+        return func
+
+    async def _run_periodic(self, period_ms: int, func):
+        name = func.__name__
+        self.overruns[name] = 0
+        next_run = time.ticks_ms()
+        while self._running:
+            result = func()
+            if hasattr(result, "send"):
+                await result
+            next_run = time.ticks_add(next_run, period_ms)
+            delay = time.ticks_diff(next_run, time.ticks_ms())
+            if delay < 0:
+                # Atrasou: conta e recomeça a partir de agora, sem acumular execuções
+                self.overruns[name] += 1
+                next_run = time.ticks_ms()
+                delay = 0
+            await asyncio.sleep_ms(delay)
+
+    async def _main(self):
+        self._running = True
+        tasks = [asyncio.create_task(self._run_periodic(period, func)) for period, func in self._periodic]
+        tasks += [asyncio.create_task(func()) for func in self._tasks]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self._running = False
+
+    def run(self):
+        """Executa todas as tarefas registradas até stop() ou Ctrl+C."""
+        try:
+            asyncio.run(self._main())
+        finally:
+            asyncio.new_event_loop()
+
+    def stop(self):
+        """Encerra as tarefas periódicas no fim do período atual."""
+        self._running = False
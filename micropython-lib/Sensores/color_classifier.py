@@ -0,0 +1,76 @@
+import json
+from array import array
+
+
+def chroma_into(values, out):
+    """
+    Converte R, G e B em proporções de 0 a 255 (R + G + B = 255), que mudam pouco com
+    a distância e a iluminação. Canais além do terceiro são copiados sem alteração.
+    """
+    total = values[0] + values[1] + values[2]
+    if total <= 0:
+        total = 1
+    for i in range(3):
+        out[i] = values[i] * 255 // total
+    for i in range(3, len(out)):
+        out[i] = values[i]
+    return out
+
+
+class ColorClassifier:
+    """
+    Classifica uma leitura de cor (GY33 ou TCS34725) pelo centróide mais próximo, com
+    distância de Manhattan em inteiros e sem alocar memória a cada chamada.
+    Os centróides vêm do comando 'robot colors' (arquivo JSON) ou podem ser passados
+    diretamente.
+
+    Exemplo:
+        classifier = ColorClassifier.load("colors.json")
+        values = array('i', [0, 0, 0, 0])
+        sensor.read_calibrated_into(values)
+        color = classifier.label(values)     # ex.: "verde", ou None se não reconhecida
+    """
+    def __init__(self, labels, centroids, chroma: bool = False, max_distance: int = None):
+        self.labels = list(labels)
+        self.channels = len(centroids[0])
+        self.chroma = chroma
+        # Distância máxima para aceitar uma cor; acima disso classify() retorna -1
+        self.max_distance = max_distance
+        self._centroids = array('i', [value for centroid in centroids for value in centroid])
+        self._features = array('i', [0] * self.channels)
+        self.distance = 0  # Distância da última classificação
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data["labels"], data["centroids"], data.get("chroma", False), data.get("max_distance"))
+
+    def classify(self, values) -> int:
+        """Índice da cor mais próxima em 'labels', ou -1 se passar de max_distance."""
+        features = self._features
+        if self.chroma:
+            chroma_into(values, features)
+        else:
+            for i in range(self.channels):
+                features[i] = values[i]
+
+        centroids, channels = self._centroids, self.channels
+        best, best_distance = -1, 0x3FFFFFFF
+        for index in range(len(self.labels)):
+            base = index * channels
+            distance = 0
+            for i in range(channels):
+                diff = features[i] - centroids[base + i]
+                distance += diff if diff >= 0 else -diff
+            if distance < best_distance:
+                best, best_distance = index, distance
+
+        self.distance = best_distance
+        if self.max_distance is not None and best_distance > self.max_distance:
+            return -1
+        return best
+
+    def label(self, values):
+        index = self.classify(values)
+        return self.labels[index] if index >= 0 else None
@@ -1,10 +1,24 @@
-
 import struct
+from array import array
+
+try:
+    from robotkit.Calibration import calibration
+except ImportError:
+    calibration = None
 
 class GY33:
-    def __init__(self, i2c, addr=90):
+    def __init__(self, i2c, addr=90, calibration_key: str = None):
         self.i2c = i2c
         self.addr = addr
+        # Chave no arquivo de calibração da placa (ex.: "gy33"). Com ela, a calibração
+        # salva é carregada aqui; calibrate_white()/calibrate_black() só mudam a da memória
+        # e save_calibration() a grava, para não gastar a flash a cada chamada
+        self.calibration_key = calibration_key
+
+        # Buffers pré-alocados: as leituras *_into() não criam objetos novos
+        self._buf = bytearray(16)
+        self._raw_buf = memoryview(self._buf)[:8]
+        self._raw = array('i', [0, 0, 0, 0])
 
         # Reasonable defaults with led at max
         self.cal = [
@@ -13,6 +27,45 @@ class GY33:
             [170, 2162],
             [439, 5838]
         ]
+        # Escalas da calibração: valor = ((raw - preto) * escala) >> deslocamento
+        self._offset = array('i', [0, 0, 0, 0])
+        self._scale = array('i', [0, 0, 0, 0])
+        self._shift = array('B', [0, 0, 0, 0])
+        self._update_scales()
+        self._load_calibration()
+
+    def _load_calibration(self):
+        if calibration is None or not self.calibration_key:
+            return
+        data = calibration.load(self.calibration_key)
+        if data is not None and len(data) == 16:
+            values = struct.unpack('<8H', data)
+            self.set_calibration([values[2 * i:2 * i + 2] for i in range(4)])
+
+    def save_calibration(self):
+        """Grava 'cal' no arquivo de calibração (precisa de calibration_key)."""
+        if calibration is None or not self.calibration_key:
+            return
+        values = [min(0xFFFF, max(0, value)) for pair in self.cal for value in pair]
+        calibration.save(self.calibration_key, struct.pack('<8H', *values))
+
+    def _update_scales(self):
+        # Escolhe, por canal, o maior deslocamento com escala < 2**14: como |raw - preto|
+        # cabe em 16 bits, o produto continua um inteiro pequeno (sem alocar)
+        for i in range(4):
+            black, white = self.cal[i]
+            span = max(1, white - black)
+            shift = 0
+            while shift < 24 and (255 << (shift + 1)) // span < 16384:
+                shift += 1
+            self._offset[i] = black
+            self._scale[i] = (255 << shift) // span
+            self._shift[i] = shift
+
+    def set_calibration(self, cal):
+        """Define a calibração ([[preto, branco], ...] de R, G, B e Clear)."""
+        self.cal = [[black, white] for black, white in cal]
+        self._update_scales()
 
     # From 0 (off) to 10 (max)
     def set_led(self, pwr=0):
@@ -26,31 +79,52 @@ class GY33:
 
     # Returns [Raw Red, Raw Green, Raw Blue, Clear, Lux, Color Temperature, Red, Green, Blue, Color]
     def read_all(self):
-        data = self.i2c.readfrom_mem(self.addr, 0x00, 16)
-        return struct.unpack('>HHHHHHBBBB', data)
+        self.i2c.readfrom_mem_into(self.addr, 0x00, self._buf)
+        return struct.unpack('>HHHHHHBBBB', self._buf)
+
+    def read_all_into(self, out):
+        """Preenche 'out' (10 itens) com os mesmos valores de read_all()."""
+        buf = self._buf
+        self.i2c.readfrom_mem_into(self.addr, 0x00, buf)
+        for i in range(6):
+            out[i] = (buf[2 * i] << 8) | buf[2 * i + 1]
+        for i in range(4):
+            out[6 + i] = buf[12 + i]
+        return out
 
     # Returns [Raw Red, Raw Green, Raw Blue, Clear]
     def read_raw(self):
-        data = self.i2c.readfrom_mem(self.addr, 0x00, 8)
-        return struct.unpack('>HHHH', data)
+        self.i2c.readfrom_mem_into(self.addr, 0x00, self._raw_buf)
+        return struct.unpack('>HHHH', self._raw_buf)
+
+    def read_raw_into(self, out):
+        """Preenche 'out' (4 itens) com R, G, B e Clear sem calibração."""
+        buf = self._raw_buf
+        self.i2c.readfrom_mem_into(self.addr, 0x00, buf)
+        for i in range(4):
+            out[i] = (buf[2 * i] << 8) | buf[2 * i + 1]
+        return out
 
     # Returns calibrated Red, Green, Blue, Clear
     def read_calibrated(self):
-        data = self.i2c.readfrom_mem(self.addr, 0x00, 8)
-        color = struct.unpack('>HHHH', data)
-        result = [0,0,0,0]
+        return list(self.read_calibrated_into(array('i', [0, 0, 0, 0])))
+
+    def read_calibrated_into(self, out):
+        """Preenche 'out' (ex.: array('i', [0] * 4)) com R, G, B e Clear calibrados. Não aloca memória."""
+        raw = self.read_raw_into(self._raw)
+        offset, scale, shift = self._offset, self._scale, self._shift
         for i in range(4):
-            result[i] = 255 * (color[i] - self.cal[i][0]) // (self.cal[i][1] - self.cal[i][0])
-        return result
+            out[i] = ((raw[i] - offset[i]) * scale[i]) >> shift[i]
+        return out
 
     def calibrate_white(self):
-        data = self.i2c.readfrom_mem(self.addr, 0x00, 8)
-        color = struct.unpack('>HHHH', data)
+        raw = self.read_raw_into(self._raw)
         for i in range(4):
-            self.cal[i][1] = color[i]
+            self.cal[i][1] = raw[i]
+        self._update_scales()
 
     def calibrate_black(self):
-        data = self.i2c.readfrom_mem(self.addr, 0x00, 8)
-        color = struct.unpack('>HHHH', data)
+        raw = self.read_raw_into(self._raw)
         for i in range(4):
-            self.cal[i][0] = color[i]
\ No newline at end of file
+            self.cal[i][0] = raw[i]
+        self._update_scales()
@@ -46,6 +46,11 @@ Implementation Notes
 import time
 from micropython import const
 
+try:
+    from robotkit.Calibration import calibration
+except ImportError:
+    calibration = None
+
 # Configuration constants:
 _SYSRANGE_START = const(0x00)
 _SYSTEM_THRESH_HIGH = const(0x0C)
@@ -149,10 +154,17 @@ class VL53L0X:
     _BUFFER_24 = bytearray(3)
     _BUFFER_40 = bytearray(5)
 
-    def __init__(self, i2c, address=41, io_timeout_ms=0):
+    def __init__(self, i2c, address=41, io_timeout_ms=0, calibration_key=None):
         self._i2c = i2c
         self._address = address
         self.io_timeout_ms = io_timeout_ms
+        # Key in the board calibration file (e.g. "vl53l0x_front"). When set, the
+        # SPAD and reference calibration are loaded from it instead of measured,
+        # and saved there the first time they are measured. Use one key per
+        # sensor: the values belong to each part. Remove the key to recalibrate
+        # (e.g. after a large temperature change).
+        self.calibration_key = calibration_key
+        stored = self._load_calibration()
         self._continuous_mode = False
         # Check identification registers for expected values.
         # From section 3.2 of the datasheet.
@@ -180,17 +192,22 @@ class VL53L0X:
         # second)
         self.signal_rate_limit = 0.25
         self._write_u8(_SYSTEM_SEQUENCE_CONFIG, 0xFF)
-        spad_count, spad_is_aperture = self._get_spad_info()
-        # The SPAD map (RefGoodSpadMap) is read by
-        # VL53L0X_get_info_from_device() in the API, but the same data seems to
-        # be more easily readable from GLOBAL_CONFIG_SPAD_ENABLES_REF_0 through
-        # _6, so read it from there.
-        ref_spad_map = bytearray(6)
+        if stored is None:
+            spad_count, spad_is_aperture = self._get_spad_info()
+            # The SPAD map (RefGoodSpadMap) is read by
+            # VL53L0X_get_info_from_device() in the API, but the same data seems to
+            # be more easily readable from GLOBAL_CONFIG_SPAD_ENABLES_REF_0 through
+            # _6, so read it from there.
+            ref_spad_map = bytearray(6)
+
+            self._BUFFER_8[0] = _GLOBAL_CONFIG_SPAD_ENABLES_REF_0
+            self._i2c.writeto(self._address, self._BUFFER_8)
+            self._i2c.readfrom_into(self._address, ref_spad_map)
+        else:
+            # Stored map already has only the reference SPADs enabled
+            ref_spad_map = stored[1:7]
 
         self._BUFFER_8[0] = _GLOBAL_CONFIG_SPAD_ENABLES_REF_0
-        self._i2c.writeto(self._address, self._BUFFER_8)
-        self._i2c.readfrom_into(self._address, ref_spad_map)
-
         ref_spad_map = self._BUFFER_8 + ref_spad_map
 
         for pair in (
@@ -202,16 +219,17 @@ class VL53L0X:
         ):
             self._write_u8(pair[0], pair[1])
 
-        first_spad_to_enable = 12 if spad_is_aperture else 0
-        spads_enabled = 0
-        for i in range(48):
-            if i < first_spad_to_enable or spads_enabled == spad_count:
-                # This bit is lower than the first one that should be enabled,
-                # or (reference_spad_count) bits have already been enabled, so
-                # zero this bit.
-                ref_spad_map[1 + (i // 8)] &= ~(1 << (i % 8))
-            elif (ref_spad_map[1 + (i // 8)] >> (i % 8)) & 0x1 > 0:
-                spads_enabled += 1
+        if stored is None:
+            first_spad_to_enable = 12 if spad_is_aperture else 0
+            spads_enabled = 0
+            for i in range(48):
+                if i < first_spad_to_enable or spads_enabled == spad_count:
+                    # This bit is lower than the first one that should be enabled,
+                    # or (reference_spad_count) bits have already been enabled, so
+                    # zero this bit.
+                    ref_spad_map[1 + (i // 8)] &= ~(1 << (i % 8))
+                elif (ref_spad_map[1 + (i // 8)] >> (i % 8)) & 0x1 > 0:
+                    spads_enabled += 1
 
         self._i2c.writeto(self._address, ref_spad_map)
 
@@ -308,13 +326,50 @@ class VL53L0X:
         self._measurement_timing_budget_us = self.measurement_timing_budget
         self._write_u8(_SYSTEM_SEQUENCE_CONFIG, 0xE8)
         self.measurement_timing_budget = self._measurement_timing_budget_us
-        self._write_u8(_SYSTEM_SEQUENCE_CONFIG, 0x01)
-        self._perform_single_ref_calibration(0x40)
-        self._write_u8(_SYSTEM_SEQUENCE_CONFIG, 0x02)
-        self._perform_single_ref_calibration(0x00)
+        if stored is None:
+            self._write_u8(_SYSTEM_SEQUENCE_CONFIG, 0x01)
+            self._perform_single_ref_calibration(0x40)
+            self._write_u8(_SYSTEM_SEQUENCE_CONFIG, 0x02)
+            self._perform_single_ref_calibration(0x00)
+            vhv_settings, phase_cal = self._ref_calibration_io()
+            self._save_calibration(ref_spad_map[1:], vhv_settings, phase_cal)
+        else:
+            self._ref_calibration_io(stored[7], stored[8])
         # "restore the previous Sequence Config"
         self._write_u8(_SYSTEM_SEQUENCE_CONFIG, 0xE8)
 
+    def _load_calibration(self):
+        # Stored blob: SPAD map (6 bytes), VHV settings and phase calibration.
+        if calibration is None or not self.calibration_key:
+            return None
+        data = calibration.load(self.calibration_key)
+        if data is None or len(data) != 9 or data[0] != 1:
+            return None
+        return data
+
+    def _save_calibration(self, ref_spad_map, vhv_settings, phase_cal):
+        if calibration is None or not self.calibration_key:
+            return
+        calibration.save(
+            self.calibration_key,
+            bytes((1,)) + bytes(ref_spad_map) + bytes((vhv_settings, phase_cal)),
+        )
+
+    def _ref_calibration_io(self, vhv_settings=None, phase_cal=None):
+        # Reads (no arguments) or writes the VHV and phase calibration results.
+        # Based on VL53L0X_ref_calibration_io() from ST API.
+        for pair in ((0xFF, 0x01), (0x00, 0x00), (0xFF, 0x00)):
+            self._write_u8(pair[0], pair[1])
+        if vhv_settings is None:
+            vhv_settings = self._read_u8(0xCB)
+            phase_cal = self._read_u8(0xEE) & 0xEF
+        else:
+            self._write_u8(0xCB, vhv_settings)
+            self._write_u8(0xEE, (self._read_u8(0xEE) & 0x80) | phase_cal)
+        for pair in ((0xFF, 0x01), (0x00, 0x01), (0xFF, 0x00)):
+            self._write_u8(pair[0], pair[1])
+        return vhv_settings, phase_cal
+
     def _read_u8(self, address):
         # Read an 8-bit unsigned value from the specified 8-bit address.
         self._BUFFER_8[0] = address & 0xFF
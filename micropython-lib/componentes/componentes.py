@@ -1,4 +1,18 @@
-from machine import Pin, ADC, PWM
+from machine import Pin, ADC, PWM, Timer, mem32, idle
+from micropython import const
+from array import array
+import micropython
+import uctypes
+import time
+import rp2
+
+
+# Índices do estado dos eventos do DigitalIn
+_EV_HEAD = const(0)
+_EV_TAIL = const(1)
+_EV_LAST_TIME = const(2)
+_EV_LAST_LEVEL = const(3)
+_EV_DROPPED = const(4)
 
 
 class DigitalIn:
@@ -10,6 +24,10 @@ class DigitalIn:
         elif Pull_type in ["FALSE", "LOW", "PULL_DOWN"]:
             self.pin = Pin(pin, Pin.IN, Pin.PULL_DOWN)
             self.Pull_type = False 
+        elif Pull_type in ["NONE", "NO_PULL"]:
+            # Sem pull interno (resistor externo); pressionado = nível alto
+            self.pin = Pin(pin, Pin.IN)
+            self.Pull_type = False
         else:
             raise ValueError("Erro ao criar Botão: Pull_type não identificado")
 
@@ -36,16 +54,169 @@ class DigitalIn:
             self.pin.irq(trigger=Pin.IRQ_RISING, handler=func)
         else:
             raise TypeError("trigger especificado não encontrado")
+
+    def enable_events(self, trigger: str = "BOTH", debounce_ms: int = 20, callback=None, size: int = 16):
+        """
+        Registra as bordas do pino por interrupção, sem polling. Cada evento guarda o
+        instante (time.ticks_us) e o nível lido em um buffer circular pré-alocado;
+        bordas a menos de 'debounce_ms' da anterior são descartadas.
+        Os eventos podem ser lidos com read_event(), esperados com wait_for() ou
+        await wait_event(), ou entregues a callback(level, ticks_us) via micropython.schedule.
+        """
+        triggers = {
+            "RISING": Pin.IRQ_RISING,
+            "FALLING": Pin.IRQ_FALLING,
+            "BOTH": Pin.IRQ_RISING | Pin.IRQ_FALLING,
+        }
+        trigger = trigger.upper()
+        if trigger not in triggers:
+            raise TypeError("trigger especificado não encontrado")
+
+        self._event_times = array('i', [0] * size)
+        self._event_levels = array('B', [0] * size)
+        self._event_state = array('i', [0, 0, 0, self.pin.value(), 0])
+        self._event_state[_EV_LAST_TIME] = time.ticks_add(time.ticks_us(), -debounce_ms * 1000)
+        self._event_out = array('i', [0, 0])
+        # Com uma borda só, duas seguidas têm o mesmo nível e não podem ser descartadas por isso
+        self._both_edges = trigger == "BOTH"
+        self.debounce_us = debounce_ms * 1000
+        self.event_callback = callback
+        self._dispatch_ref = self._dispatch   # Método ligado criado uma vez (a IRQ não aloca)
+
+        try:
+            from asyncio import ThreadSafeFlag
+            self.event_flag = ThreadSafeFlag()
+        except ImportError:
+            self.event_flag = None
+
+        self.pin.irq(trigger=triggers[trigger], handler=self._on_edge, hard=True)
+
+    def disable_events(self):
+        self.pin.irq(handler=None)
+
+    @property
+    def dropped_events(self) -> int:
+        """Eventos perdidos porque o buffer estava cheio."""
+        return self._event_state[_EV_DROPPED]
+
+    def _on_edge(self, pin):
+        # IRQ "hard": não pode alocar memória
+        now = time.ticks_us()
+        level = pin.value()
+        state = self._event_state
+        if time.ticks_diff(now, state[_EV_LAST_TIME]) < self.debounce_us:
+            return
+        if self._both_edges and level == state[_EV_LAST_LEVEL]:
+            return
+        state[_EV_LAST_TIME] = now
+        state[_EV_LAST_LEVEL] = level
+
+        head = state[_EV_HEAD]
+        next_head = (head + 1) % len(self._event_times)
+        if next_head == state[_EV_TAIL]:
+            state[_EV_DROPPED] += 1
+            return
+        self._event_times[head] = now
+        self._event_levels[head] = level
+        state[_EV_HEAD] = next_head
+
+        if self.event_flag is not None:
+            self.event_flag.set()
+        if self.event_callback is not None:
+            try:
+                micropython.schedule(self._dispatch_ref, None)
+            except RuntimeError:
+                pass  # Fila do schedule cheia: o próximo evento entrega este também
+
+    def clear_events(self):
+        self._event_state[_EV_TAIL] = self._event_state[_EV_HEAD]
+
+    def events_pending(self) -> bool:
+        return self._event_state[_EV_HEAD] != self._event_state[_EV_TAIL]
+
+    def read_event(self, out) -> bool:
+        """Retira o evento mais antigo para 'out' (ticks_us, nível). Retorna False se não houver."""
+        state = self._event_state
+        tail = state[_EV_TAIL]
+        if tail == state[_EV_HEAD]:
+            return False
+        out[0] = self._event_times[tail]
+        out[1] = self._event_levels[tail]
+        state[_EV_TAIL] = (tail + 1) % len(self._event_times)
+        return True
+
+    def _dispatch(self, _):
+        out = self._event_out
+        while self.read_event(out):
+            self.event_callback(out[1], out[0])
+
+    def wait_for(self, level: int, timeout_ms: int = None):
+        """
+        Dorme (machine.idle) até um evento com o nível pedido. Retorna o instante do
+        evento em ticks_us, ou None se o tempo acabar. Requer enable_events().
+        """
+        start = time.ticks_ms()
+        out = self._event_out
+        while True:
+            while self.read_event(out):
+                if out[1] == level:
+                    return out[0]
+            if timeout_ms is not None and time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+                return None
+            idle()
+
+    async def wait_event(self, out):
+        """Espera (sem bloquear outras tarefas do asyncio) o próximo evento e o retira para 'out'."""
+        while not self.read_event(out):
+            await self.event_flag.wait()
+        return out
     
 
 
+_VREF_MV = 3300  # Tensão de referência do ADC do RP2040, em milivolts
+
+# Registradores usados pelo AnalogScanner (RP2040)
+_ADC_BASE = const(0x4004c000)
+_ADC_CS = const(0x00)
+_ADC_FCS = const(0x08)
+_ADC_FIFO = const(0x0c)
+_ADC_DIV = const(0x10)
+_ADC_CLOCK = const(48000000)
+_DREQ_ADC = const(36)
+_DMA_BASE = const(0x50000000)
+_DMA_AL2_WRITE_ADDR_TRIG = const(0x2c)
+
+
 class AnalogIn:
-    def __init__(self, pin: int):
+    def __init__(self, pin: int, oversample: int = 1):
         self.pin = ADC(Pin(pin))
+        # Quantidade de leituras somadas em cada valor (média inteira, sem floats)
+        self.oversample = max(1, min(oversample, 16383))
         
     @property
     def value(self):
-        return self.pin.read_u16()
+        if self.oversample == 1:
+            return self.pin.read_u16()
+        return self.read_average(self.oversample)
+
+    def read_average(self, samples: int) -> int:
+        # Até 16383 amostras a soma continua sendo um inteiro pequeno (sem alocar)
+        read = self.pin.read_u16
+        total = 0
+        for _ in range(samples):
+            total += read()
+        return total // samples
+
+    def read_into(self, buf):
+        """Preenche 'buf' (ex.: array('H', [0] * 64)) com leituras seguidas e o retorna."""
+        read = self.pin.read_u16
+        for i in range(len(buf)):
+            buf[i] = read()
+        return buf
+
+    @property
+    def millivolts(self) -> int:
+        return self.value * _VREF_MV // 65535
     
     @property
     def percentage(self):
@@ -55,6 +226,216 @@ class AnalogIn:
     def voltage(self):
         return(self.value/65535) * 3.3
 
+class AnalogScanner:
+    """
+    Lê vários pinos analógicos (26 a 29) continuamente, sem ocupar o processador: o
+    ADC percorre os canais em round-robin e o DMA copia as amostras da FIFO do ADC
+    para um buffer duplo. Enquanto um bloco é preenchido, o outro fica completo e é
+    usado pelas médias. Enquanto estiver ativo, não use AnalogIn nesses pinos.
+
+    Exemplo:
+        scanner = AnalogScanner((26, 27, 28), rate_hz=2000)
+        scanner.value(0)        # última leitura do pino 26 (0 a 65535)
+        scanner.millivolts(2)   # média do último bloco do pino 28, em mV
+    """
+    def __init__(self, pins, rate_hz: int = 1000, block: int = 16):
+        channels = sorted(set(pin - 26 for pin in pins))
+        if not channels or channels[0] < 0 or channels[-1] > 3:
+            raise ValueError("AnalogScanner aceita apenas os pinos 26 a 29")
+        # Cria os ADC só para configurar os pinos como entradas analógicas
+        self._adcs = [ADC(Pin(pin)) for pin in pins]
+        self._count = len(channels)
+        # Posição de cada pino na sequência do round-robin (ordem crescente de canal)
+        self._order = [channels.index(pin - 26) for pin in pins]
+
+        # Período de cada conversão em ciclos do clock de 48 MHz: 1 + INT + FRAC/256
+        whole, rest = divmod(_ADC_CLOCK, rate_hz * self._count)
+        if not 96 <= whole <= 65536:
+            raise ValueError("rate_hz fora do alcance do ADC")
+        divider = ((whole - 1) << 8) | ((rest << 8) // (rate_hz * self._count))
+
+        # Cada metade do buffer guarda 'block' amostras de cada canal, intercaladas
+        self.block = block
+        self._half = block * self._count
+        self._samples = array('H', [0] * (2 * self._half))
+        self._base = uctypes.addressof(self._samples)
+        # Endereço de cada metade; o canal de controle lê a tabela em anel de 8 bytes
+        # (os buffers do heap do MicroPython são alinhados a 16 bytes)
+        self._table = array('I', [self._base, self._base + 2 * self._half])
+
+        mem32[_ADC_BASE + _ADC_CS] = 1                      # Liga o ADC, sem converter
+        mem32[_ADC_BASE + _ADC_FCS] = 1 | (1 << 3) | (1 << 24)  # FIFO com DREQ a cada amostra
+        while not mem32[_ADC_BASE + _ADC_FCS] & (1 << 8):   # Esvazia a FIFO
+            mem32[_ADC_BASE + _ADC_FIFO]
+        mem32[_ADC_BASE + _ADC_DIV] = divider
+
+        # O canal de dados copia um bloco e aciona o de controle, que escreve o início
+        # da outra metade no WRITE_ADDR_TRIG do canal de dados e o dispara de novo
+        self._data = rp2.DMA()
+        self._control = rp2.DMA()
+        self._control.config(
+            read=uctypes.addressof(self._table) + 4,
+            write=_DMA_BASE + 0x40 * self._data.channel + _DMA_AL2_WRITE_ADDR_TRIG,
+            count=1,
+            ctrl=self._control.pack_ctrl(size=2, inc_read=True, inc_write=False,
+                                         ring_size=3, ring_sel=False, treq_sel=0x3f,
+                                         chain_to=self._control.channel, irq_quiet=True))
+        self._data.config(
+            read=_ADC_BASE + _ADC_FIFO, write=self._base, count=self._half,
+            ctrl=self._data.pack_ctrl(size=1, inc_read=False, inc_write=True,
+                                      treq_sel=_DREQ_ADC, chain_to=self._control.channel,
+                                      irq_quiet=True),
+            trigger=True)
+
+        mask = 0
+        for channel in channels:
+            mask |= 1 << channel
+        # Começa pelo primeiro canal e converte sem parar (START_MANY)
+        mem32[_ADC_BASE + _ADC_CS] = 1 | (1 << 3) | (channels[0] << 12) | (mask << 16)
+
+    def _position(self) -> int:
+        # Índice da próxima amostra a ser escrita
+        return ((self._data.write - self._base) >> 1) % (2 * self._half)
+
+    def raw(self, i: int) -> int:
+        """Última amostra (12 bits) do i-ésimo pino."""
+        total = 2 * self._half
+        last = (self._position() - 1) % total
+        # A amostra k é do canal na posição k % quantidade de canais
+        return self._samples[(last - (last - self._order[i]) % self._count) % total]
+
+    def value(self, i: int) -> int:
+        """Última leitura do i-ésimo pino, na escala de 0 a 65535 do read_u16()."""
+        raw = self.raw(i)
+        return (raw << 4) | (raw >> 8)
+
+    def raw_average(self, i: int) -> int:
+        """Média (12 bits) do i-ésimo pino no último bloco completo."""
+        done = 0 if self._position() >= self._half else 1
+        samples, step = self._samples, self._count
+        start = done * self._half + self._order[i]
+        total = 0
+        for k in range(start, start + self._half, step):
+            total += samples[k]
+        return total // self.block
+
+    def average(self, i: int) -> int:
+        raw = self.raw_average(i)
+        return (raw << 4) | (raw >> 8)
+
+    def millivolts(self, i: int) -> int:
+        return self.raw_average(i) * _VREF_MV // 4095
+
+    def read_into(self, out):
+        """Preenche 'out' com a última leitura (0 a 65535) de cada pino."""
+        for i in range(len(self._order)):
+            out[i] = self.value(i)
+        return out
+
+    def stop(self):
+        mem32[_ADC_BASE + _ADC_CS] = 1
+        self._data.active(0)
+        self._control.active(0)
+        self._data.close()
+        self._control.close()
+        mem32[_ADC_BASE + _ADC_FCS] = 0
+
+
+class LineSensorArray:
+    """
+    Conjunto de sensores de refletância (AnalogIn) para seguir linha. Após a
+    calibração, cada leitura vira um valor de 0 (fundo) a 1000 (linha) e a posição da
+    linha é o centróide ponderado, de 0 (sobre o primeiro sensor) a 1000 * (N - 1).
+    Tudo em inteiros e em buffers pré-alocados: read_position() não aloca memória.
+
+    Exemplo:
+        line = LineSensorArray((26, 27, 28))
+        for _ in range(200):           # passe os sensores sobre a linha e o fundo
+            line.calibrate()
+        error = line.read_position() - line.center
+    """
+    def __init__(self, sensors, white_line: bool = False, threshold: int = 200):
+        # Aceita pinos ou objetos AnalogIn já criados
+        self.sensors = [sensor if isinstance(sensor, AnalogIn) else AnalogIn(sensor) for sensor in sensors]
+        self._reads = [
+            sensor.pin.read_u16 if sensor.oversample == 1
+            else (lambda sensor=sensor: sensor.read_average(sensor.oversample))
+            for sensor in self.sensors
+        ]
+        count = len(self.sensors)
+        self.white_line = white_line
+        # Valor calibrado mínimo (0 a 1000) em algum sensor para considerar que há linha
+        self.threshold = threshold
+        self.center = 500 * (count - 1)
+        self.line_lost = True
+
+        self.raw = array('H', [0] * count)
+        self.values = array('H', [0] * count)
+        self._min = array('H', [65535] * count)
+        self._max = array('H', [0] * count)
+        self._position = self.center
+
+    def read_raw(self):
+        reads, raw = self._reads, self.raw
+        for i in range(len(raw)):
+            raw[i] = reads[i]()
+        return raw
+
+    def calibrate(self):
+        """Lê os sensores e atualiza o mínimo e o máximo de cada um."""
+        raw = self.read_raw()
+        for i in range(len(raw)):
+            if raw[i] < self._min[i]:
+                self._min[i] = raw[i]
+            if raw[i] > self._max[i]:
+                self._max[i] = raw[i]
+
+    def reset_calibration(self):
+        for i in range(len(self.raw)):
+            self._min[i] = 65535
+            self._max[i] = 0
+
+    def read_calibrated(self):
+        """Preenche 'values' com cada sensor na escala de 0 (fundo) a 1000 (linha)."""
+        raw, values = self.read_raw(), self.values
+        for i in range(len(raw)):
+            low, high = self._min[i], self._max[i]
+            if high <= low:
+                value = 0
+            elif raw[i] <= low:
+                value = 0
+            elif raw[i] >= high:
+                value = 1000
+            else:
+                value = (raw[i] - low) * 1000 // (high - low)
+            values[i] = 1000 - value if self.white_line else value
+        return values
+
+    def read_position(self) -> int:
+        """
+        Posição da linha de 0 a 1000 * (N - 1). Se nenhum sensor passar do 'threshold',
+        marca line_lost e retorna o extremo do lado em que a linha foi vista por último.
+        """
+        values = self.read_calibrated()
+        weighted = 0
+        total = 0
+        strongest = 0
+        for i in range(len(values)):
+            value = values[i]
+            weighted += value * i * 1000
+            total += value
+            if value > strongest:
+                strongest = value
+
+        # Sem nenhum sensor acima de zero (ex.: threshold=0 ou sem calibração) não há
+        # centróide: conta como linha perdida em vez de dividir por zero
+        self.line_lost = total == 0 or strongest < self.threshold
+        if self.line_lost:
+            return 0 if self._position < self.center else 2 * self.center
+        self._position = weighted // total
+        return self._position
+
+
 class DigitalOut:
     def __init__(self, pin: int):
         self.pin = Pin(pin, Pin.OUT)
@@ -71,7 +452,7 @@ class AnalogOut:
         self.pin = PWM(Pin(pin), freq=frequency, duty_u16=duty)
     
     def set_duty_percentage(self, value: int):
-        self.pin.duty_u16(int((value/100)*65535))
+        self.pin.duty_u16(int(value * 65535) // 100)
         
     def set_voltage(self, value: int):
         self.pin.duty_u16(int((value/3.3)*65535))
@@ -86,9 +467,10 @@ class RgbLed:
         self.pinB = AnalogOut(pinB, frequency=freq)
     
     def set_duty_percentage(self, value: int):
-        self.pinR.set_duty(int((value/100)*65535))
-        self.pinG.set_duty(int((value/100)*65535))
-        self.pinB.set_duty(int((value/100)*65535))
+        duty = int(value * 65535) // 100
+        self.pinR.set_duty(duty)
+        self.pinG.set_duty(duty)
+        self.pinB.set_duty(duty)
         
     def set_voltage(self, value: int):
         self.pinR.set_duty(int((value/3.3)*65535))
@@ -106,11 +488,168 @@ class RgbLed:
         g = (value >> 8) & 0xFF
         b = value & 0xFF
         
-        self.pinR.set_duty(int((r / 255) * 65535))
-        self.pinG.set_duty(int((g / 255) * 65535))
-        self.pinB.set_duty(int((b / 255) * 65535))
+        # 65535 / 255 = 257: escala de 8 para 16 bits sem float
+        self.pinR.set_duty(r * 257)
+        self.pinG.set_duty(g * 257)
+        self.pinB.set_duty(b * 257)
     
         
+_gamma_tables = {}
+
+
+def gamma_table(gamma: float = 2.2):
+    """Tabela (array('H') de 256 itens) de brilho de 8 bits para duty de 16 bits com correção gama."""
+    table = _gamma_tables.get(gamma)
+    if table is None:
+        table = array('H', [int((level / 255) ** gamma * 65535 + 0.5) for level in range(256)])
+        _gamma_tables[gamma] = table
+    return table
+
+
+# Modos de animação de cada canal do Animator
+_ANIM_IDLE = const(0)
+_ANIM_FADE = const(1)
+_ANIM_BLINK = const(2)
+_ANIM_PULSE = const(3)
+
+
+class Animator:
+    """
+    Anima saídas AnalogOut e RgbLed (fade, pisca e pulsa) a partir de um único timer,
+    com contas inteiras e uma tabela gama pré-calculada. O duty só é escrito quando
+    muda, então uma saída parada não custa nada além do teste do modo.
+    Níveis são de 0 a 255; para um RgbLed, use uma cor 0xRRGGBB.
+
+    Exemplo:
+        anim = Animator()
+        anim.pulse(led, 0x00FF00, period_ms=2000)   # "respira" em verde
+        anim.blink(status, 255, period_ms=500)
+    """
+    def __init__(self, rate_hz: int = 50, channels: int = 16, gamma: float = 2.2):
+        self.rate_hz = rate_hz
+        self._lut = gamma_table(gamma)
+        self._outputs = []
+        self._mode = array('B', [_ANIM_IDLE] * channels)
+        self._low = array('H', [0] * channels)       # nível inicial / apagado
+        self._high = array('H', [0] * channels)      # nível final / aceso
+        self._start = array('i', [0] * channels)     # tick em que a animação começou
+        self._length = array('i', [1] * channels)    # duração ou período, em ticks
+        self._split = array('i', [0] * channels)     # ticks aceso (pisca) ou meio período (pulsa)
+        self._duty = array('i', [-1] * channels)     # último duty escrito
+        self._ticks = 0
+        self._timer = Timer(-1)
+        self._timer.init(freq=rate_hz, callback=self._tick)
+
+    def _ms_to_ticks(self, ms: int) -> int:
+        return max(1, ms * self.rate_hz // 1000)
+
+    def _channels(self, target, level: int):
+        # (índice do canal, nível de 8 bits) de cada saída do alvo
+        if isinstance(target, RgbLed):
+            outputs = ((target.pinR, (level >> 16) & 0xFF),
+                       (target.pinG, (level >> 8) & 0xFF),
+                       (target.pinB, level & 0xFF))
+        else:
+            outputs = ((target, level & 0xFF),)
+        for output, value in outputs:
+            if output not in self._outputs:
+                if len(self._outputs) == len(self._mode):
+                    raise ValueError("Animator sem canais livres: aumente 'channels'")
+                self._outputs.append(output)
+            yield self._outputs.index(output), value
+
+    def _current_level(self, i: int) -> int:
+        # Nível de onde uma nova animação parte (para fades sem saltos)
+        duty = self._duty[i]
+        if duty < 0:
+            return 0
+        lut = self._lut
+        for level in range(256):
+            if lut[level] >= duty:
+                return level
+        return 255
+
+    def _set(self, i: int, mode: int, low: int, high: int, length: int, split: int = 0):
+        # Modo por último: o timer só vê a animação nova quando ela está completa
+        self._mode[i] = _ANIM_IDLE
+        self._low[i] = low
+        self._high[i] = high
+        self._length[i] = length
+        self._split[i] = split
+        self._start[i] = self._ticks
+        self._mode[i] = mode
+        # Primeiro passo já escrito aqui, sem esperar o próximo tick do timer
+        self._write(i, high if mode == _ANIM_BLINK else low)
+
+    def _write(self, i: int, level: int):
+        value = self._lut[level]
+        if value != self._duty[i]:
+            self._outputs[i].set_duty(value)
+            self._duty[i] = value
+
+    def set(self, target, level: int):
+        """Define o nível na hora (com correção gama) e para a animação do alvo."""
+        for i, value in self._channels(target, level):
+            self._mode[i] = _ANIM_IDLE
+            self._write(i, value)
+
+    def fade(self, target, level: int, duration_ms: int):
+        """Vai do nível atual até 'level' em 'duration_ms'."""
+        if duration_ms <= 0:
+            self.set(target, level)
+            return
+        for i, value in self._channels(target, level):
+            self._set(i, _ANIM_FADE, self._current_level(i), value, self._ms_to_ticks(duration_ms))
+
+    def blink(self, target, level: int = 255, period_ms: int = 1000, on_percent: int = 50):
+        """Pisca entre apagado e 'level', aceso por 'on_percent' % do período."""
+        length = self._ms_to_ticks(period_ms)
+        for i, value in self._channels(target, level):
+            self._set(i, _ANIM_BLINK, 0, value, length, max(1, length * on_percent // 100))
+
+    def pulse(self, target, level: int = 255, period_ms: int = 2000):
+        """Acende e apaga suavemente (onda triangular) até 'level'."""
+        length = max(2, self._ms_to_ticks(period_ms))
+        for i, value in self._channels(target, level):
+            self._set(i, _ANIM_PULSE, 0, value, length, length // 2)
+
+    def stop(self, target, level: int = 0):
+        self.set(target, level)
+
+    def deinit(self):
+        self._timer.deinit()
+
+    def _tick(self, timer):
+        self._ticks += 1
+        now = self._ticks
+        lut = self._lut
+        mode, low, high = self._mode, self._low, self._high
+        start, length, split, duty = self._start, self._length, self._split, self._duty
+        for i in range(len(self._outputs)):
+            m = mode[i]
+            if m == _ANIM_IDLE:
+                continue
+            elapsed = now - start[i]
+            if m == _ANIM_FADE:
+                if elapsed >= length[i]:
+                    level = high[i]
+                    mode[i] = _ANIM_IDLE
+                else:
+                    level = low[i] + (high[i] - low[i]) * elapsed // length[i]
+            elif m == _ANIM_BLINK:
+                level = high[i] if elapsed % length[i] < split[i] else low[i]
+            else:
+                phase = elapsed % length[i]
+                if phase > split[i]:
+                    phase = length[i] - phase
+                level = low[i] + (high[i] - low[i]) * phase // split[i]
+
+            value = lut[level]
+            if value != duty[i]:
+                self._outputs[i].set_duty(value)
+                duty[i] = value
+
+
 class AnalogSensor(AnalogIn):
     pass
 class DigitalSensor(DigitalIn):
@@ -1,23 +1,28 @@
 from machine import Pin, reset
 from time import sleep_ms
+from robotkit.componentes.componentes import DigitalIn
 
 BUTTON_PIN = 15
 
-def handle_button_irq(pin):
-    print("#CODE:100") # Código 100 - Representa o reset via botão
-    reset()
+def handle_button_event(level, timestamp):
+    if level == 0:
+        print("#CODE:100") # Código 100 - Representa o reset via botão
+        reset()
 
-button = Pin(BUTTON_PIN, Pin.IN)
+button = DigitalIn(BUTTON_PIN, None)  # Sem pull interno: o circuito do botão tem o próprio resistor
+button.enable_events(debounce_ms=50)
 Pin('LED', Pin.OUT).on()
 
-while button.value() == 0:
-    sleep_ms(50)
-while button.value() == 1:
-    sleep_ms(50)
+# Espera o botão ser pressionado e solto, dormindo entre as interrupções.
+# Os eventos só registram bordas: se já estiver pressionado no boot, espera só soltar
+if button.value == 0:
+    button.wait_for(1)
+button.wait_for(0)
 
 sleep_ms(200)  # Debounce antes de iniciar
 
-button.irq(trigger=Pin.IRQ_FALLING, handler=handle_button_irq)
+button.clear_events()
+button.event_callback = handle_button_event
 
 # Roda o código principal (code.mpy)
 import code
\ No newline at end of file
@@ -0,0 +1,29 @@
+# tests/conftest.py
+# Permite importar a robotkit (micropython-lib/) no PC: os módulos da MicroPython vêm
+# dos stubs em tests/host/ e os tipos do viper viram nomes comuns do Python.
+import builtins
+import sys
+import time
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent / "host"))
+
+# Anotações do viper (ptr32, uint...) são avaliadas quando a função é definida
+for name in ("ptr8", "ptr16", "ptr32", "uint"):
+    setattr(builtins, name, int)
+builtins.const = lambda value: value
+
+# Funções do time que só existem na MicroPython
+time.ticks_ms = lambda: int(time.monotonic() * 1000)
+time.ticks_us = lambda: int(time.monotonic() * 1_000_000)
+time.ticks_diff = lambda a, b: a - b
+time.ticks_add = lambda a, b: a + b
+time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+time.sleep_us = lambda us: time.sleep(us / 1_000_000)
+
+# A placa recebe micropython-lib/ como /robotkit
+robotkit = types.ModuleType("robotkit")
+robotkit.__path__ = [str(ROOT / "micropython-lib")]
+sys.modules.setdefault("robotkit", robotkit)
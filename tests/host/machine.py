@@ -0,0 +1,88 @@
+# Stub do módulo machine da MicroPython, só o necessário para importar a robotkit no PC.
+# Nenhum periférico funciona de verdade: os testes do host exercitam apenas a lógica.
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, *args, **kwargs):
+        self.id = id
+        self._value = 0
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+
+    def irq(self, *args, **kwargs):
+        pass
+
+
+class PWM:
+    def __init__(self, pin, *args, **kwargs):
+        self._duty = 0
+
+    def freq(self, value=None):
+        pass
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        self._duty = value
+
+    def deinit(self):
+        pass
+
+
+class ADC:
+    def __init__(self, pin):
+        self.pin = pin
+        # Valor devolvido pelo read_u16(), definido pelo teste
+        self.value = 0
+
+    def read_u16(self):
+        return self.value
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def deinit(self):
+        pass
+
+
+class _Memory(dict):
+    # Registradores nunca escritos leem 0
+    def __missing__(self, address):
+        return 0
+
+
+mem32 = _Memory()
+
+
+def freq():
+    return 125_000_000
+
+
+def disable_irq():
+    return 0
+
+
+def enable_irq(state):
+    pass
+
+
+def idle():
+    pass
@@ -0,0 +1,23 @@
+# Stub do módulo micropython: no PC o código viper/native roda como Python comum.
+# Os inteiros do Python não estouram, então o estado em array('i') acusa (OverflowError)
+# qualquer valor que não caberia nos 32 bits do viper.
+
+
+def const(value):
+    return value
+
+
+def native(function):
+    return function
+
+
+def viper(function):
+    return function
+
+
+def schedule(function, arg):
+    function(arg)
+
+
+def alloc_emergency_exception_buf(size):
+    pass
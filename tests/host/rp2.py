@@ -0,0 +1,53 @@
+# Stub do módulo rp2: os programas PIO não são montados no PC.
+
+
+class PIO:
+    IN_LOW = 0
+    IN_HIGH = 1
+    OUT_LOW = 0
+    OUT_HIGH = 1
+    SHIFT_LEFT = 0
+    SHIFT_RIGHT = 1
+    JOIN_NONE = 0
+    JOIN_TX = 1
+    JOIN_RX = 2
+
+    def __init__(self, id):
+        self.id = id
+
+    def add_program(self, program):
+        pass
+
+    def remove_program(self, program=None):
+        pass
+
+
+def asm_pio(**kwargs):
+    return lambda program: program
+
+
+class StateMachine:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def active(self, value=None):
+        pass
+
+    def exec(self, instruction):
+        pass
+
+    def rx_fifo(self):
+        return 0
+
+    def get(self, *args):
+        return 0
+
+    def put(self, *args):
+        pass
+
+
+class DMA:
+    pass
@@ -0,0 +1,5 @@
+# Stub do módulo uctypes: endereços não fazem sentido no PC.
+
+
+def addressof(obj):
+    return 0
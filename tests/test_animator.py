@@ -0,0 +1,38 @@
+# tests/test_animator.py
+# O Animator escreve o primeiro passo de cada animação na hora: set() e fade(..., 0)
+# não podem esperar o próximo tick do timer.
+from robotkit.componentes.componentes import AnalogOut, Animator, RgbLed
+
+
+def test_set_writes_level_synchronously():
+    anim = Animator()
+    led = AnalogOut(15)
+    anim.set(led, 255)
+    assert led.pin.duty_u16() == 65535
+    anim.set(led, 0)
+    assert led.pin.duty_u16() == 0
+
+
+def test_set_stops_running_animation():
+    anim = Animator()
+    led = AnalogOut(15)
+    anim.pulse(led, 255, period_ms=1000)
+    anim.set(led, 128)
+    duty = led.pin.duty_u16()
+    for _ in range(10):
+        anim._tick(None)
+    assert led.pin.duty_u16() == duty == anim._lut[128]
+
+
+def test_zero_length_fade_writes_final_color():
+    anim = Animator()
+    led = RgbLed(10, 11, 12)
+    anim.fade(led, 0xFF0000, 0)
+    assert (led.pinR.pin.duty_u16(), led.pinG.pin.duty_u16(), led.pinB.pin.duty_u16()) == (65535, 0, 0)
+
+
+def test_blink_starts_lit():
+    anim = Animator()
+    led = AnalogOut(15)
+    anim.blink(led, 255, period_ms=1000)
+    assert led.pin.duty_u16() == 65535
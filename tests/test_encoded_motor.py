@@ -0,0 +1,26 @@
+# tests/test_encoded_motor.py
+import pytest
+
+from robotkit.Motor.motor import ControlScheduler, EncodedMotor, Motor, _Encoder
+
+
+@pytest.fixture(autouse=True)
+def free_state_machines():
+    yield
+    _Encoder._claimed.clear()
+    _Encoder._speed_claimed.clear()
+
+
+@pytest.mark.parametrize("rate_hz", (30, 75, 1010))
+def test_rejects_scheduler_rate_not_multiple_of_50(rate_hz):
+    with pytest.raises(ValueError):
+        EncodedMotor(Motor(6, 7), 0, 2, 3, scheduler=ControlScheduler(rate_hz))
+    assert not _Encoder._claimed
+
+
+@pytest.mark.parametrize("rate_hz, divider", ((50, 1), (200, 4), (1000, 20)))
+def test_control_runs_at_50_hz(rate_hz, divider):
+    scheduler = ControlScheduler(rate_hz)
+    motor = EncodedMotor(Motor(6, 7), 0, 2, 3, scheduler=scheduler)
+    assert motor._divider == divider
+    scheduler.stop()
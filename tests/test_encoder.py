@@ -0,0 +1,64 @@
+# tests/test_encoder.py
+# A leitura dos encoders descarta os valores antigos da FIFO e espera um novo por poucas
+# tentativas: com a state machine parada ela não pode travar, e um valor publicado
+# durante a espera tem que ser o usado.
+import pytest
+
+from robotkit.Motor.motor import EncoderGroup, EncoderSnapshot, _Encoder
+
+
+class FakeStateMachine:
+    """FIFO de leitura: 'fifo' já está nela, 'pending' chega um valor a cada rx_fifo()."""
+
+    def __init__(self, fifo=(), pending=()):
+        self.fifo = list(fifo)
+        self.pending = list(pending)
+
+    def rx_fifo(self):
+        count = len(self.fifo)
+        if self.pending:
+            self.fifo.append(self.pending.pop(0))
+        return count
+
+    def get(self, buffer):
+        if not self.fifo:
+            raise AssertionError("sm.get() com a FIFO vazia bloquearia")
+        buffer[0] = self.fifo.pop(0)
+
+    def active(self, value=None):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def free_state_machines():
+    yield
+    _Encoder._claimed.clear()
+    _Encoder._speed_claimed.clear()
+
+
+def test_position_uses_value_published_after_drain():
+    encoder = _Encoder(0, 2, 3)
+    encoder.sm = FakeStateMachine(fifo=(10, 11, 12, 13), pending=(14,))
+    assert encoder.get_position_counts() == 14
+
+
+def test_position_keeps_last_value_when_state_machine_is_stopped():
+    encoder = _Encoder(0, 2, 3)
+    encoder.sm = FakeStateMachine(fifo=(7,))
+    assert encoder.get_position_counts() == 7
+    assert encoder.get_position_counts() == 7
+
+
+def test_group_reads_fresh_values_without_blocking():
+    group = EncoderGroup(((2, 3), (4, 5)))
+    fresh = FakeStateMachine(fifo=(1, 2), pending=(3, 5))
+    stopped = FakeStateMachine(fifo=(-4,))
+    group._slots = [(fresh, group._slots[0][1]), (stopped, group._slots[1][1])]
+    assert list(group.read_counts()) == [3, -4]
+    assert list(group.read_counts()) == [5, -4]
+
+
+@pytest.mark.parametrize("rate_hz", (0, -1000, 125_000_001))
+def test_snapshot_rejects_rate_outside_cpu_frequency(rate_hz):
+    with pytest.raises(ValueError):
+        EncoderSnapshot([], rate_hz=rate_hz)
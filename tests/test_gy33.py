@@ -0,0 +1,52 @@
+# tests/test_gy33.py
+# calibrate_white()/calibrate_black() só mudam a calibração em memória: a flash é
+# escrita apenas por save_calibration(), e só quando os dados mudaram.
+import pytest
+
+from robotkit.Calibration import calibration
+from robotkit.Sensores.gy33 import GY33
+
+
+class FakeI2C:
+    def __init__(self):
+        self.raw = (0, 0, 0, 0)
+
+    def readfrom_mem_into(self, addr, register, buf):
+        for i, value in enumerate(self.raw[:len(buf) // 2]):
+            buf[2 * i] = value >> 8
+            buf[2 * i + 1] = value & 0xFF
+
+
+@pytest.fixture
+def calibration_file(tmp_path, monkeypatch):
+    # Arquivo temporário no lugar do /calibration.bin; registra cada gravação
+    path = str(tmp_path / "calibration.bin")
+    writes = []
+    load, save, write_all = calibration.load, calibration.save, calibration.write_all
+
+    def record(entries, path=path):
+        writes.append(dict(entries))
+        write_all(entries, path)
+
+    monkeypatch.setattr(calibration, "write_all", record)
+    monkeypatch.setattr(calibration, "load", lambda key: load(key, path))
+    monkeypatch.setattr(calibration, "save", lambda key, data: save(key, data, path))
+    return writes
+
+
+def test_calibrate_does_not_write_flash(calibration_file):
+    i2c = FakeI2C()
+    sensor = GY33(i2c, calibration_key="gy33")
+    for raw in ((100, 200, 300, 400), (110, 210, 310, 410)):
+        i2c.raw = raw
+        sensor.calibrate_black()
+    i2c.raw = (1500, 2500, 2200, 6000)
+    sensor.calibrate_white()
+    assert calibration_file == []
+
+    sensor.save_calibration()
+    sensor.save_calibration()
+    assert len(calibration_file) == 1
+
+    loaded = GY33(i2c, calibration_key="gy33")
+    assert loaded.cal == [[110, 1500], [210, 2500], [310, 2200], [410, 6000]]
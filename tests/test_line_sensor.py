@@ -0,0 +1,36 @@
+# tests/test_line_sensor.py
+from robotkit.componentes.componentes import LineSensorArray
+
+
+def set_raw(line, *raw):
+    for sensor, value in zip(line.sensors, raw):
+        sensor.pin.value = value
+
+
+def test_position_follows_the_line():
+    line = LineSensorArray((26, 27, 28))
+    for raw in ((1000, 1000, 1000), (60000, 60000, 60000)):
+        set_raw(line, *raw)
+        line.calibrate()
+    set_raw(line, 1000, 60000, 1000)
+    assert line.read_position() == line.center
+    assert not line.line_lost
+
+
+def test_no_reading_above_zero_counts_as_line_lost():
+    # Com threshold=0 e todos os sensores no fundo, total == 0
+    line = LineSensorArray((26, 27, 28), threshold=0)
+    for raw in ((1000, 1000, 1000), (60000, 60000, 60000)):
+        set_raw(line, *raw)
+        line.calibrate()
+    set_raw(line, 60000, 1000, 1000)
+    line.read_position()
+    set_raw(line, 1000, 1000, 1000)
+    assert line.read_position() == 0
+    assert line.line_lost
+
+
+def test_uncalibrated_sensors_do_not_divide_by_zero():
+    line = LineSensorArray((26, 27), threshold=0)
+    assert line.read_position() == 2 * line.center
+    assert line.line_lost
@@ -0,0 +1,38 @@
+# tests/test_motor_group.py
+# O MotorGroup só escreve os slices cujo duty mudou. Uma escrita direta em um Motor do
+# grupo (set_effort, brake, coast) muda os registradores por fora, então a próxima
+# escrita do grupo nesse slice não pode ser pulada.
+import pytest
+
+from robotkit.Motor import motor
+from robotkit.Motor.motor import Motor, MotorGroup
+
+
+@pytest.fixture
+def registers(monkeypatch):
+    # Os CC de cada slice: o viper escreveria direto no endereço
+    cc = {}
+    monkeypatch.setattr(motor, "_pwm_read_cc", lambda addr, channel: (cc.get(addr, 0) >> (channel << 4)) & 0xffff)
+    monkeypatch.setattr(motor, "_pwm_write_cc", lambda addr, a, b: cc.__setitem__(addr, a | (b << 16)))
+    return cc
+
+
+def test_group_rewrites_slice_after_direct_motor_write(registers):
+    left, right = Motor(6, 7), Motor(8, 9)
+    group = MotorGroup((left, right))
+    group.set_efforts((0.5, 0.5))
+    written = dict(registers)
+
+    # Escrita direta, como a do EncodedMotor.brake(): o registrador real muda
+    left.brake()
+    registers.clear()
+    group.set_efforts((0.5, 0.5))
+    assert registers == {group._cc_addr[0]: written[group._cc_addr[0]]}
+
+
+def test_group_skips_unchanged_slices(registers):
+    group = MotorGroup((Motor(6, 7), Motor(8, 9)))
+    group.set_efforts((0.5, -0.5))
+    registers.clear()
+    group.set_efforts((0.5, -0.5))
+    assert registers == {}
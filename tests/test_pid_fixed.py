@@ -0,0 +1,83 @@
+# tests/test_pid_fixed.py
+# O PIDFixed (ponto fixo) tem que acompanhar o PID (float): a mesma sequência de erros
+# passa pelos dois, com um relógio falso no passo fixo. A diferença das saídas não pode
+# passar do erro de quantização Q16: metade do último bit de cada ganho multiplicada pelo
+# seu termo, mais 2 LSB do truncamento do >> 8 e da saída. Com max_derivative, a diferença
+# do passo anterior pode ser carregada, meio LSB a cada passo.
+# Execute com: python -m pytest tests
+import random
+
+import pytest
+
+from robotkit.Motor import motor
+from robotkit.Motor.motor import PID, PIDFixed
+
+TIMESTEP_MS = 10   # O PID usa 0.01 s no primeiro update, então o passo fixo é o mesmo
+STEPS = 2000
+Q16 = 1 / 65536
+
+# kp, ki, kd, max_output, max_integral, max_derivative
+CONFIGS = (
+    (0.035, 0.03, 0.0, 1.0, 50, None),
+    (0.002, 0.5, 0.0001, 1.0, 0.5, None),
+    (0.01, 0.2, 0.00005, 0.6, 2, 20),
+    (0.0005, 0.0, 0.0002, 1.0, None, None),
+)
+
+
+class FakeClock:
+    # Substitui o módulo time dentro do motor.py: o PID lê o tempo só pelo ticks_ms()
+    def __init__(self):
+        self.now = 0
+
+    def ticks_ms(self):
+        return self.now
+
+    def ticks_diff(self, a, b):
+        return a - b
+
+
+@pytest.mark.parametrize("kp, ki, kd, max_output, max_integral, max_derivative", CONFIGS)
+def test_pid_fixed_matches_pid(monkeypatch, kp, ki, kd, max_output, max_integral, max_derivative):
+    clock = FakeClock()
+    monkeypatch.setattr(motor, "time", clock)
+    reference = PID(kp, ki, kd, 0.0, max_output, max_derivative, max_integral, tolerance=1)
+    fixed = PIDFixed(TIMESTEP_MS / 1000, kp, ki, kd, 0.0, max_output, max_derivative, max_integral, tolerance=1)
+    dt = TIMESTEP_MS / 1000
+
+    # Erro de arredondamento de cada ganho em ponto fixo (metade do último bit)
+    kp_q = 0.5 * Q16
+    ki_q = 0.5 / (1 << 24)
+    kd_q = 0.5 * Q16
+    delta_q = 0 if max_derivative is None else 0.5 * Q16
+
+    rng = random.Random(1)
+    error_sum = 0
+    prev_error = 0
+    bound = 0.0
+    for step in range(STEPS):
+        # Degraus e ruído, com erros inteiros como os do encoder
+        error = rng.randint(-300, 300) if step % 200 < 100 else rng.randint(-5, 5)
+        clock.now += TIMESTEP_MS
+        expected = reference.update(error)
+        got = fixed.update(error) / 65536
+
+        error_sum += error
+        if max_integral is not None:
+            limit = int(max_integral / dt)
+            error_sum = max(-limit, min(limit, error_sum))
+        step_bound = (kp_q * abs(error) + ki_q * abs(error_sum) + kd_q * abs(error - prev_error)
+                      + 2 * Q16 + 1e-6)
+        prev_error = error
+        bound = step_bound if max_derivative is None else max(step_bound, bound + delta_q)
+
+        assert abs(expected - got) <= bound, \
+            f"passo {step}: PID {expected} x PIDFixed {got} (limite {bound})"
+        assert reference.is_done() == fixed.is_done(), f"passo {step}: is_done() diferente"
+
+
+def test_pid_fixed_output_is_bounded():
+    # Erros enormes não podem estourar os 32 bits do viper (o array('i') acusaria)
+    fixed = PIDFixed(0.001, kp=2.0, ki=50.0, kd=0.5, max_output=1.0)
+    for error in (1 << 30, -(1 << 30), 0, (1 << 30) - 1):
+        assert abs(fixed.update(error)) <= PIDFixed.ONE